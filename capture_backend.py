@@ -0,0 +1,225 @@
+"""
+Capture Backend - Persistente Screenshot-Session mit wiederverwendbaren Frame-Buffern
+
+Ersetzt das "mss.mss() pro Scan"-Muster aus utils.capture_region:
+- Ein mss-Grabber pro Thread (mss/GDI-Handles sind nicht thread-safe);
+  Grabber beendeter Threads werden beim nächsten neuen Grabber geschlossen
+- Preallokierter Ring aus Frame-Buffern (keine MB-Allokation pro Scan)
+- BGR- oder Grayscale-Ausgabe direkt aus den rohen BGRA-Bytes
+- Timing pro Grab (grab/convert getrennt) für das PERF-Logging
+
+WICHTIG: Ein zurückgegebener Frame gehört dem Ring und wird nach
+``ring_size`` weiteren Grabs überschrieben. Wer einen Frame länger halten
+muss (z.B. Debug-Tools), nutzt ``grab(..., copy=True)``. OCR-Worker, die
+einen Frame beliebig lange verarbeiten, reservieren ihn per ``lease``/``release``
+- reservierte Buffer werden beim Rotieren übersprungen. Die Reservierung gilt dem
+Ring-Buffer selbst (auch über Views wie ``frame[y0:y1]``); Kopien brauchen keine.
+Sind alle Buffer reserviert, wächst der Ring bis ``max_ring_size``, danach liefert
+``grab`` ungepoolte Frames.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+import cv2
+import mss
+import numpy as np
+
+from config import CAPTURE_RING_SIZE, CAPTURE_RING_MAX_SIZE, CAPTURE_GRAYSCALE
+
+
+class CaptureBackend:
+    """Persistent screen grabber that writes into a preallocated buffer ring."""
+
+    def __init__(self, ring_size: int = CAPTURE_RING_SIZE, grayscale: bool = CAPTURE_GRAYSCALE,
+                 timing_window: int = 120, max_shapes: int = 4,
+                 max_ring_size: int = CAPTURE_RING_MAX_SIZE) -> None:
+        self.ring_size = max(1, int(ring_size))
+        self.max_ring_size = max(self.ring_size, int(max_ring_size))
+        self.max_shapes = max(1, int(max_shapes))
+        self.grayscale = bool(grayscale)
+        self._local = threading.local()
+        # owning thread -> mss grabber
+        self._grabbers: dict = {}
+        self._grabbers_lock = threading.Lock()
+        self._ring_lock = threading.Lock()
+        # {(height, width, channels): [buffer, ...]} - lazily allocated per shape
+        self._rings: dict[tuple[int, int, int], list] = {}
+        self._ring_pos: dict[tuple[int, int, int], int] = {}
+        # (shape key, ring index) -> lease count (buffers held by OCR workers)
+        self._leased: dict[tuple, int] = {}
+        self._timings: deque = deque(maxlen=max(1, int(timing_window)))
+        self.frames_captured = 0
+        self.unpooled_frames = 0
+        self.last_timing: dict[str, float] = {}
+
+    # -----------------------
+    # Grabber / Buffer management
+    # -----------------------
+    def _get_grabber(self):
+        sct = getattr(self._local, "sct", None)
+        if sct is None:
+            sct = mss.mss()
+            self._local.sct = sct
+            with self._grabbers_lock:
+                # Kurzlebige Capture-Threads → deren Grabber nicht ewig festhalten
+                dead = [thread for thread in self._grabbers if not thread.is_alive()]
+                stale = [self._grabbers.pop(thread) for thread in dead]
+                self._grabbers[threading.current_thread()] = sct
+            self._close_grabbers(stale)
+        return sct
+
+    @staticmethod
+    def _close_grabbers(grabbers) -> None:
+        for sct in grabbers:
+            try:
+                sct.close()
+            except Exception:
+                pass
+
+    def _next_buffer(self, height: int, width: int, channels: int):
+        key = (height, width, channels)
+        with self._ring_lock:
+            ring = self._rings.get(key)
+            if ring is None:
+                # Region changed (or first grab). Multi-Region-Capture nutzt mehrere
+                # Shapes gleichzeitig → nur die älteste Shape verwerfen
+                while len(self._rings) >= self.max_shapes:
+                    oldest = next(iter(self._rings))
+                    self._rings.pop(oldest)
+                    self._ring_pos.pop(oldest, None)
+                    # Verworfene Buffer werden nie mehr überschrieben → Leases hinfällig
+                    for lease_key in [k for k in self._leased if k[0] == oldest]:
+                        del self._leased[lease_key]
+                shape = (height, width) if channels == 1 else (height, width, channels)
+                ring = [np.empty(shape, dtype=np.uint8) for _ in range(self.ring_size)]
+                self._rings[key] = ring
+                self._ring_pos[key] = 0
+            pos = self._ring_pos[key]
+            for _ in range(len(ring)):
+                idx = pos
+                pos = (pos + 1) % len(ring)
+                if (key, idx) not in self._leased:
+                    self._ring_pos[key] = pos
+                    return ring[idx]
+            buf = np.empty(ring[0].shape, dtype=np.uint8)
+            if len(ring) < self.max_ring_size:
+                # Alle Buffer reserviert → Ring wachsen lassen statt fremde Frames zu überschreiben
+                ring.append(buf)
+                self._ring_pos[key] = 0
+            else:
+                # Obergrenze erreicht (vermutlich fehlendes release) → ungepoolter Frame
+                if not self.unpooled_frames:
+                    print(f"⚠️  Capture ring full ({len(ring)} leased buffers) - allocating unpooled frames")
+                self.unpooled_frames += 1
+            return buf
+
+    def _lease_key(self, frame):
+        """(shape key, ring index) of the buffer behind ``frame`` (views too); None if not pooled."""
+        root = frame
+        while isinstance(getattr(root, "base", None), np.ndarray):
+            root = root.base
+        for key, ring in self._rings.items():
+            for idx, buf in enumerate(ring):
+                if buf is root:
+                    return key, idx
+        return None
+
+    # -----------------------
+    # Public API
+    # -----------------------
+    def grab(self, region, grayscale: Optional[bool] = None, copy: bool = False):
+        """Capture ``region`` (x1, y1, x2, y2) as BGR (default) or grayscale uint8 array."""
+        x1, y1, x2, y2 = region
+        w, h = x2 - x1, y2 - y1
+        use_gray = self.grayscale if grayscale is None else bool(grayscale)
+
+        start = time.perf_counter()
+        sct = self._get_grabber()
+        sct_img = sct.grab({"left": x1, "top": y1, "width": w, "height": h})
+        grabbed = time.perf_counter()
+
+        # Zero-copy view of the raw BGRA bytes delivered by mss
+        raw = np.frombuffer(sct_img.raw, dtype=np.uint8).reshape(sct_img.height, sct_img.width, 4)
+        if use_gray:
+            out = self._next_buffer(sct_img.height, sct_img.width, 1)
+            cv2.cvtColor(raw, cv2.COLOR_BGRA2GRAY, dst=out)
+        else:
+            out = self._next_buffer(sct_img.height, sct_img.width, 3)
+            cv2.cvtColor(raw, cv2.COLOR_BGRA2BGR, dst=out)
+        if copy:
+            out = out.copy()
+        done = time.perf_counter()
+
+        timing = {
+            "grab_ms": (grabbed - start) * 1000,
+            "convert_ms": (done - grabbed) * 1000,
+            "total_ms": (done - start) * 1000,
+        }
+        self.last_timing = timing
+        self._timings.append(timing)
+        self.frames_captured += 1
+        return out
+
+    def lease(self, frame) -> None:
+        """Keep ``frame``'s ring buffer out of rotation until ``release`` is called."""
+        with self._ring_lock:
+            key = self._lease_key(frame)
+            if key is not None:
+                self._leased[key] = self._leased.get(key, 0) + 1
+
+    def release(self, frame) -> None:
+        """Return a leased buffer to the ring rotation."""
+        with self._ring_lock:
+            key = self._lease_key(frame)
+            if key is None:
+                return
+            count = self._leased.get(key, 0) - 1
+            if count > 0:
+                self._leased[key] = count
+            else:
+                self._leased.pop(key, None)
+
+    def get_stats(self) -> dict:
+        """Return rolling capture timing statistics for monitoring/debugging."""
+        timings = list(self._timings)
+        if not timings:
+            return {"frames": self.frames_captured, "avg_grab_ms": 0.0, "avg_convert_ms": 0.0,
+                    "avg_total_ms": 0.0, "max_total_ms": 0.0, "ring_size": self.ring_size,
+                    "unpooled_frames": self.unpooled_frames}
+        n = len(timings)
+        return {
+            "frames": self.frames_captured,
+            "avg_grab_ms": sum(t["grab_ms"] for t in timings) / n,
+            "avg_convert_ms": sum(t["convert_ms"] for t in timings) / n,
+            "avg_total_ms": sum(t["total_ms"] for t in timings) / n,
+            "max_total_ms": max(t["total_ms"] for t in timings),
+            "ring_size": self.ring_size,
+            "unpooled_frames": self.unpooled_frames,
+        }
+
+    def close(self) -> None:
+        """Close all grabbers (best effort) and release the buffer ring."""
+        with self._grabbers_lock:
+            grabbers, self._grabbers = list(self._grabbers.values()), {}
+        self._close_grabbers(grabbers)
+        self._local = threading.local()
+        with self._ring_lock:
+            self._rings.clear()
+            self._ring_pos.clear()
+            self._leased.clear()
+
+
+_default_backend: Optional[CaptureBackend] = None
+_default_backend_lock = threading.Lock()
+
+
+def get_default_backend() -> CaptureBackend:
+    """Shared backend used by the module-level ``utils.capture_region`` helper."""
+    global _default_backend
+    with _default_backend_lock:
+        if _default_backend is None:
+            _default_backend = CaptureBackend()
+        return _default_backend
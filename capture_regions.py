@@ -0,0 +1,182 @@
+"""
+Capture Regions - Benannte Teilbereiche des Marktfensters mit eigener Scan-Rate
+
+Statt bei jedem Scan das komplette Marktfenster zu greifen und zu erkennen,
+wird es in Teilbereiche zerlegt (config.CAPTURE_SUBREGIONS):
+
+- notifications: schmales Band oben (neue Transaktionen) → Burst-Takt
+- window: Item-Liste/Metriken (Orders, Orders Completed, Collect) → langsam
+
+Pro Scan werden nur die fälligen Bereiche gegriffen und per OCR erkannt. Der
+zuletzt erkannte Text JEDES Bereichs bleibt gespeichert und wird in
+Konfigurations-Reihenfolge zum Eingabetext für ``process_ocr_text``
+zusammengesetzt - der Parser sieht weiterhin das ganze Fenster.
+
+Boxen sind relativ zur Capture-Region (0.0-1.0) und überleben so
+Änderungen der Region im GUI. Innere Kanten (nicht am Fensterrand) werden um
+``snap`` (Anteil der Fensterhöhe) größer gegriffen und danach auf die nächste
+Zeilenlücke (Textbänder aus ``segment_text_bands``) zugeschnitten: eine Zeile
+gehört dem Bereich, in dem ihre Mitte liegt - keine halben Zeilen im Text.
+"""
+
+import threading
+import time
+from typing import Iterable, List, Optional, Tuple
+
+import cv2
+
+from line_band_ocr import segment_text_bands
+
+
+def snap_edge(bands: List[Tuple[int, int]], nominal: int) -> int:
+    """Move ``nominal`` out of a text band it cuts: above the band if the band's center is below, else under it."""
+    for y0, y1 in bands:
+        if y0 < nominal < y1:
+            return y1 if (y0 + y1) / 2 < nominal else y0
+    return nominal
+
+
+class CaptureSubRegion:
+    """One named sub-region with its own capture interval and OCR settings."""
+
+    __slots__ = ("name", "box", "interval", "burst_interval", "adaptive", "fast_mode", "snap")
+
+    def __init__(self, name: str, box, interval: float, burst_interval: Optional[float] = None,
+                 adaptive: bool = True, fast_mode: bool = True, snap: float = 0.0) -> None:
+        x0, y0, x1, y1 = (float(v) for v in box)
+        if not (0.0 <= x0 < x1 <= 1.0 and 0.0 <= y0 < y1 <= 1.0):
+            raise ValueError(f"invalid relative box for region '{name}': {box}")
+        self.name = name
+        self.box = (x0, y0, x1, y1)
+        self.interval = max(0.0, float(interval))
+        self.burst_interval = self.interval if burst_interval is None else max(0.0, float(burst_interval))
+        self.adaptive = bool(adaptive)
+        self.fast_mode = bool(fast_mode)
+        self.snap = max(0.0, float(snap))
+
+    @classmethod
+    def from_dict(cls, entry: dict) -> "CaptureSubRegion":
+        return cls(
+            name=entry['name'],
+            box=entry['box'],
+            interval=entry.get('interval', 0.5),
+            burst_interval=entry.get('burst_interval'),
+            adaptive=entry.get('adaptive', True),
+            fast_mode=entry.get('fast_mode', True),
+            snap=entry.get('snap', 0.0),
+        )
+
+    def absolute(self, region) -> tuple[int, int, int, int]:
+        """Map the relative box onto an absolute capture region (x1, y1, x2, y2)."""
+        rx1, ry1, rx2, ry2 = region
+        w, h = rx2 - rx1, ry2 - ry1
+        x0, y0, x1, y1 = self.box
+        ax1, ay1 = rx1 + int(round(x0 * w)), ry1 + int(round(y0 * h))
+        ax2, ay2 = rx1 + int(round(x1 * w)), ry1 + int(round(y1 * h))
+        return ax1, ay1, max(ax1 + 1, ax2), max(ay1 + 1, ay2)
+
+    def capture_box(self, region) -> tuple[tuple[int, int, int, int], tuple[Optional[int], Optional[int]]]:
+        """Grab box grown by ``snap`` at inner edges + nominal (top, bottom) rows inside it (None = not snapped)."""
+        ax1, ay1, ax2, ay2 = self.absolute(region)
+        if self.snap <= 0:
+            return (ax1, ay1, ax2, ay2), (None, None)
+        _rx1, ry1, _rx2, ry2 = region
+        pad = int(round(self.snap * (ry2 - ry1)))
+        gy1 = max(ry1, ay1 - pad) if self.box[1] > 0.0 else ay1
+        gy2 = min(ry2, ay2 + pad) if self.box[3] < 1.0 else ay2
+        top = ay1 - gy1 if gy1 < ay1 else None
+        bottom = ay2 - gy1 if gy2 > ay2 else None
+        return (ax1, gy1, ax2, gy2), (top, bottom)
+
+    @staticmethod
+    def crop_to_rows(frame, edges: tuple[Optional[int], Optional[int]]):
+        """Cut a ``capture_box`` grab at the row gaps closest to its nominal edges."""
+        top, bottom = edges
+        if top is None and bottom is None:
+            return frame
+        gray = frame
+        if frame.ndim == 3:
+            gray = cv2.cvtColor(frame, cv2.COLOR_BGRA2GRAY if frame.shape[2] == 4 else cv2.COLOR_BGR2GRAY)
+        bands = segment_text_bands(gray)
+        y0 = snap_edge(bands, top) if top is not None else 0
+        y1 = snap_edge(bands, bottom) if bottom is not None else frame.shape[0]
+        if y1 <= y0:
+            y0, y1 = top or 0, bottom or frame.shape[0]
+        # Kopie: der Grab liegt im Capture-Ring (Lease gilt dem ganzen Buffer, nicht dem View)
+        return frame[y0:y1].copy()
+
+    def area_fraction(self) -> float:
+        x0, y0, x1, y1 = self.box
+        return (x1 - x0) * (y1 - y0)
+
+
+class MultiRegionScanner:
+    """Track per-region due times and the last recognized text of every region."""
+
+    def __init__(self, regions: Iterable[CaptureSubRegion]) -> None:
+        self.regions = list(regions)
+        names = [r.name for r in self.regions]
+        if not names or len(set(names)) != len(names):
+            raise ValueError(f"capture sub-regions need unique names: {names}")
+        self._by_name = {r.name: r for r in self.regions}
+        self._lock = threading.Lock()
+        self.reset()
+
+    @classmethod
+    def from_config(cls, entries: Iterable[dict]) -> "MultiRegionScanner":
+        return cls(CaptureSubRegion.from_dict(e) for e in entries)
+
+    def reset(self) -> None:
+        """Forget texts and timestamps (next call to ``due`` returns every region)."""
+        with self._lock:
+            self._last_capture: dict[str, float] = {}
+            self._texts: dict[str, str] = {}
+            self.captures = {r.name: 0 for r in self.regions}
+            self.ocr_runs = {r.name: 0 for r in self.regions}
+            self.scans = 0
+            self._area_captured = 0.0
+
+    def get(self, name: str) -> CaptureSubRegion:
+        return self._by_name[name]
+
+    def due(self, now: Optional[float] = None, burst: bool = False) -> list[CaptureSubRegion]:
+        """Regions whose (burst) interval elapsed since their last capture."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            result = []
+            for region in self.regions:
+                last = self._last_capture.get(region.name)
+                interval = region.burst_interval if burst else region.interval
+                if last is None or now - last >= interval:
+                    result.append(region)
+            return result
+
+    def mark_captured(self, names: Iterable[str], now: Optional[float] = None) -> None:
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            self.scans += 1
+            for name in names:
+                self._last_capture[name] = now
+                self.captures[name] += 1
+                self._area_captured += self._by_name[name].area_fraction()
+
+    def update_text(self, name: str, text: str) -> None:
+        with self._lock:
+            self._texts[name] = text or ""
+            self.ocr_runs[name] += 1
+
+    def merged_text(self) -> str:
+        """Latest text of all regions in configuration order (input for process_ocr_text)."""
+        with self._lock:
+            parts = [self._texts.get(r.name, "") for r in self.regions]
+        return " ".join(p for p in parts if p)
+
+    def get_stats(self) -> dict:
+        """Per-region capture/OCR counters and average captured area per scan (fraction of the window)."""
+        with self._lock:
+            return {
+                'scans': self.scans,
+                'captures': dict(self.captures),
+                'ocr_runs': dict(self.ocr_runs),
+                'avg_area_per_scan': (self._area_captured / self.scans) if self.scans else 0.0,
+            }
@@ -0,0 +1,184 @@
+"""
+Change Gate - Billige Änderungserkennung vor ocr_image_cached
+
+Jeder Scan wird vor Preprocessing/OCR gegen den zuletzt verarbeiteten Frame
+geprüft (auf einem verkleinerten Graustufen-Thumbnail der ROI):
+
+1. Fingerprint (quantisiertes Thumbnail → CRC32): identisch → Skip
+2. Schwellwert-Diff pro Kachel (``tile`` × ``tile`` Thumbnail-Pixel, etwa eine
+   Log-Zeile hoch): Anteil geänderter Pixel in der am stärksten geänderten
+   Kachel < Minimum → Skip (Cursor-Blinken, einzelne Pixel). Ein globaler Anteil
+   würde eine geänderte Ziffer (Orders Completed, Collect, Preis) in einer
+   großen ROI wegmitteln - lokal reicht eine einzige geänderte Zeile.
+3. Schärfe (Laplace-Varianz): deutlich unschärfer als Referenz → Reject
+   (Fenster-Übergänge/Fades; nach N Rejects in Folge wird trotzdem akzeptiert)
+
+Nur akzeptierte Frames werden zur neuen Referenz. Alle Schwellwerte sind über
+config.py bzw. den Konstruktor einstellbar; Zähler via ``get_stats()``.
+"""
+
+import threading
+import time
+import zlib
+from typing import Optional
+
+import cv2
+import numpy as np
+
+from config import (
+    CHANGE_GATE_DOWNSCALE,
+    CHANGE_GATE_PIXEL_DELTA,
+    CHANGE_GATE_MIN_CHANGED_RATIO,
+    CHANGE_GATE_TILE,
+    CHANGE_GATE_BLUR_RATIO,
+    CHANGE_GATE_MAX_BLUR_REJECTS,
+    CHANGE_GATE_MAX_SKIP_SECONDS,
+)
+
+ACCEPT_FIRST = "first"
+ACCEPT_CHANGED = "changed"
+ACCEPT_FORCED = "forced"
+SKIP_IDENTICAL = "identical"
+SKIP_BELOW_THRESHOLD = "below_threshold"
+REJECT_BLURRED = "blurred"
+
+
+class ChangeGate:
+    """Decide whether a frame's text-bearing content changed enough to run OCR."""
+
+    def __init__(self,
+                 downscale: int = CHANGE_GATE_DOWNSCALE,
+                 pixel_delta: int = CHANGE_GATE_PIXEL_DELTA,
+                 min_changed_ratio: float = CHANGE_GATE_MIN_CHANGED_RATIO,
+                 tile: int = CHANGE_GATE_TILE,
+                 blur_ratio: float = CHANGE_GATE_BLUR_RATIO,
+                 max_blur_rejects: int = CHANGE_GATE_MAX_BLUR_REJECTS,
+                 max_skip_seconds: float = CHANGE_GATE_MAX_SKIP_SECONDS) -> None:
+        self.downscale = max(1, int(downscale))
+        self.pixel_delta = int(pixel_delta)
+        self.min_changed_ratio = float(min_changed_ratio)
+        self.tile = max(1, int(tile))
+        self.blur_ratio = float(blur_ratio)
+        self.max_blur_rejects = max(0, int(max_blur_rejects))
+        self.max_skip_seconds = float(max_skip_seconds)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the reference frame and counters (next frame is always accepted)."""
+        with self._lock:
+            self._ref_thumb = None
+            self._ref_fingerprint: Optional[int] = None
+            self._ref_sharpness = 0.0
+            self._ref_time = 0.0
+            self._blur_streak = 0
+            self.last_decision = ""
+            self.last_changed_ratio = 0.0
+            self.last_tile_ratio = 0.0
+            self.counters = {
+                ACCEPT_FIRST: 0,
+                ACCEPT_CHANGED: 0,
+                ACCEPT_FORCED: 0,
+                SKIP_IDENTICAL: 0,
+                SKIP_BELOW_THRESHOLD: 0,
+                REJECT_BLURRED: 0,
+            }
+
+    def invalidate(self) -> None:
+        """Drop the reference frame only (e.g. after an OCR error) - counters stay."""
+        with self._lock:
+            self._ref_thumb = None
+            self._ref_fingerprint = None
+
+    def _thumbnail(self, img):
+        if img.ndim == 3:
+            gray = cv2.cvtColor(img, cv2.COLOR_BGRA2GRAY if img.shape[2] == 4 else cv2.COLOR_BGR2GRAY)
+        else:
+            gray = img
+        h, w = gray.shape[:2]
+        tw, th = max(1, w // self.downscale), max(1, h // self.downscale)
+        # INTER_AREA mittelt Rendering-Rauschen weg
+        return cv2.resize(gray, (tw, th), interpolation=cv2.INTER_AREA)
+
+    def _max_tile_ratio(self, changed) -> float:
+        """Changed-pixel fraction of the most-changed ``tile`` × ``tile`` block."""
+        h, w = changed.shape[:2]
+        t = self.tile
+        padded = np.pad(changed, ((0, -h % t), (0, -w % t)))
+        counts = padded.reshape(padded.shape[0] // t, t, padded.shape[1] // t, t).sum(axis=(1, 3))
+        return float(counts.max()) / float(min(t, h) * min(t, w))
+
+    @staticmethod
+    def _sharpness(thumb) -> float:
+        return float(cv2.Laplacian(thumb, cv2.CV_32F).var())
+
+    def evaluate(self, img, now: Optional[float] = None) -> tuple[bool, str]:
+        """Return (run_ocr, reason) for ``img`` (BGR/BGRA/gray ROI)."""
+        if now is None:
+            now = time.monotonic()
+        thumb = self._thumbnail(img)
+        fingerprint = zlib.crc32(np.ascontiguousarray(thumb >> 3).tobytes())
+
+        with self._lock:
+            self.last_tile_ratio = 0.0
+            ref = self._ref_thumb
+            if ref is None or ref.shape != thumb.shape:
+                return self._accept(thumb, fingerprint, now, ACCEPT_FIRST)
+
+            forced = self.max_skip_seconds > 0 and (now - self._ref_time) >= self.max_skip_seconds
+
+            if fingerprint == self._ref_fingerprint and not forced:
+                return self._skip(SKIP_IDENTICAL, 0.0)
+
+            changed = cv2.absdiff(thumb, ref) > self.pixel_delta
+            changed_ratio = float(np.count_nonzero(changed)) / float(changed.size)
+            self.last_tile_ratio = self._max_tile_ratio(changed)
+            if self.last_tile_ratio < self.min_changed_ratio:
+                if forced:
+                    return self._accept(thumb, fingerprint, now, ACCEPT_FORCED, changed_ratio)
+                return self._skip(SKIP_BELOW_THRESHOLD, changed_ratio)
+
+            sharpness = self._sharpness(thumb)
+            if (self._ref_sharpness > 0
+                    and sharpness < self._ref_sharpness * self.blur_ratio
+                    and self._blur_streak < self.max_blur_rejects):
+                self._blur_streak += 1
+                self.counters[REJECT_BLURRED] += 1
+                self.last_decision = REJECT_BLURRED
+                self.last_changed_ratio = changed_ratio
+                return False, REJECT_BLURRED
+
+            return self._accept(thumb, fingerprint, now, ACCEPT_CHANGED, changed_ratio, sharpness)
+
+    def _accept(self, thumb, fingerprint, now, reason, changed_ratio=1.0, sharpness=None):
+        self._ref_thumb = thumb.copy()
+        self._ref_fingerprint = fingerprint
+        self._ref_sharpness = self._sharpness(thumb) if sharpness is None else sharpness
+        self._ref_time = now
+        self._blur_streak = 0
+        self.counters[reason] += 1
+        self.last_decision = reason
+        self.last_changed_ratio = changed_ratio
+        return True, reason
+
+    def _skip(self, reason, changed_ratio):
+        self._blur_streak = 0
+        self.counters[reason] += 1
+        self.last_decision = reason
+        self.last_changed_ratio = changed_ratio
+        return False, reason
+
+    def get_stats(self) -> dict:
+        """Return accept/skip counters and the resulting skip rate (percent)."""
+        with self._lock:
+            counters = dict(self.counters)
+        accepted = counters[ACCEPT_FIRST] + counters[ACCEPT_CHANGED] + counters[ACCEPT_FORCED]
+        skipped = counters[SKIP_IDENTICAL] + counters[SKIP_BELOW_THRESHOLD] + counters[REJECT_BLURRED]
+        total = accepted + skipped
+        return {
+            **counters,
+            'accepted': accepted,
+            'skipped': skipped,
+            'total': total,
+            'skip_rate': (skipped / total * 100) if total else 0.0,
+        }
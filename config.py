@@ -1,14 +1,20 @@
 import os
 import json
 import sqlite3
-import pytesseract
-import easyocr
 
 # -----------------------
 # Konfiguration
 # -----------------------
 TESS_PATH = r"C:\Program Files\Tesseract-OCR\tesseract.exe"
-pytesseract.pytesseract.tesseract_cmd = TESS_PATH
+# Tesseract-Backend (siehe tesseract_backend.py): 'auto' = persistentes tesserocr-Handle
+# (C-API, kein Subprozess/Temp-Bild pro Aufruf) falls installiert, sonst pytesseract;
+# 'subprocess' = immer pytesseract
+TESSERACT_BACKEND = os.getenv('TESSERACT_BACKEND', 'auto').strip().lower()
+TESSERACT_LANG = 'eng'
+# None = in tesserocr einkompilierter Pfad
+TESSDATA_PATH = os.getenv('TESSDATA_PREFIX') or (
+    os.path.join(os.path.dirname(TESS_PATH), 'tessdata') if os.name == 'nt' else None
+)
 
 # -----------------------
 # OCR Engine Selection (Phase 2 - ML Integration)
@@ -20,6 +26,13 @@ pytesseract.pytesseract.tesseract_cmd = TESS_PATH
 OCR_ENGINE = 'easyocr'  # Beste Performance für BDO (PaddleOCR zu langsam)
 OCR_FALLBACK_ENABLED = False  # Fallback bei Bedarf
 
+# Engine-Racing in ocr_engines.ocr_auto (nur mit OCR_FALLBACK_ENABLED, sonst gibt es nur eine Engine):
+# alle Engines parallel, das erste Ergebnis mit Timestamp + Event-Anker + Konfidenz gewinnt,
+# langsamere werden ignoriert. Gewinnraten/Latenzen: ocr_engines.get_race_stats()
+OCR_RACE_ENABLED = False
+OCR_RACE_DEADLINE_S = 2.0        # Spätestens dann bestes bisheriges Ergebnis nehmen
+OCR_RACE_MIN_CONFIDENCE = 0.5    # Ø Konfidenz für den Qualitätscheck
+
 # Legacy compatibility
 USE_EASYOCR = True  # Behalten für Backward-Kompatibilität
 DB_PATH = "bdo_tracker.db"
@@ -171,7 +184,30 @@ def set_capture_region(region: tuple[int, int, int, int]) -> None:
     _set_region_setting(region)
 
 
-DEFAULT_REGION = get_capture_region((734, 371, 1823, 1070))
+def get_ocr_tuning() -> dict:
+    """Return the persisted OCR autotune result (empty = built-in EasyOCR parameters)."""
+    raw = _load_tracker_settings().get("ocr_tuning")
+    if not raw:
+        return {}
+    try:
+        tuning = json.loads(raw)
+        return tuning if isinstance(tuning, dict) else {}
+    except Exception:
+        return {}
+
+
+def set_ocr_tuning(tuning: dict | None) -> None:
+    """Persist the OCR autotune result (``None``/empty resets to the built-in parameters)."""
+    try:
+        data = json.dumps(tuning or {}, sort_keys=True)
+        _persist_tracker_setting("ocr_tuning", data)
+        settings = _load_tracker_settings()
+        settings["ocr_tuning"] = data
+    except Exception:
+        pass
+
+
+_DEFAULT_REGION_FALLBACK = (734, 371, 1823, 1070)  # DEFAULT_REGION: lazy, siehe __getattr__
 # CRITICAL FIX: Reduced from 0.3s to 0.15s for faster real-time tracking
 # Even with slower OCR (2s), faster polling ensures we capture transaction lines quickly
 # Old: 0.3s = ~3 scans/sec, New: 0.15s = ~6-7 scans/sec
@@ -189,16 +225,265 @@ FOCUS_WINDOW_TITLES = [
 # -----------------------
 # Async Pipeline Feature Flag
 # -----------------------
-# CRITICAL: Async Pipeline deaktiviert wegen hoher Queue-Latenz mit PaddleOCR
-# PaddleOCR braucht 5-6s pro Scan -> Queue Latency zu hoch
-# Mit synchronem Processing: OCR blockiert, aber keine Queue-Latenz
-USE_ASYNC_PIPELINE = False  # Deaktiviert für bessere Latenz
-# CRITICAL FIX: Queue size = 1 to prevent stale frames
-# Old frames are USELESS - we only care about the LATEST state
-# Queue latency was 10+ seconds with size=3, now <1s with size=1
-ASYNC_QUEUE_MAXSIZE = 1  # MUST be 1 for real-time tracking
+# Früher deaktiviert wegen hoher Queue-Latenz (PaddleOCR 5-6s pro Scan, FIFO-Queue
+# lieferte veraltete Frames). Jetzt: LatestFrameSlot (frame_slot.py) - Capture
+# überschreibt, Worker holen immer den neuesten Frame → keine Stale-Frame-Latenz.
+USE_ASYNC_PIPELINE = os.getenv('USE_ASYNC_PIPELINE', '1').strip().lower() not in ('0', 'false', 'no')
+# Der Latest-Frame-Slot hält genau 1 wartenden Frame (Basis für CAPTURE_RING_SIZE)
+ASYNC_QUEUE_MAXSIZE = 1
 ASYNC_WORKER_COUNT = max(1, int(os.getenv('ASYNC_WORKER_COUNT', '1') or '1'))
 
+# -----------------------
+# OCR Process Pool (OCR in eigenen Prozessen statt im GIL-geteilten Tracker-Thread, siehe ocr_process_pool.py)
+# -----------------------
+# An: Async-Pipeline schickt extract_text über Shared Memory an N Worker-Prozesse
+# (je eigene Engine-Instanz → N× Modell-RAM). Für parallele Burst-Frames
+# ASYNC_WORKER_COUNT >= OCR_PROCESS_WORKERS setzen.
+OCR_PROCESS_POOL_ENABLED = os.getenv('OCR_PROCESS_POOL', '0').strip().lower() in ('1', 'true', 'yes')
+OCR_PROCESS_WORKERS = max(1, int(os.getenv('OCR_PROCESS_WORKERS', str(ASYNC_WORKER_COUNT)) or '1'))
+OCR_PROCESS_MAX_PENDING = 4           # Wartende Frames; ältester wird verworfen (neuester zählt)
+OCR_PROCESS_TASK_TIMEOUT = 30.0       # Hängender Worker → kill + Neustart (Sekunden, 0 = aus)
+
+# -----------------------
+# Capture Backend (persistente mss-Session + Frame-Ring)
+# -----------------------
+# Ring muss alle gleichzeitig "lebenden" Frames abdecken:
+# Frame-Slot + OCR-Worker + aktueller Capture + 1 Reserve
+CAPTURE_RING_SIZE = ASYNC_QUEUE_MAXSIZE + ASYNC_WORKER_COUNT + 2
+# Sind alle Buffer reserviert, wächst der Ring bis hierhin; danach ungepoolte Frames
+# (ein vergessenes release soll nicht still Speicher fressen)
+CAPTURE_RING_MAX_SIZE = CAPTURE_RING_SIZE * 4
+# Grayscale direkt aus BGRA (spart BGR-Kopie; OCR arbeitet ohnehin auf Grau)
+CAPTURE_GRAYSCALE = False
+
+# -----------------------
+# Frame Recording / Replay (Benchmark & Regression ohne laufendes Spiel)
+# -----------------------
+FRAME_RECORDING_CHUNK_FRAMES = 32  # Frames pro Chunk (Kompressions-Einheit)
+FRAME_RECORDING_COMPRESSION = "zlib"  # "zlib" oder None (raw = zero-copy mmap)
+
+# -----------------------
+# Multi-Region Capture (Teilbereiche mit eigener Scan-Rate)
+# -----------------------
+# Aus: ganzes Fenster pro Scan. An: nur fällige Teilbereiche greifen + OCR,
+# Texte aller Bereiche werden für process_ocr_text zusammengesetzt.
+CAPTURE_SUBREGIONS_ENABLED = False
+# box = (x0, y0, x1, y1) relativ zur Capture-Region; Reihenfolge = Text-Reihenfolge.
+# Zusammen decken beide Bereiche die bisherige Log-ROI (oberste 75%) ab.
+# snap = Anteil der Fensterhöhe, um den innere Kanten größer gegriffen und dann auf
+# die nächste Zeilenlücke geschnitten werden (≥ eine Zeilenhöhe; 0 = feste Kante).
+CAPTURE_SUBREGIONS = [
+    # Transaction-Notifications oben: im Burst mit vollem Takt
+    {'name': 'notifications', 'box': (0.0, 0.0, 1.0, 0.25), 'interval': 0.5, 'burst_interval': 0.08,
+     'adaptive': True, 'fast_mode': True, 'snap': 0.05},
+    # Item-Liste + Metriken (Orders / Orders Completed / Collect): ändern sich selten
+    {'name': 'window', 'box': (0.0, 0.25, 1.0, 0.75), 'interval': 2.0, 'burst_interval': 1.0,
+     'adaptive': True, 'fast_mode': True, 'snap': 0.05},
+]
+
+# -----------------------
+# Window Classifier (Fenster-Typ per Pixel-Templates vor der OCR)
+# -----------------------
+# Inaktiv solange WINDOW_TEMPLATE_DIR keine templates.json enthält
+# (Templates erfassen: scripts/utils/capture_window_templates.py)
+WINDOW_CLASSIFIER_ENABLED = True
+WINDOW_TEMPLATE_DIR = "config/window_templates"
+WINDOW_CLASSIFIER_SCALE = 0.5           # Frame + Templates vor dem Matching verkleinern
+WINDOW_CLASSIFIER_THRESHOLD = 0.8       # Min. TM_CCOEFF_NORMED-Score jeder Landmarke
+WINDOW_CLASSIFIER_SEARCH_MARGIN = 0.05  # Suchbereich um die Template-Box (relativ)
+# Kein Fenster erkannt (Markt zu?) → OCR überspringen. Aus, bis Templates
+# für alle vier Fenster erfasst sind - sonst würde ein Template-Miss das Tracking stoppen.
+WINDOW_CLASSIFIER_SKIP_UNKNOWN = False
+
+# -----------------------
+# Glyph OCR (Ziffern-Felder per Templates der Spielschrift)
+# -----------------------
+# Templates lernen: scripts/utils/train_glyphs.py (ohne Datei → immer Fallback-Engine)
+GLYPH_TEMPLATE_PATH = "config/glyphs.npz"
+GLYPH_SIZE = (10, 14)                 # Normierte Glyphen-Größe (Breite, Höhe)
+GLYPH_MIN_CONFIDENCE = 0.85           # Darunter entscheidet die allgemeine OCR-Engine
+GLYPH_SEPARATOR_HEIGHT_RATIO = 0.45   # Glyphen kleiner als 45% Zeilenhöhe = Tausender-Trenner
+# An: Zahlen-Spans der EasyOCR-Boxen (Preis, Menge, Orders, Collect) per Templates neu lesen;
+# die EasyOCR-Lesung bleibt Fallback. Braucht Boxen pro Zeile (OCR_GEOMETRY_RECONSTRUCTION).
+GLYPH_NUMERIC_FIELDS_ENABLED = os.getenv('GLYPH_NUMERIC_FIELDS', '0').strip().lower() in ('1', 'true', 'yes')
+
+# -----------------------
+# Selektives Re-OCR unsicherer Tokens (siehe token_reocr.py)
+# -----------------------
+# An: Spans unter TOKEN_REOCR_MIN_CONFIDENCE werden einzeln neu erkannt (Glyph → EasyOCR
+# hochskaliert → PaddleOCR) statt den Frame neu zu scannen. Braucht Konfidenz pro Span,
+# also EasyOCR ohne paragraph-Gruppierung (OCR_GEOMETRY_RECONSTRUCTION).
+TOKEN_REOCR_ENABLED = False
+TOKEN_REOCR_MIN_CONFIDENCE = 0.5      # Darunter gilt ein Span als unsicher
+TOKEN_REOCR_UPSCALE = 2.0             # Crop-Vergrößerung für den zweiten Durchlauf
+TOKEN_REOCR_MAX_TOKENS = 8            # Max. Spans pro Frame (schlechteste zuerst)
+TOKEN_REOCR_TIME_BUDGET_MS = 150.0    # Neue Stufe nur innerhalb dieses Budgets
+TOKEN_REOCR_MIN_GAIN = 0.05           # Ersetzen erst ab dieser Konfidenz-Verbesserung
+TOKEN_REOCR_PADDING = 2               # Rand um die Span-Box (px)
+
+# -----------------------
+# Log-ROI Auto-Detection (statt fester oberster 75%)
+# -----------------------
+# Aus: detect_log_roi liefert wie bisher die obersten 75%.
+# An: Text-Bereich aus dem Layout (Textbänder, Timestamp-Spalte), pro Frame-Shape gecacht.
+LOG_ROI_AUTO_DETECT = False
+LOG_ROI_DOWNSCALE = 2                 # Erkennung auf halber Auflösung
+LOG_ROI_EDGE_DELTA = 40               # Helligkeitssprung, der als Textkante zählt
+LOG_ROI_MIN_EDGE_RATIO = 0.02         # Min. Anteil Kanten-Pixel einer Zeile für "Text"
+LOG_ROI_MAX_BAND_HEIGHT_RATIO = 2.5   # Bänder > 2.5× Median-Zeilenhöhe am Rand = Icons
+LOG_ROI_MIN_BANDS = 2                 # Weniger Textzeilen → Fallback auf feste ROI
+LOG_ROI_MARGIN = 6                    # Pixel-Rand um die erkannte ROI
+LOG_ROI_REVALIDATE_EVERY = 30         # Gegenprobe alle N Lookups
+LOG_ROI_MIN_IOU = 0.85                # Darunter gilt die gecachte Geometrie als veraltet
+LOG_ROI_LAYOUT_CHANGE_RATIO = 0.2     # Change-Gate: ab diesem Anteil geänderter Pixel sofort gegenprüfen
+
+# -----------------------
+# Strukturierte OCR-Ergebnisse (Text + Box + Konfidenz pro Zeile, siehe ocr_result.py)
+# -----------------------
+# ocr_image_cached cached immer das strukturierte Ergebnis; der flache String bleibt Default.
+# An: EasyOCR ohne paragraph-Gruppierung (eine Box pro Textzeile) und der flache String
+# wird geometrisch rekonstruiert (Zeilen nach y, Timestamp an seine Zeile).
+OCR_GEOMETRY_RECONSTRUCTION = False
+
+# -----------------------
+# EasyOCR Detection-Box-Reuse (CRAFT-Detektor nur bei Layout-Änderung, siehe detection_cache.py)
+# -----------------------
+# An: Boxen pro ROI-Geometrie cachen, Folge-Frames nur reader.recognize().
+# Neu-Detektion bei verschobenen/neuen Zeilen, breiterem Text, Gate-/Fensterwechsel.
+EASYOCR_BOX_REUSE_ENABLED = False
+EASYOCR_BOX_REUSE_MAX_FRAMES = 20     # Spätestens nach N Wiederverwendungen neu detektieren
+EASYOCR_BOX_REUSE_Y_TOLERANCE = 3     # Max. Zeilen-Verschiebung (px) für "Layout unverändert"
+EASYOCR_BOX_REUSE_X_MARGIN = 8        # Text darf max. N px über die gecachte Ausdehnung wachsen
+EASYOCR_BOX_REUSE_CACHE_SIZE = 4      # Gecachte Geometrien (ROI-Shapes/Teilbereiche)
+
+# -----------------------
+# EasyOCR Multi-Scale (Detection verkleinert, Recognition in voller Auflösung)
+# -----------------------
+# < 1.0: CRAFT-Detektor läuft auf einer um diesen Faktor verkleinerten ROI-Kopie,
+# die Boxen werden zurückskaliert und aus dem vollen Graubild erkannt.
+# 1.0 = aus (eine readtext-Auflösung wie bisher). Genauigkeit pro Faktor gegen
+# das Replay-Korpus: scripts/evaluate_detect_scale.py
+EASYOCR_DETECT_SCALE = 1.0
+
+# -----------------------
+# Statische UI-Labels ausblenden (siehe label_mask.py)
+# -----------------------
+# An: Boxen fester Beschriftungen ("Collect", "Orders Completed", Suchfeld, ...) werden
+# pro Fenstertyp gelernt und vor der Recognition verworfen. Labels, die Parser bzw.
+# detect_window_type brauchen, gehen als synthetisches Token (Engine 'label') weiter.
+# Braucht eine Box pro Textzeile → nur mit OCR_GEOMETRY_RECONSTRUCTION wirksam.
+UI_LABEL_MASK_ENABLED = False
+UI_LABEL_MASK_LABELS = (
+    "Collect", "Re-list", "Orders Completed", "Sales Completed",
+    "Warehouse Capacity", "Enter a search term", "VT", "Balance",
+)
+UI_LABEL_MASK_PASS_THROUGH = ("Collect", "Re-list", "Orders Completed", "Sales Completed")
+UI_LABEL_MASK_WINDOWS = ("sell_overview", "buy_overview")
+UI_LABEL_MASK_MIN_HITS = 3            # Label N-mal an gleicher Stelle erkannt → Maske aktiv
+UI_LABEL_MASK_IOU = 0.7               # Min. Überlappung Box ↔ gelernte Label-Box
+UI_LABEL_MASK_VERIFY_INTERVAL = 30    # Jeder N-te Frame erkennt alle Boxen (Maske prüfen, 0 = nie)
+
+# -----------------------
+# Change Gate (Skip OCR wenn sich der Text-Inhalt der ROI nicht geändert hat)
+# -----------------------
+CHANGE_GATE_ENABLED = True
+CHANGE_GATE_DOWNSCALE = 4             # Thumbnail = ROI / 4 (INTER_AREA)
+CHANGE_GATE_PIXEL_DELTA = 12          # Graustufen-Differenz ab der ein Thumbnail-Pixel "geändert" ist (dünne Ziffern!)
+CHANGE_GATE_TILE = 8                  # Kachel = 8×8 Thumbnail-Pixel (32px ROI, ~1 Log-Zeile)
+CHANGE_GATE_MIN_CHANGED_RATIO = 0.03  # <3% geänderte Pixel in der stärksten Kachel → Skip (Cursor, Einzelpixel)
+CHANGE_GATE_BLUR_RATIO = 0.6          # Schärfe < 60% der Referenz → Übergangs-Frame verwerfen
+CHANGE_GATE_MAX_BLUR_REJECTS = 3      # Danach trotzdem akzeptieren (kein Dauer-Reject)
+CHANGE_GATE_MAX_SKIP_SECONDS = 10.0   # Spätestens dann OCR erzwingen (Sicherheitsnetz)
+
+# -----------------------
+# Line-Band OCR (zeilenweiser OCR-Cache, nur geänderte Zeilen werden erkannt)
+# -----------------------
+# Ändert das OCR-Ausgabeformat (eine Zeile pro Band statt EasyOCR-Paragraphen)
+# → vor dem Aktivieren mit scripts/utils/replay_frames.py gegen Aufnahmen prüfen
+LINE_BAND_OCR_ENABLED = False
+LINE_BAND_EDGE_DELTA = 40         # Grauwert-Sprung ab dem ein Pixel als Kante zählt
+LINE_BAND_MIN_EDGE_PIXELS = 6     # Kanten pro Pixelzeile ab der die Zeile "Text" ist
+LINE_BAND_MIN_HEIGHT = 6          # Kleinere Bänder = Rauschen/Trennlinien
+LINE_BAND_GAP_TOLERANCE = 2       # Lücken bis 2px gehören noch zum Band (Unterlängen, Punkte)
+LINE_BAND_MARGIN = 3              # Rand um jedes Band (EasyOCR braucht etwas Kontext)
+LINE_BAND_CACHE_SIZE = 256        # Max. gecachte Band-Ergebnisse (LRU)
+
+# -----------------------
+# Batched Recognition (mehrere Zeilen-/Feld-Crops pro Recognizer-Aufruf, siehe ocr_engines.recognize_batch)
+# -----------------------
+# Crops werden auf eine gemeinsame Breite gepolstert und in EINEM Aufruf erkannt
+# (kein CRAFT-Detektor pro Crop). Durchsatz: ocr_engines.get_batch_stats(),
+# Batch-Größe messen mit scripts/benchmark_recognize_batch.py.
+OCR_RECOGNIZE_BATCH_SIZE = 16     # Crops pro Recognizer-Batch (GPU: größer = mehr Durchsatz)
+LINE_BAND_BATCH_RECOGNITION = True  # Line-Band-Misses gesammelt als Batch erkennen (nur mit LINE_BAND_OCR_ENABLED)
+
+# -----------------------
+# Temporal Voting (Log-Zeilen über mehrere Scans abstimmen, siehe row_voting.py)
+# -----------------------
+# An: jede Log-Zeile sammelt ihre letzten Lesungen, der Tracker bekommt den
+# zeichenweisen Mehrheitstext und eine Zeile erst, wenn sie stabil ist
+# (verzögert neue Zeilen um ~1 Scan; Zeilen, die vorher verschwinden, werden trotzdem übergeben).
+ROW_VOTING_ENABLED = False
+ROW_VOTING_HISTORY = 5             # Letzte N Lesungen pro Zeile
+ROW_VOTING_MIN_READINGS = 2        # Mindest-Lesungen, bevor eine Zeile committed wird
+ROW_VOTING_MATCH_THRESHOLD = 0.8   # Min. Ähnlichkeit (difflib ratio) Lesung ↔ Zeile
+ROW_VOTING_MAX_AGE = 3             # Scans ohne Sichtung, bevor eine Zeile verworfen wird
+
+# -----------------------
+# OCR Autotuner (EasyOCR-Parameter + Torch-Threads pro Rechner messen, siehe ocr_autotune.py)
+# -----------------------
+# scripts/autotune_ocr.py spielt ein gelabeltes Frame-Set über das Raster ab und speichert
+# die Pareto-beste Konfiguration (Latenz vs. Transaktions-Genauigkeit) in tracker_settings.
+OCR_AUTOTUNE_APPLY = True             # Gespeichertes Tuning in extract_text/Reader verwenden
+OCR_AUTOTUNE_GRID = {
+    'canvas_size': (1280, 1600, 1920, 2240),
+    'text_threshold': (0.68, 0.72),
+    'low_text': (0.38, 0.42),
+    'link_threshold': (0.42,),
+    'paragraph': (True, False),
+    'batch_size': (1, 4),
+}
+OCR_AUTOTUNE_ACCURACY_TOLERANCE = 0.01  # Schnellste Konfig innerhalb dieser F1-Differenz zur besten
+
+# -----------------------
+# Perceptual-Hash-Cache (2. Cache-Tier hinter dem exakten MD5-Cache in utils.py)
+# -----------------------
+# Standard aus: eine geänderte Ziffer (Preis, Collect, Orders Completed) kippt im
+# 64x32-dHash oft kein einziges Bit → der Tier würde veralteten Text liefern.
+# Nur für Aufnahmen/Replays ohne Zahlenänderungen gedacht.
+PHASH_CACHE_ENABLED = os.getenv('PHASH_CACHE', '0').strip().lower() in ('1', 'true', 'yes')
+PHASH_HASH_SIZE = (64, 32)   # dHash-Raster (Breite x Höhe) → 2048 Bit
+PHASH_MAX_DISTANCE = 6       # Max. Hamming-Distanz für einen Treffer
+PHASH_CACHE_SIZE = 20        # Wie MAX_CACHE_SIZE (gleiche TTL: CACHE_TTL)
+PHASH_VERIFY_INTERVAL = 25   # Jeden N-ten Treffer per OCR verifizieren (0 = aus)
+
+# -----------------------
+# Adaptive Scan Scheduler (ersetzt feste Poll-/Burst-Intervalle)
+# -----------------------
+# Obergrenze im Normalbetrieb bleibt das Poll-Interval des Trackers (max 0.5s)
+SCHED_TARGET_LATENCY = 1.0          # Ziel: Capture → Erkennung in ≤1s
+SCHED_BURST_TARGET_LATENCY = 0.25   # Im Burst (Detail → Overview) deutlich schneller
+SCHED_CPU_BUDGET = 0.5              # Max. Anteil eines Kerns für Scans im Normalbetrieb
+SCHED_BURST_CPU_BUDGET = 0.9        # Burst darf kurzzeitig fast voll auslasten
+SCHED_MIN_INTERVAL = 0.08           # Wie alter Burst-Takt (12 Scans/s)
+SCHED_CLOSED_BACKOFF_MAX = 4.0      # Markt zu / kein Fokus: Backoff bis 4s
+SCHED_TRANSITION_BURST_SECONDS = 3.0
+SCHED_SAMPLE_WINDOW = 30            # Rollierendes Fenster für Latenz-Messungen
+SCHED_CHANGE_RATE_ALPHA = 0.2       # EWMA-Gewicht der Änderungsrate
+
+# -----------------------
+# CPU-Governor (CPU-Modus: OCR-Last neben dem Spiel begrenzen, siehe cpu_governor.py)
+# -----------------------
+# An: torch-Threads + CPU-Affinität auf den Budget-Anteil der Kerne, niedrigere
+# Prozess-Priorität, und zusätzliche Scan-Pausen, solange die GEMESSENE
+# Prozess-Auslastung über dem Budget liegt. Status neben der Health-Anzeige der GUI.
+CPU_GOVERNOR_ENABLED = os.getenv('CPU_GOVERNOR', '0').strip().lower() in ('1', 'true', 'yes')
+CPU_GOVERNOR_BUDGET = 0.25          # Max. Anteil der GESAMTEN CPU (alle Kerne) für den Tracker
+CPU_GOVERNOR_NICE = 10              # POSIX nice-Inkrement, max. 19 (Windows: BELOW_NORMAL_PRIORITY_CLASS), 0 = aus
+CPU_GOVERNOR_AFFINITY = True        # Auf die letzten N Kerne pinnen (N = Budget-Anteil), False = alle
+CPU_GOVERNOR_WINDOW_S = 5.0         # Messfenster der Auslastung
+CPU_GOVERNOR_MAX_DELAY = 2.0        # Max. zusätzliche Pause pro Scan (s)
+
 # -----------------------
 # Performance: GPU-Optimierung (Game-Friendly)
 # -----------------------
@@ -265,7 +550,7 @@ MAX_ITEM_QUANTITY = 5000
 #   1. USE_GPU = False         → CPU-only (langsamer, aber keine Game-Ruckler)
 #   2. GPU_MEMORY_LIMIT = 2048 → Limitiert VRAM-Nutzung (MB)
 #   3. GPU_LOW_PRIORITY = True → OCR bekommt niedrige GPU-Priorität
-USE_GPU = get_use_gpu(True)  # ⚠️ Auf True setzen wenn GPU verfügbar 
+# USE_GPU: persistierter Wert (Default True), lazy gelesen - siehe __getattr__
 
 # GPU-Memory-Limit (MB) - Reduziert VRAM-Nutzung, verhindert Konkurrenz mit Spiel
 # Empfohlen: 2048-4096 MB (2-4 GB) für RTX 4070
@@ -277,168 +562,33 @@ GPU_MEMORY_LIMIT = 2048  # MB VRAM für OCR
 # False = Normale Priorität (kann Spiel beeinflussen)
 GPU_LOW_PRIORITY = True
 
-# OCR reader (EasyOCR) mit optimierten Parametern
-reader = None
-if USE_EASYOCR:
-    cpu_retry = False
-    
-    # Try to free up memory before initialization
-    import gc
-    gc.collect()
-    
-    try:
-        # Initialisiere EasyOCR mit optimierten Settings
-        # Versuche erst GPU, fallback auf CPU
-        gpu_available = USE_GPU
-        
-        # Test ob GPU verfügbar ist
-        if USE_GPU:
-            try:
-                import torch
-                gpu_available = torch.cuda.is_available()
-                if gpu_available:
-                    try:
-                        print(f"[GPU] Detected: {torch.cuda.get_device_name(0)}")
-                    except UnicodeEncodeError:
-                        print(f"GPU detected: {torch.cuda.get_device_name(0)}")
-                    
-                    # GPU-Memory-Limit setzen (verhindert VRAM-Konkurrenz mit Spiel)
-                    if GPU_MEMORY_LIMIT:
-                        try:
-                            total_mem = torch.cuda.get_device_properties(0).total_memory
-                            fraction = min(1.0, max(0.0, (GPU_MEMORY_LIMIT * 1024 * 1024) / float(total_mem)))
-                            torch.cuda.set_per_process_memory_fraction(fraction, device=0)
-                            try:
-                                print(f"   GPU Memory Limit: {GPU_MEMORY_LIMIT} MB")
-                            except UnicodeEncodeError:
-                                print(f"GPU Memory Limit: {GPU_MEMORY_LIMIT} MB")
-                        except Exception as mem_err:
-                            try:
-                                print(f"   [WARNING] Could not set memory limit: {mem_err}")
-                            except UnicodeEncodeError:
-                                print(f"Could not set memory limit: {mem_err}")
-                    
-                    # Low-Priority Mode für OCR (Spiel hat Vorrang)
-                    if GPU_LOW_PRIORITY:
-                        try:
-                            torch.cuda.set_stream(torch.cuda.Stream(priority=-1))
-                            try:
-                                print(f"   GPU Priority: Low (game has priority)")
-                            except UnicodeEncodeError:
-                                print(f"GPU Priority: Low (game has priority)")
-                        except Exception as prio_err:
-                            try:
-                                print(f"   [WARNING] Could not set priority: {prio_err}")
-                            except UnicodeEncodeError:
-                                print(f"Could not set priority: {prio_err}")
-                    
-                else:
-                    try:
-                        print("[WARNING] GPU requested but CUDA not available, falling back to CPU")
-                    except UnicodeEncodeError:
-                        print("GPU requested but CUDA not available, falling back to CPU")
-            except Exception:
-                try:
-                    print("[WARNING] PyTorch/CUDA not found, falling back to CPU")
-                except UnicodeEncodeError:
-                    print("PyTorch/CUDA not found, falling back to CPU")
-                gpu_available = False
-        
-        # Use download_enabled=False to avoid network issues during init
-        # Use model_storage_directory to cache models
-        reader = easyocr.Reader(
-            ['en'], 
-            gpu=gpu_available,
-            verbose=False,
-            quantize=not gpu_available,  # Quantize nur bei CPU (GPU braucht es nicht)
-            cudnn_benchmark=gpu_available,  # cuDNN-Optimierung bei GPU
-            download_enabled=True,  # Allow model downloads if needed
-            detector=True,
-            recognizer=True
-        )
-        
-        mode = "GPU" if gpu_available else "CPU"
-        try:
-            print(f"[OK] EasyOCR initialized ({mode} mode)")
-        except UnicodeEncodeError:
-            print(f"EasyOCR initialized ({mode} mode)")
-        
-    except Exception as e:
-        attempted_mode = "GPU" if USE_GPU else "CPU"
-        error_msg = str(e)
-        try:
-            print(f"[ERROR] EasyOCR init error ({attempted_mode} mode): {error_msg}")
-        except UnicodeEncodeError:
-            print(f"EasyOCR init error ({attempted_mode} mode): {error_msg}")
-        
-        # Check if it's a memory error
-        is_memory_error = 'not enough memory' in error_msg.lower() or 'out of memory' in error_msg.lower()
-        
-        reader = None
-        if USE_GPU and not is_memory_error:
-            # Only retry without GPU if it's not a general memory issue
-            cpu_retry = True
-            USE_GPU = False
-            gpu_available = False
-            try:
-                print("[WARNING] Retrying EasyOCR initialization without GPU ...")
-            except UnicodeEncodeError:
-                print("Retrying EasyOCR initialization without GPU ...")
-        elif is_memory_error:
-            try:
-                print("[WARNING] Memory error detected - EasyOCR initialization skipped")
-                print("[WARNING] Falling back to Tesseract-only mode")
-            except UnicodeEncodeError:
-                print("Memory error detected - using Tesseract only")
-            cpu_retry = False  # Don't retry if memory is the issue
-    
-    if reader is None and cpu_retry:
-        try:
-            import torch
-        except Exception:
-            torch = None
-        try:
-            reader = easyocr.Reader(
-                ['en'],
-                gpu=False,
-                verbose=False,
-                quantize=True,
-                cudnn_benchmark=False
-            )
-            try:
-                print("[OK] EasyOCR initialized (CPU fallback)")
-            except UnicodeEncodeError:
-                print("EasyOCR initialized (CPU fallback)")
-        except Exception as cpu_err:
-            try:
-                print(f"[ERROR] EasyOCR CPU fallback error: {cpu_err}")
-            except UnicodeEncodeError:
-                print(f"EasyOCR CPU fallback error: {cpu_err}")
-            reader = None
-
-# -----------------------
-# PaddleOCR Initialization (Phase 2 - ML Integration)
-# -----------------------
-paddle_reader = None
-if OCR_ENGINE == 'paddle' or OCR_FALLBACK_ENABLED:
-    try:
-        from ocr_engines import init_paddle_ocr, init_easyocr
-        
-        # Initialize PaddleOCR (primary engine)
-        paddle_success = init_paddle_ocr(use_gpu=USE_GPU, lang='en', show_log=False)
-        
-        # Initialize EasyOCR (fallback)
-        if OCR_FALLBACK_ENABLED:
-            easyocr_success = init_easyocr(use_gpu=USE_GPU, lang=['en'])
-        
-        if not paddle_success and not OCR_FALLBACK_ENABLED:
-            print("⚠️  PaddleOCR failed and fallback disabled - using EasyOCR")
-            OCR_ENGINE = 'easyocr'  # Fallback to EasyOCR
-            
-    except Exception as e:
-        print(f"⚠️  OCR engine initialization error: {e}")
-        print("⚠️  Falling back to legacy EasyOCR reader")
+# -----------------------
+# OCR Engines (lazy)
+# -----------------------
+# EasyOCR/PaddleOCR werden NICHT mehr beim Import gebaut (torch-Import, CUDA-Probe,
+# Modelle laden = Sekunden + mehrere hundert MB). Zugriff über ocr_registry:
+#   get_registry().get('easyocr') / get_reader() / get_registry().warmup()
+# ``config.reader`` bleibt als Alias für alte Skripte erhalten (baut beim Zugriff).
 
 LETTER_TO_DIGIT = {'O':'0','o':'0','D':'0','Q':'0','I':'1','l':'1','|':'1','i':'1',
                    'S':'5','s':'5','B':'8','Z':'2','z':'2'}
 DIGIT_TO_LETTER = {'0':'o','1':'l','5':'s','3':'e','4':'a','2':'z','8':'b'}
+
+
+def __getattr__(name: str):
+    """Lazy module attributes (PEP 562): nothing heavy or I/O-bound runs on ``import config``."""
+    if name == "DEFAULT_REGION":
+        value = get_capture_region(_DEFAULT_REGION_FALLBACK)
+    elif name == "USE_GPU":
+        value = get_use_gpu(True)
+    elif name == "reader":
+        # Legacy-Alias: baut den EasyOCR-Reader beim ersten Zugriff (nicht gecacht → Registry)
+        from ocr_registry import get_reader
+        return get_reader()
+    elif name == "paddle_reader":
+        from ocr_registry import get_registry
+        return get_registry().get("paddle")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
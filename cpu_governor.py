@@ -0,0 +1,237 @@
+"""
+CPU Governor - OCR-Last im CPU-Modus neben dem laufenden Spiel begrenzen
+
+Der GPU-Pfad hat GPU_MEMORY_LIMIT und GPU_LOW_PRIORITY; im CPU-Modus nimmt sich
+EasyOCR dagegen jeden Kern, den torch bekommt, während das Spiel läuft. Der
+ScanScheduler plant zwar mit einem CPU-Budget, rechnet aber nur mit der
+gemessenen Scan-Dauer, nicht mit der tatsächlichen Auslastung. Hier:
+
+1. torch intra-op Threads auf ``budget × Kerne`` begrenzen (auch ein
+   Autotune-Wert wird darauf gekappt, siehe ``ocr_registry.set_torch_thread_cap``)
+2. Prozess-Priorität senken (POSIX nice, Windows BELOW_NORMAL)
+3. CPU-Affinität auf die letzten N Kerne (das Spiel belegt meist die ersten)
+4. Duty-Cycle: Prozess-CPU-Zeit über ``window_s`` messen; liegt die Auslastung
+   über dem Budget, verlängert ``throttle`` die Pause vor dem nächsten Scan, bis
+   das Fenster wieder im Budget liegt (max. ``max_delay`` zusätzlich)
+
+Unter Linux gelten nice/Affinität pro Thread → alle vorhandenen Threads werden
+umgestellt, neue erben sie. Worker des OCR-Prozess-Pools erben Priorität und
+Affinität, zählen aber nicht zur gemessenen Auslastung.
+"""
+
+import os
+import sys
+import threading
+import time
+from collections import deque
+from typing import Callable, List, Optional
+
+from config import (
+    CPU_GOVERNOR_BUDGET,
+    CPU_GOVERNOR_NICE,
+    CPU_GOVERNOR_AFFINITY,
+    CPU_GOVERNOR_WINDOW_S,
+    CPU_GOVERNOR_MAX_DELAY,
+    OCR_AUTOTUNE_APPLY,
+    get_ocr_tuning,
+)
+from ocr_registry import get_registry, set_torch_thread_cap, set_torch_threads
+
+_BELOW_NORMAL_PRIORITY_CLASS = 0x00004000
+
+
+def _ocr_mode() -> Optional[str]:
+    """Mode EasyOCR actually runs in ('GPU'/'CPU'), None while the reader is not built yet."""
+    import config
+
+    # USE_GPU ist nur der Wunsch - nach CUDA-Fehler läuft EasyOCR trotzdem auf der CPU
+    status = get_registry().status().get('easyocr', {})
+    if not config.USE_EASYOCR or status.get('state') == 'failed':
+        return 'CPU'  # Tesseract/Fallback
+    return status.get('mode')
+
+
+def _thread_ids() -> List[int]:
+    # Linux: nice/Affinität sind pro Thread → alle Tasks des Prozesses
+    try:
+        return [int(tid) for tid in os.listdir("/proc/self/task")]
+    except OSError:
+        return [0]
+
+
+class CpuGovernor:
+    """Cap OCR CPU usage: torch threads, priority, affinity and measured-utilization duty cycling."""
+
+    def __init__(self, budget: float = CPU_GOVERNOR_BUDGET,
+                 nice: int = CPU_GOVERNOR_NICE,
+                 affinity: bool = CPU_GOVERNOR_AFFINITY,
+                 window_s: float = CPU_GOVERNOR_WINDOW_S,
+                 max_delay: float = CPU_GOVERNOR_MAX_DELAY,
+                 cpu_count: Optional[int] = None,
+                 clock: Callable[[], float] = time.monotonic,
+                 cpu_clock: Callable[[], float] = time.process_time) -> None:
+        self.cores = max(1, int(cpu_count or os.cpu_count() or 1))
+        self.budget = min(1.0, max(0.01, float(budget)))
+        self.thread_cap = max(1, int(round(self.cores * self.budget)))
+        self.nice = max(0, int(nice))
+        self.affinity = bool(affinity)
+        self.window_s = max(0.5, float(window_s))
+        self.max_delay = max(0.0, float(max_delay))
+        self._clock = clock
+        self._cpu_clock = cpu_clock
+        self._lock = threading.Lock()
+        self._apply_lock = threading.Lock()
+        self._priority: Optional[str] = None
+        self._samples: deque = deque()
+        self.applied: dict = {}
+        self.active = False
+        self.utilization = 0.0
+        self.decisions = 0
+        self.throttled = 0
+        self.last_delay = 0.0
+        self.total_delay = 0.0
+
+    # -----------------------
+    # Ressourcen-Limits (einmal beim Start)
+    # -----------------------
+    def apply(self, cpu_mode: Optional[bool] = None) -> dict:
+        """Set thread cap, priority and affinity (CPU mode only); returns what was applied.
+
+        Without ``cpu_mode`` the mode comes from the OCR registry. While the reader
+        is not built yet the governor stays pending and re-applies after the warm-up
+        (or on the next ``throttle`` once the mode is known).
+        """
+        if cpu_mode is None:
+            mode = _ocr_mode()
+            if mode is None:
+                self.applied = {'mode': 'pending'}
+                self.active = False
+                get_registry().when_warm(self.apply)
+                return self.applied
+            cpu_mode = mode == 'CPU'
+        if not cpu_mode:
+            self.applied = {'mode': 'GPU'}
+            self.active = False
+            return self.applied
+
+        applied: dict = {'mode': 'CPU'}
+        set_torch_thread_cap(self.thread_cap)
+        tuned = get_ocr_tuning().get('torch_threads') if OCR_AUTOTUNE_APPLY else None
+        threads = min(int(tuned or self.thread_cap), self.thread_cap)
+        if set_torch_threads(threads):
+            applied['threads'] = threads
+        with self._apply_lock:
+            # nice ist ein Inkrement → nur einmal pro Prozess anwenden
+            if self.nice and self._priority is None:
+                self._priority = self._lower_priority()
+            if self.nice:
+                applied['nice'] = self._priority
+            if self.affinity:
+                applied['cores'] = self._pin_cores()
+            self.applied = applied
+            self.active = True
+        return applied
+
+    def _lower_priority(self) -> Optional[str]:
+        try:
+            if sys.platform == "win32":
+                import ctypes
+
+                kernel32 = ctypes.windll.kernel32
+                if kernel32.SetPriorityClass(kernel32.GetCurrentProcess(), _BELOW_NORMAL_PRIORITY_CLASS):
+                    return "below_normal"
+                return None
+            for tid in _thread_ids():
+                current = os.getpriority(os.PRIO_PROCESS, tid)
+                os.setpriority(os.PRIO_PROCESS, tid, min(19, current + self.nice))
+            return f"+{self.nice}"
+        except Exception as exc:
+            print(f"⚠️  CPU governor: could not lower priority: {exc}")
+            return None
+
+    def _pin_cores(self) -> Optional[List[int]]:
+        if self.thread_cap >= self.cores:
+            return None
+        cores = list(range(self.cores - self.thread_cap, self.cores))
+        try:
+            if sys.platform == "win32":
+                import ctypes
+
+                kernel32 = ctypes.windll.kernel32
+                mask = sum(1 << core for core in cores)
+                return cores if kernel32.SetProcessAffinityMask(kernel32.GetCurrentProcess(), mask) else None
+            if not hasattr(os, "sched_setaffinity"):
+                return None
+            for tid in _thread_ids():
+                os.sched_setaffinity(tid, cores)
+            return cores
+        except Exception as exc:
+            print(f"⚠️  CPU governor: could not set CPU affinity: {exc}")
+            return None
+
+    # -----------------------
+    # Duty-Cycle (pro Scan)
+    # -----------------------
+    def throttle(self, interval: float) -> float:
+        """Scheduler interval → interval stretched until the measured utilization is back within budget."""
+        if self.applied.get('mode') == 'pending' and _ocr_mode() is not None:
+            self.apply()  # Reader ohne Warm-up gebaut (erster Scan)
+        now, cpu = self._clock(), self._cpu_clock()
+        with self._lock:
+            self._samples.append((now, cpu))
+            while len(self._samples) > 2 and self._samples[1][0] <= now - self.window_s:
+                self._samples.popleft()
+            if not self.active or len(self._samples) < 2:
+                return interval
+            wall = now - self._samples[0][0]
+            used = cpu - self._samples[0][1]
+            if wall <= 0:
+                return interval
+            self.utilization = used / (wall * self.cores)
+            self.decisions += 1
+            delay = 0.0
+            if self.utilization > self.budget:
+                # Wandzeit, ab der das Fenster wieder im Budget liegt
+                remaining = used / (self.budget * self.cores) - wall
+                delay = min(self.max_delay, max(0.0, remaining - interval))
+                self.throttled += 1
+            self.last_delay = delay
+            self.total_delay += delay
+            return interval + delay
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {
+                'active': self.active,
+                'mode': self.applied.get('mode'),
+                'budget': self.budget,
+                'utilization': self.utilization,
+                'thread_cap': self.thread_cap,
+                'threads': self.applied.get('threads'),
+                'nice': self.applied.get('nice'),
+                'cores': self.applied.get('cores'),
+                'throttled': self.throttled,
+                'throttle_rate': (self.throttled / self.decisions * 100) if self.decisions else 0.0,
+                'last_delay_ms': self.last_delay * 1000,
+                'avg_delay_ms': (self.total_delay / self.decisions * 1000) if self.decisions else 0.0,
+            }
+
+    def status_text(self) -> str:
+        """One-line German status for the GUI health panel."""
+        stats = self.get_stats()
+        if not stats['active']:
+            if stats['mode'] == 'GPU':
+                return "CPU-Governor: GPU-Modus (inaktiv)"
+            if stats['mode'] == 'pending':
+                return "CPU-Governor: wartet auf OCR-Engine"
+            return "CPU-Governor: wartet auf Start"
+        parts = [f"CPU {stats['utilization'] * 100:.0f}% / Budget {stats['budget'] * 100:.0f}%"]
+        if stats['threads']:
+            parts.append(f"{stats['threads']} Threads")
+        if stats['nice']:
+            parts.append(f"Prio {stats['nice']}")
+        if stats['cores']:
+            parts.append(f"Kerne {stats['cores'][0]}-{stats['cores'][-1]}")
+        if stats['last_delay_ms'] > 0:
+            parts.append(f"gedrosselt +{stats['last_delay_ms']:.0f}ms")
+        return "CPU-Governor: " + " · ".join(parts)
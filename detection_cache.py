@@ -0,0 +1,191 @@
+"""
+Detection Cache - EasyOCR-Textboxen über Frames wiederverwenden (nur Recognition)
+
+``readtext`` = CRAFT-Detektor (teuerste Stufe) + Recognizer. Das Marktfenster
+ändert sein Layout zwischen zwei Scans aber kaum: gleiche Zeilen an gleicher
+Stelle, nur der Text darin wechselt. Hier werden die Boxen aus
+``reader.detect`` pro Fenster-Geometrie (ROI-Shape) gecacht und auf
+Folge-Frames nur ``reader.recognize`` mit den gecachten Boxlisten aufgerufen.
+
+Neu detektiert wird, wenn
+1. der Layout-Fingerprint abweicht: Textbänder (Projektionsprofil wie in
+   line_band_ocr) verschoben/hinzugekommen, oder Text ragt rechts über die
+   bisherige Ausdehnung hinaus (Box würde abschneiden)
+2. ``invalidate()`` aufgerufen wurde (Change Gate: neue Referenz, Fensterwechsel)
+3. die Boxen ``max_reuse`` Frames in Folge wiederverwendet wurden (Sicherheitsnetz)
+
+Timing pro Frame (``last_timing``): fingerprint_ms, detect_ms, recognize_ms.
+
+``detect_boxes`` kann die Detektion auf einer verkleinerten Kopie laufen lassen
+(``EASYOCR_DETECT_SCALE``); die Boxen werden auf volle Auflösung zurückgerechnet,
+die Recognition sieht immer das volle Graubild.
+"""
+
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Optional
+
+import cv2
+import numpy as np
+
+from config import (
+    EASYOCR_DETECT_SCALE,
+    EASYOCR_BOX_REUSE_MAX_FRAMES,
+    EASYOCR_BOX_REUSE_Y_TOLERANCE,
+    EASYOCR_BOX_REUSE_X_MARGIN,
+    EASYOCR_BOX_REUSE_CACHE_SIZE,
+    LINE_BAND_EDGE_DELTA,
+)
+from line_band_ocr import segment_text_bands
+
+
+def layout_fingerprint(gray, edge_delta: int = LINE_BAND_EDGE_DELTA):
+    """Text bands with horizontal extent → int32 array ``(N, 4)`` of (y0, y1, x0, x1)."""
+    bands = segment_text_bands(gray)
+    if not bands:
+        return np.zeros((0, 4), dtype=np.int32)
+    signed = gray.astype(np.int16)
+    edges = np.abs(signed[:, 1:] - signed[:, :-1]) > edge_delta
+    rows = []
+    for y0, y1 in bands:
+        cols = np.flatnonzero(edges[y0:y1].any(axis=0))
+        x0, x1 = (int(cols[0]), int(cols[-1]) + 2) if cols.size else (0, 0)
+        rows.append((y0, y1, x0, x1))
+    return np.asarray(rows, dtype=np.int32)
+
+
+def detect_boxes(reader, rgb, detect_kwargs: dict, scale: float = EASYOCR_DETECT_SCALE):
+    """``reader.detect`` on ``rgb`` downscaled by ``scale`` → (horizontal, free) in full-resolution coordinates."""
+    if not 0.0 < scale < 1.0:
+        horizontal, free = reader.detect(rgb, **detect_kwargs)
+        return horizontal[0], free[0]
+    height, width = rgb.shape[:2]
+    small = cv2.resize(rgb, (max(1, round(width * scale)), max(1, round(height * scale))),
+                       interpolation=cv2.INTER_AREA)
+    kwargs = dict(detect_kwargs)
+    # min_size (Default 20 px) bezieht sich auf das Detektor-Bild
+    kwargs['min_size'] = max(1, int(round(kwargs.get('min_size', 20) * scale)))
+    horizontal, free = reader.detect(small, **kwargs)
+
+    inv = 1.0 / scale
+    # horizontal_list: [x_min, x_max, y_min, y_max]; nach außen runden, damit nichts abgeschnitten wird
+    horizontal = [[max(0, int(np.floor(x0 * inv))), min(width, int(np.ceil(x1 * inv))),
+                   max(0, int(np.floor(y0 * inv))), min(height, int(np.ceil(y1 * inv)))]
+                  for x0, x1, y0, y1 in horizontal[0]]
+    free = [[[float(x) * inv, float(y) * inv] for x, y in poly] for poly in free[0]]
+    return horizontal, free
+
+
+class DetectionBoxCache:
+    """Reuse EasyOCR detection boxes per ROI geometry while the text layout is unchanged."""
+
+    def __init__(self, max_reuse: int = EASYOCR_BOX_REUSE_MAX_FRAMES,
+                 y_tolerance: int = EASYOCR_BOX_REUSE_Y_TOLERANCE,
+                 x_margin: int = EASYOCR_BOX_REUSE_X_MARGIN,
+                 max_entries: int = EASYOCR_BOX_REUSE_CACHE_SIZE,
+                 timing_window: int = 120) -> None:
+        self.max_reuse = max(0, int(max_reuse))
+        self.y_tolerance = max(0, int(y_tolerance))
+        self.x_margin = max(0, int(x_margin))
+        self.max_entries = max(1, int(max_entries))
+        self._lock = threading.Lock()
+        # {shape: {'fingerprint', 'horizontal', 'free', 'reused'}}
+        self._entries: OrderedDict = OrderedDict()
+        self._timings: deque = deque(maxlen=max(1, int(timing_window)))
+        self.last_timing: dict = {}
+        self.detections = 0
+        self.reuses = 0
+        self.reasons: dict[str, int] = {}
+
+    def invalidate(self) -> None:
+        """Force detection on the next frame of every geometry."""
+        with self._lock:
+            self._entries.clear()
+
+    def _layout_matches(self, cached, current) -> bool:
+        if cached.shape != current.shape:
+            return False
+        if not len(current):
+            return True
+        # Zeilen an gleicher Stelle?
+        if np.abs(cached[:, :2] - current[:, :2]).max() > self.y_tolerance:
+            return False
+        # Text darf schrumpfen, aber nicht über die gecachte Ausdehnung hinauswachsen
+        return bool((current[:, 2] >= cached[:, 2] - self.x_margin).all()
+                    and (current[:, 3] <= cached[:, 3] + self.x_margin).all())
+
+    def _lookup(self, key, fingerprint) -> tuple[Optional[dict], str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None, "new_geometry"
+            if self.max_reuse and entry['reused'] >= self.max_reuse:
+                return None, "max_reuse"
+            if not self._layout_matches(entry['fingerprint'], fingerprint):
+                return None, "layout_changed"
+            entry['reused'] += 1
+            self._entries.move_to_end(key)
+            return entry, "reused"
+
+    def read(self, reader, rgb, gray, detect_kwargs: dict, recognize_kwargs: dict,
+             detect_scale: float = 1.0, box_filter=None):
+        """``readtext`` equivalent: cached boxes + ``reader.recognize`` when the layout allows it.
+
+        ``box_filter(horizontal) -> horizontal`` drops boxes right before recognition
+        (label mask); the cache keeps the unfiltered detection.
+        """
+        start = time.perf_counter()
+        fingerprint = layout_fingerprint(gray)
+        key = (*gray.shape[:2], float(detect_scale))
+        t = time.perf_counter()
+        timing = {'fingerprint_ms': (t - start) * 1000, 'detect_ms': 0.0}
+
+        entry, reason = self._lookup(key, fingerprint)
+        if entry is None:
+            horizontal, free = detect_boxes(reader, rgb, detect_kwargs, detect_scale)
+            t2 = time.perf_counter()
+            timing['detect_ms'] = (t2 - t) * 1000
+            t = t2
+            with self._lock:
+                self._entries[key] = {'fingerprint': fingerprint, 'horizontal': horizontal,
+                                      'free': free, 'reused': 0}
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                self.detections += 1
+        else:
+            horizontal, free = entry['horizontal'], entry['free']
+            with self._lock:
+                self.reuses += 1
+
+        if box_filter is not None:
+            horizontal = box_filter(horizontal)
+        if horizontal or free:
+            result = reader.recognize(gray, horizontal_list=horizontal, free_list=free, **recognize_kwargs)
+        else:
+            result = []
+        timing['recognize_ms'] = (time.perf_counter() - t) * 1000
+        timing['reused'] = entry is not None
+        timing['reason'] = reason
+        with self._lock:
+            self.reasons[reason] = self.reasons.get(reason, 0) + 1
+            self.last_timing = timing
+            self._timings.append(timing)
+        return result
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            timings = list(self._timings)
+            frames = self.detections + self.reuses
+            stats = {
+                'geometries': len(self._entries),
+                'detections': self.detections,
+                'reuses': self.reuses,
+                'reuse_rate': (self.reuses / frames * 100) if frames else 0.0,
+                'reasons': dict(self.reasons),
+            }
+        for key in ('fingerprint_ms', 'detect_ms', 'recognize_ms'):
+            values = [t[key] for t in timings if key != 'detect_ms' or not t['reused']]
+            stats[f'avg_{key}'] = (sum(values) / len(values)) if values else 0.0
+        return stats
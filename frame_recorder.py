@@ -0,0 +1,294 @@
+"""
+Frame Recorder - Aufzeichnung & deterministische Wiedergabe von Capture-Frames
+
+Container-Format (``.bdofr``, append-only, little-endian):
+
+    File-Header:  MAGIC (8 Bytes)
+    Chunk*:       CHUNK_HEADER | timestamps (float64 * n) | payload
+
+    CHUNK_HEADER = "<4sBxxxIIIIQ"
+        tag b"CHNK", codec (0 = raw, 1 = zlib), frame_count,
+        height, width, channels, payload_len
+
+Raw-Chunks sind direkt per mmap lesbar (Frames = zero-copy numpy Views),
+zlib-Chunks werden beim Zugriff dekomprimiert (kleiner LRU pro Reader).
+Ein abgebrochener letzter Chunk (Crash beim Schreiben) wird beim Lesen ignoriert.
+Kompression und Schreiben laufen in einem eigenen Writer-Thread (begrenzte
+Queue), der Capture-Thread kopiert nur den Frame.
+
+Verwendung:
+    recorder = FrameRecorder("session.bdofr", compression="zlib")
+    recorder.append(frame, captured_at)
+    recorder.close()
+
+    source = FrameReplaySource("session.bdofr", realtime=False)
+    tracker = MarketTracker(frame_source=source)
+"""
+
+import mmap
+import os
+import queue
+import struct
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Optional
+
+import numpy as np
+
+from config import FRAME_RECORDING_CHUNK_FRAMES, FRAME_RECORDING_COMPRESSION
+
+MAGIC = b"BDOFR01\x00"
+CHUNK_TAG = b"CHNK"
+_CHUNK_HEADER = struct.Struct("<4sBxxxIIIIQ")
+CODEC_RAW = 0
+CODEC_ZLIB = 1
+_CODECS = {None: CODEC_RAW, "none": CODEC_RAW, "raw": CODEC_RAW, "zlib": CODEC_ZLIB}
+
+
+class FrameRecorder:
+    """Append captured frames with capture timestamps to a chunked container file."""
+
+    def __init__(self, path: str, compression: Optional[str] = FRAME_RECORDING_COMPRESSION,
+                 chunk_frames: int = FRAME_RECORDING_CHUNK_FRAMES, zlib_level: int = 1,
+                 queue_chunks: int = 2) -> None:
+        key = compression.lower() if isinstance(compression, str) else compression
+        if key not in _CODECS:
+            raise ValueError(f"Unsupported compression: {compression!r}")
+        self.path = path
+        self.codec = _CODECS[key]
+        self.chunk_frames = max(1, int(chunk_frames))
+        self.zlib_level = int(zlib_level)
+        self.frames_written = 0
+        self.bytes_written = 0
+        self._lock = threading.Lock()
+        self._pending: list[bytes] = []
+        self._pending_ts: list[float] = []
+        self._pending_shape: Optional[tuple[int, int, int]] = None
+        self._closed = False
+
+        new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+        self._fh = open(path, "ab")
+        if new_file:
+            self._fh.write(MAGIC)
+            self.bytes_written += len(MAGIC)
+        # Volle Chunks → Writer-Thread; begrenzt, damit ein langsames Laufwerk den RAM nicht füllt
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, int(queue_chunks)))
+        self._writer = threading.Thread(target=self._write_loop, name="frame-recorder", daemon=True)
+        self._writer.start()
+
+    def append(self, frame, captured_at: Optional[float] = None) -> None:
+        """Copy ``frame`` (uint8, HxW or HxWxC) into the current chunk."""
+        if captured_at is None:
+            captured_at = time.time()
+        arr = np.ascontiguousarray(frame, dtype=np.uint8)
+        shape = (arr.shape[0], arr.shape[1], arr.shape[2] if arr.ndim == 3 else 1)
+        with self._lock:
+            if self._closed:
+                raise ValueError("FrameRecorder is closed")
+            if self._pending_shape is not None and shape != self._pending_shape:
+                self._submit_locked()
+            self._pending_shape = shape
+            self._pending.append(arr.tobytes())
+            self._pending_ts.append(float(captured_at))
+            if len(self._pending) >= self.chunk_frames:
+                self._submit_locked()
+
+    def flush(self) -> None:
+        """Hand the open chunk to the writer and wait until everything is on disk."""
+        with self._lock:
+            self._submit_locked()
+        self._queue.join()
+
+    def _submit_locked(self) -> None:
+        if not self._pending or self._closed:
+            return
+        # Blockiert nur, wenn der Writer ``queue_chunks`` Chunks hinterherhängt
+        self._queue.put((self._pending_shape, self._pending, self._pending_ts))
+        self._pending = []
+        self._pending_ts = []
+
+    def _write_loop(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                self._write_chunk(*item)
+            except Exception as exc:
+                print(f"⚠️  Frame recorder write error: {exc}")
+            finally:
+                self._queue.task_done()
+
+    def _write_chunk(self, shape, frames, timestamps) -> None:
+        height, width, channels = shape
+        payload = b"".join(frames)
+        if self.codec == CODEC_ZLIB:
+            payload = zlib.compress(payload, self.zlib_level)
+        ts_bytes = struct.pack(f"<{len(timestamps)}d", *timestamps)
+        header = _CHUNK_HEADER.pack(CHUNK_TAG, self.codec, len(frames),
+                                    height, width, channels, len(payload))
+        self._fh.write(header)
+        self._fh.write(ts_bytes)
+        self._fh.write(payload)
+        self._fh.flush()
+        self.frames_written += len(frames)
+        self.bytes_written += len(header) + len(ts_bytes) + len(payload)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._submit_locked()
+            self._closed = True
+        self._queue.put(None)
+        self._writer.join()
+        self._fh.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+
+class FrameRecording:
+    """Memory-mapped, random-access reader for a ``FrameRecorder`` container."""
+
+    def __init__(self, path: str, decoded_cache_chunks: int = 2) -> None:
+        self.path = path
+        self._fh = open(path, "rb")
+        size = os.fstat(self._fh.fileno()).st_size
+        if size < len(MAGIC):
+            self._fh.close()
+            raise ValueError(f"Not a frame recording: {path}")
+        self._mm = mmap.mmap(self._fh.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mm[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"Not a frame recording: {path}")
+        # chunk index: (first_frame, count, shape, codec, payload_offset, payload_len)
+        self._chunks: list[tuple[int, int, tuple[int, int, int], int, int, int]] = []
+        timestamps: list[float] = []
+        self._decoded: OrderedDict[int, bytes] = OrderedDict()
+        self._decoded_cache_chunks = max(1, int(decoded_cache_chunks))
+
+        offset = len(MAGIC)
+        while offset + _CHUNK_HEADER.size <= size:
+            tag, codec, count, height, width, channels, payload_len = _CHUNK_HEADER.unpack_from(self._mm, offset)
+            ts_offset = offset + _CHUNK_HEADER.size
+            payload_offset = ts_offset + 8 * count
+            if tag != CHUNK_TAG or payload_offset + payload_len > size:
+                break  # truncated/corrupt tail → ignore
+            timestamps.extend(struct.unpack_from(f"<{count}d", self._mm, ts_offset))
+            self._chunks.append((len(timestamps) - count, count, (height, width, channels),
+                                 codec, payload_offset, payload_len))
+            offset = payload_offset + payload_len
+        self.timestamps = timestamps
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def _locate(self, index: int):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        lo, hi = 0, len(self._chunks) - 1
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if self._chunks[mid][0] <= index:
+                lo = mid
+            else:
+                hi = mid - 1
+        return lo, index - self._chunks[lo][0]
+
+    def _chunk_buffer(self, chunk_idx: int):
+        _first, _count, _shape, codec, payload_offset, payload_len = self._chunks[chunk_idx]
+        if codec == CODEC_RAW:
+            return memoryview(self._mm)[payload_offset:payload_offset + payload_len]
+        cached = self._decoded.get(chunk_idx)
+        if cached is None:
+            cached = zlib.decompress(self._mm[payload_offset:payload_offset + payload_len])
+            self._decoded[chunk_idx] = cached
+            while len(self._decoded) > self._decoded_cache_chunks:
+                self._decoded.popitem(last=False)
+        else:
+            self._decoded.move_to_end(chunk_idx)
+        return cached
+
+    def frame(self, index: int):
+        """Return frame ``index`` (read-only array; zero-copy for raw chunks)."""
+        chunk_idx, local = self._locate(index)
+        _first, _count, (height, width, channels), _codec, _off, _len = self._chunks[chunk_idx]
+        frame_bytes = height * width * channels
+        buf = self._chunk_buffer(chunk_idx)
+        arr = np.frombuffer(buf, dtype=np.uint8, count=frame_bytes, offset=local * frame_bytes)
+        return arr.reshape((height, width) if channels == 1 else (height, width, channels))
+
+    def __getitem__(self, index: int):
+        return self.frame(index)
+
+    def close(self) -> None:
+        self._decoded.clear()
+        try:
+            self._mm.close()
+        except (BufferError, ValueError):
+            pass  # outstanding zero-copy views keep the map alive
+        self._fh.close()
+
+
+class FrameReplaySource:
+    """Drop-in replacement for ``capture_region`` that replays a recording.
+
+    ``realtime=True`` reproduces the recorded capture cadence (scaled by
+    ``speed``); ``realtime=False`` returns frames as fast as they are requested.
+    """
+
+    def __init__(self, path_or_recording, realtime: bool = True, speed: float = 1.0, loop: bool = False) -> None:
+        if isinstance(path_or_recording, FrameRecording):
+            self.recording = path_or_recording
+        else:
+            self.recording = FrameRecording(path_or_recording)
+        self.realtime = bool(realtime)
+        self.speed = max(1e-6, float(speed))
+        self.loop = bool(loop)
+        self.position = 0
+        self.exhausted = len(self.recording) == 0
+        self._start_wall: Optional[float] = None
+        self._start_ts: Optional[float] = None
+        self.last_captured_at: Optional[float] = None
+
+    def __call__(self, _region=None):
+        return self.capture(_region)
+
+    def capture(self, _region=None):
+        """Return the next recorded frame (region is ignored) or None when exhausted."""
+        if self.position >= len(self.recording):
+            if not self.loop or len(self.recording) == 0:
+                self.exhausted = True
+                return None
+            self.position = 0
+            self._start_wall = None
+
+        ts = self.recording.timestamps[self.position]
+        if self.realtime:
+            now = time.perf_counter()
+            if self._start_wall is None:
+                self._start_wall, self._start_ts = now, ts
+            due = self._start_wall + (ts - self._start_ts) / self.speed
+            if due > now:
+                time.sleep(due - now)
+
+        frame = self.recording.frame(self.position)
+        self.position += 1
+        self.last_captured_at = ts
+        return frame
+
+    def rewind(self) -> None:
+        self.position = 0
+        self.exhausted = len(self.recording) == 0
+        self._start_wall = None
+
+    def close(self) -> None:
+        self.recording.close()
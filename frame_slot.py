@@ -0,0 +1,125 @@
+"""
+Latest Frame Slot - Double Buffer zwischen Capture- und OCR-Threads
+
+Ersetzt die asyncio.Queue(maxsize=1) der Async-Pipeline. Eine Queue liefert
+FIFO - für Echtzeit-Tracking ist aber nur der NEUESTE Frame relevant:
+
+- Capture-Thread überschreibt den Slot (blockiert nie, auch wenn OCR hängt)
+- Ein nicht abgeholter Frame wird dabei verdrängt (superseded) statt gestaut
+- OCR-Worker holen immer den aktuellsten Frame; ``take`` leert den Slot, jeder
+  Frame wird also höchstens einmal geholt
+
+Double Buffer: der Slot hält den neuesten Frame, der Worker den gerade
+verarbeiteten - beide getrennt, Capture und OCR laufen ohne gegenseitiges
+Warten. Zusätzlich wird das Alter jedes Frames beim OCR-Start gemessen
+(Capture → OCR-Beginn).
+
+Frames aus dem Capture-Ring werden beim ``publish`` (unter dem Slot-Lock)
+per ``lease`` geschützt. Verdrängte/verworfene Frames gibt der Slot wieder
+frei; mit ``take`` geht der Lease an den Worker über, der ``release``
+nach der OCR aufruft.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Callable, NamedTuple, Optional
+
+
+class FrameTicket(NamedTuple):
+    seq: int
+    image: object
+    captured_at: float
+    age_ms: float
+
+
+class LatestFrameSlot:
+    """Lock-protected latest-value slot; writers overwrite, readers take the freshest frame."""
+
+    def __init__(self, age_window: int = 120,
+                 lease: Optional[Callable[[object], None]] = None,
+                 release: Optional[Callable[[object], None]] = None) -> None:
+        self._lease = lease
+        self._release = release
+        self._cond = threading.Condition(threading.Lock())
+        self._front: Optional[tuple[int, object, float]] = None
+        self._seq = 0
+        self._taken_seq = 0  # nur Statistik (last_taken_seq)
+        self._closed = False
+        self.published = 0
+        self.taken = 0
+        self.superseded = 0
+        self._ages_ms: deque = deque(maxlen=max(1, int(age_window)))
+
+    def publish(self, image, captured_at: Optional[float] = None) -> int:
+        """Store ``image`` as the latest frame and wake one waiting reader. Returns its sequence."""
+        if captured_at is None:
+            captured_at = time.perf_counter()
+        with self._cond:
+            if self._lease is not None:
+                self._lease(image)
+            self._seq += 1
+            if self._front is not None:
+                # Vorheriger Frame wurde nie abgeholt → verdrängt
+                self.superseded += 1
+                self._drop_locked()
+            self._front = (self._seq, image, captured_at)
+            self.published += 1
+            self._cond.notify()
+            return self._seq
+
+    def take(self, timeout: Optional[float] = None) -> Optional[FrameTicket]:
+        """Wait for the next published frame and empty the slot; ``None`` on timeout or close.
+
+        The frame's lease (if any) is handed over to the caller.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._front is None and not self._closed:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return None
+                self._cond.wait(remaining)
+            if self._front is None:
+                return None
+            seq, image, captured_at = self._front
+            self._front = None
+            self._taken_seq = seq
+            self.taken += 1
+            age_ms = (time.perf_counter() - captured_at) * 1000
+            self._ages_ms.append(age_ms)
+        return FrameTicket(seq, image, captured_at, age_ms)
+
+    def close(self) -> None:
+        """Wake all readers; pending frames are dropped."""
+        with self._cond:
+            self._closed = True
+            if self._front is not None:
+                self._drop_locked()
+            self._cond.notify_all()
+
+    def _drop_locked(self) -> None:
+        _seq, image, _captured_at = self._front
+        self._front = None
+        if self._release is not None:
+            self._release(image)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def get_stats(self) -> dict:
+        """Published/taken/superseded counters plus frame age at OCR start (ms)."""
+        with self._cond:
+            ages = sorted(self._ages_ms)
+            stats = {
+                'published': self.published,
+                'taken': self.taken,
+                'superseded': self.superseded,
+                'last_seq': self._seq,
+                'last_taken_seq': self._taken_seq,
+            }
+        stats['age_p50_ms'] = ages[len(ages) // 2] if ages else 0.0
+        stats['age_max_ms'] = ages[-1] if ages else 0.0
+        stats['supersede_rate'] = (self.superseded / stats['published'] * 100) if stats['published'] else 0.0
+        return stats
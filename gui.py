@@ -6,7 +6,7 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import datetime
 from utils import log_debug 
-import torch
+from ocr_registry import get_registry
 
 from tracker import MarketTracker
 from config import (
@@ -27,7 +27,9 @@ from database import conn, get_connection
 def start_gui():
     tracker = MarketTracker(debug=get_debug_mode(True))
 
-    mode = "GPU" if torch.cuda.is_available() else "CPU"
+    # OCR-Modelle im Hintergrund laden, während das Fenster aufgebaut wird
+    ocr_registry = get_registry()
+    ocr_registry.warmup()
     root = tk.Tk()
     root.title("BDO Market Tracker")
     root.geometry("640x760")
@@ -53,7 +55,8 @@ def start_gui():
     status_var = tk.StringVar(value="Status: Idle")
     health_status_var = tk.StringVar(value="🟢 Healthy")
     window_status_var = tk.StringVar(value="Fenster: -")
-    mode_var = tk.StringVar(value=f"Modus: {mode}")
+    mode_var = tk.StringVar(value="Modus: OCR lädt...")
+    governor_var = tk.StringVar(value="CPU-Governor: aus")
 
     def _parse_region(value: str) -> tuple[int, int, int, int] | None:
         try:
@@ -210,7 +213,10 @@ def start_gui():
     health_label = tk.Label(status_frame, textvariable=health_status_var, font=("Segoe UI", 11, "bold"))
     health_label.pack(anchor="w")
     tk.Label(status_frame, textvariable=window_status_var, fg="#1a4d8f").pack(anchor="w", pady=(2, 0))
-    tk.Label(status_frame, textvariable=mode_var, fg="#666" if mode == "CPU" else "#00aaff").pack(anchor="w", pady=(2, 0))
+    mode_label = tk.Label(status_frame, textvariable=mode_var, fg="#666")
+    mode_label.pack(anchor="w", pady=(2, 0))
+    governor_label = tk.Label(status_frame, textvariable=governor_var, fg="#666")
+    governor_label.pack(anchor="w", pady=(2, 0))
     
     def update_health_status():
         """Update health status display every 500ms"""
@@ -239,6 +245,26 @@ def start_gui():
                     window_status_var.set("Window: scanning...")
             else:
                 window_status_var.set("Window: idle")
+
+            # OCR-Engine-Status aus der Registry (Warm-up läuft im Hintergrund)
+            engine = ocr_registry.status().get('easyocr', {})
+            if engine.get('state') == 'ready':
+                mode = engine.get('mode') or "CPU"
+                mode_var.set(f"Modus: {mode} (OCR bereit in {engine.get('load_s') or 0:.1f}s)")
+                mode_label.config(fg="#00aaff" if mode == "GPU" else "#666")
+            elif engine.get('state') == 'failed':
+                mode_var.set("Modus: EasyOCR nicht verfügbar")
+                mode_label.config(fg="red")
+            else:
+                mode_var.set("Modus: OCR lädt...")
+
+            # CPU-Governor: Budget, Limits und Drosselung (nur CPU-Modus)
+            governor = getattr(tracker, 'cpu_governor', None)
+            if governor is None:
+                governor_var.set("CPU-Governor: aus")
+            else:
+                governor_var.set(governor.status_text())
+                governor_label.config(fg="orange" if governor.last_delay > 0 else "#666")
                 
         except Exception:
             pass
@@ -624,7 +650,7 @@ def start_gui():
 
     def on_close():
         try:
-            tracker.stop()
+            tracker.close()
             time.sleep(0.1)
         finally:
             try:
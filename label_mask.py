@@ -0,0 +1,179 @@
+"""
+Label Mask - Statische UI-Beschriftungen vor der Recognition ausblenden
+
+Jeder Scan schickt Boxen durch den Recognizer, deren Text sich nie ändert:
+"Collect", "Re-list", "Orders Completed", "Warehouse Capacity", das Suchfeld
+("Enter a search term"), "VT", "Balance". ``_strip_ui_collect_tail`` und die
+``looks_like_ui``-Filter in ``split_text_into_log_entries`` entfernen sie danach
+wieder. Hier:
+
+1. Lernen: erkannte Spans, deren Text (normalisiert) einem bekannten Label
+   entspricht, pro (Fenstertyp, ROI-Shape) mit Box merken
+2. Nach ``min_hits`` Treffern an gleicher Stelle (IoU ≥ ``iou``) ist die Maske aktiv
+3. ``split``: detektierte Boxen, die eine aktive Maske überdecken, gehen nicht
+   in die Recognition; Labels, die Parser/``detect_window_type`` brauchen,
+   kommen als synthetisches Token (Engine 'label') zurück, der Rest entfällt
+4. Sicherheitsnetz: jeder ``verify_interval``-te Frame erkennt alle Boxen; steht
+   an einer maskierten Stelle ein anderer Text, wird die Maske verworfen
+
+Braucht eine Box + Text pro Span (EasyOCR paragraph=False).
+"""
+
+import re
+import threading
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from config import (
+    UI_LABEL_MASK_LABELS,
+    UI_LABEL_MASK_PASS_THROUGH,
+    UI_LABEL_MASK_WINDOWS,
+    UI_LABEL_MASK_MIN_HITS,
+    UI_LABEL_MASK_IOU,
+    UI_LABEL_MASK_VERIFY_INTERVAL,
+)
+
+
+def normalize_label(text: str) -> str:
+    """'Re- list' / 're-list' / 'Relist' → 'relist'."""
+    return re.sub(r"[^a-z0-9]", "", (text or "").lower())
+
+
+def box_iou(a, b) -> float:
+    """IoU of two (x0, y0, x1, y1) boxes."""
+    ix = min(a[2], b[2]) - max(a[0], b[0])
+    iy = min(a[3], b[3]) - max(a[1], b[1])
+    if ix <= 0 or iy <= 0:
+        return 0.0
+    inter = ix * iy
+    union = (a[2] - a[0]) * (a[3] - a[1]) + (b[2] - b[0]) * (b[3] - b[1]) - inter
+    return inter / union if union > 0 else 0.0
+
+
+def _quad_box(quad) -> Tuple[float, float, float, float]:
+    pts = np.asarray(quad, dtype=np.float32).reshape(-1, 2)
+    x0, y0 = pts.min(axis=0)
+    x1, y1 = pts.max(axis=0)
+    return float(x0), float(y0), float(x1), float(y1)
+
+
+class StaticLabelMask:
+    """Learn static UI label boxes per window type and drop them before recognition."""
+
+    def __init__(self, labels: Sequence[str] = UI_LABEL_MASK_LABELS,
+                 pass_through: Sequence[str] = UI_LABEL_MASK_PASS_THROUGH,
+                 windows: Sequence[str] = UI_LABEL_MASK_WINDOWS,
+                 min_hits: int = UI_LABEL_MASK_MIN_HITS,
+                 iou: float = UI_LABEL_MASK_IOU,
+                 verify_interval: int = UI_LABEL_MASK_VERIFY_INTERVAL) -> None:
+        self._labels = {normalize_label(label): label for label in labels}
+        self._pass_through = {normalize_label(label) for label in pass_through}
+        self.windows = tuple(windows)
+        self.min_hits = max(1, int(min_hits))
+        self.iou = float(iou)
+        self.verify_interval = max(0, int(verify_interval))
+        self._lock = threading.Lock()
+        # {key: [{'box', 'label', 'hits', 'conf'}]}
+        self._masks: dict = {}
+        self._frames: dict = {}
+        self.frames = 0
+        self.boxes = 0
+        self.masked = 0
+        self.passed = 0
+        self.verifications = 0
+        self.invalidated = 0
+        self.last_masked = 0
+
+    def key(self, window_type: Optional[str], shape) -> Optional[tuple]:
+        """Mask key for a ROI of ``shape`` in ``window_type`` (None = window not maskable)."""
+        if window_type not in self.windows:
+            return None
+        return (window_type, int(shape[0]), int(shape[1]))
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._masks.clear()
+            self._frames.clear()
+
+    def _find(self, entries, box) -> Optional[dict]:
+        best, best_iou = None, self.iou
+        for entry in entries:
+            overlap = box_iou(entry['box'], box)
+            if overlap >= best_iou:
+                best, best_iou = entry, overlap
+        return best
+
+    def split(self, key, horizontal) -> Tuple[list, List[tuple]]:
+        """Detected ``[x_min, x_max, y_min, y_max]`` boxes → (boxes to recognize, synthetic label entries)."""
+        self.last_masked = 0
+        if key is None:
+            return horizontal, []
+        with self._lock:
+            frame = self._frames.get(key, 0) + 1
+            self._frames[key] = frame
+            self.frames += 1
+            self.boxes += len(horizontal)
+            active = [m for m in self._masks.get(key, ()) if m['hits'] >= self.min_hits]
+            if not active:
+                return horizontal, []
+            if self.verify_interval and frame % self.verify_interval == 0:
+                self.verifications += 1
+                return horizontal, []
+
+            kept, synthetic = [], []
+            for det in horizontal:
+                x0, x1, y0, y1 = det
+                mask = self._find(active, (x0, y0, x1, y1))
+                if mask is None:
+                    kept.append(det)
+                    continue
+                self.masked += 1
+                self.last_masked += 1
+                if normalize_label(mask['label']) in self._pass_through:
+                    self.passed += 1
+                    quad = [[x0, y0], [x1, y0], [x1, y1], [x0, y1]]
+                    synthetic.append((quad, mask['label'], mask['conf']))
+            return kept, synthetic
+
+    def observe(self, key, entries) -> None:
+        """Learn/verify from recognizer output ``(quad, text, conf)`` of the same frame."""
+        if key is None:
+            return
+        with self._lock:
+            masks = self._masks.setdefault(key, [])
+            for entry in entries:
+                if len(entry) != 3:
+                    continue
+                quad, text, conf = entry
+                box = _quad_box(quad)
+                mask = self._find(masks, box)
+                label = self._labels.get(normalize_label(text))
+                if label is None or (mask is not None and mask['label'] != label):
+                    # Anderer Text an einer (gelernten) Label-Stelle → Maske verwerfen
+                    if mask is not None:
+                        self.invalidated += int(mask['hits'] >= self.min_hits)
+                        masks.remove(mask)
+                    if label is None:
+                        continue
+                    mask = None
+                if mask is None:
+                    masks.append({'box': box, 'label': label, 'hits': 1, 'conf': float(conf)})
+                else:
+                    mask['hits'] += 1
+                    mask['box'] = box
+                    mask['conf'] = (mask['conf'] + float(conf)) / 2
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            active = sum(m['hits'] >= self.min_hits for masks in self._masks.values() for m in masks)
+            return {
+                'frames': self.frames,
+                'active_masks': active,
+                'boxes': self.boxes,
+                'masked_boxes': self.masked,
+                'mask_rate': (self.masked / self.boxes * 100) if self.boxes else 0.0,
+                'passed_through': self.passed,
+                'verifications': self.verifications,
+                'invalidated': self.invalidated,
+            }
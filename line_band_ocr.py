@@ -0,0 +1,181 @@
+"""
+Line-Band OCR - Zeilenweiser OCR-Cache für das Transaction-Log
+
+Das Marktfenster ist ein Stapel aus Textzeilen. Kommt eine neue Transaktion,
+erscheint oben EINE neue Zeile und der Rest rutscht nach unten - der Inhalt der
+übrigen Zeilen bleibt pixelgleich. Statt die komplette ROI neu zu erkennen:
+
+1. Preprocessed ROI per horizontalem Projektionsprofil (Kanten pro Pixelzeile)
+   in Textbänder zerlegen
+2. Jeden Band-Crop hashen (BLAKE2b über Pixel + Shape)
+3. Nur Cache-Misses durch die OCR-Engine schicken (optional gesammelt als ein
+   Batch, siehe ocr_engines.recognize_batch)
+4. Erkannte Zeilen in Bildreihenfolge wieder zusammensetzen
+
+OCR-Kosten skalieren damit mit der Anzahl GEÄNDERTER Zeilen statt mit der
+Fenstergröße. Verschobene Zeilen sind Cache-Hits (Hash ist positionsunabhängig).
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+from config import (
+    LINE_BAND_EDGE_DELTA,
+    LINE_BAND_MIN_EDGE_PIXELS,
+    LINE_BAND_MIN_HEIGHT,
+    LINE_BAND_GAP_TOLERANCE,
+    LINE_BAND_MARGIN,
+    LINE_BAND_CACHE_SIZE,
+)
+
+# recognize_fn(crop) -> (texts, confidences)
+RecognizeFn = Callable[[object], Tuple[List[str], List[float]]]
+# batch_fn([crop, ...]) -> [(texts, confidences), ...] in Crop-Reihenfolge
+BatchRecognizeFn = Callable[[List[object]], List[Tuple[List[str], List[float]]]]
+
+
+def segment_text_bands(gray,
+                       edge_delta: int = LINE_BAND_EDGE_DELTA,
+                       min_edge_pixels: int = LINE_BAND_MIN_EDGE_PIXELS,
+                       min_height: int = LINE_BAND_MIN_HEIGHT,
+                       gap_tolerance: int = LINE_BAND_GAP_TOLERANCE,
+                       margin: int = LINE_BAND_MARGIN) -> List[Tuple[int, int]]:
+    """Split a grayscale image into horizontal text bands ``[(y_start, y_end), ...]``.
+
+    Projektionsprofil = Anzahl starker horizontaler Kanten pro Pixelzeile.
+    Text erzeugt viele Hell/Dunkel-Wechsel, flächige UI-Hintergründe kaum.
+    """
+    if gray is None or gray.ndim != 2 or gray.shape[0] == 0 or gray.shape[1] < 2:
+        return []
+    height = gray.shape[0]
+    signed = gray.astype(np.int16)
+    edges = np.abs(signed[:, 1:] - signed[:, :-1]) > edge_delta
+    profile = np.count_nonzero(edges, axis=1)
+    is_text = profile >= min_edge_pixels
+
+    bands: List[Tuple[int, int]] = []
+    start: Optional[int] = None
+    gap = 0
+    for y in range(height):
+        if is_text[y]:
+            if start is None:
+                start = y
+            gap = 0
+        elif start is not None:
+            gap += 1
+            if gap > gap_tolerance:
+                bands.append((start, y - gap + 1))
+                start = None
+                gap = 0
+    if start is not None:
+        bands.append((start, height - gap))
+
+    result: List[Tuple[int, int]] = []
+    for y0, y1 in bands:
+        if y1 - y0 < min_height:
+            continue
+        y0, y1 = max(0, y0 - margin), min(height, y1 + margin)
+        if result and y0 <= result[-1][1]:
+            # Überlappung durch Margin → Bänder verschmelzen
+            result[-1] = (result[-1][0], y1)
+        else:
+            result.append((y0, y1))
+    return result
+
+
+class LineBandCache:
+    """Recognize text bands on cache miss only; reassemble rows in image order."""
+
+    def __init__(self, max_entries: int = LINE_BAND_CACHE_SIZE) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self._entries: "OrderedDict[str, tuple[list[str], list[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.frames = 0
+        self.last_band_count = 0
+        self.last_miss_count = 0
+
+    @staticmethod
+    def _band_key(crop) -> str:
+        h = hashlib.blake2b(digest_size=16)
+        h.update(np.ascontiguousarray(crop).tobytes())
+        h.update(repr(crop.shape).encode("ascii"))
+        return h.hexdigest()
+
+    def recognize(self, gray, recognize_fn: RecognizeFn,
+                  batch_fn: Optional[BatchRecognizeFn] = None) -> Tuple[List[str], List[float]]:
+        """Return (row_texts, confidences) for ``gray`` using per-band caching.
+
+        With ``batch_fn`` all missed bands of the frame go through the recognizer
+        in one call instead of one ``recognize_fn`` call per band.
+
+        Returns ``([], [])`` when no text band could be segmented so the caller
+        can fall back to full-frame OCR.
+        """
+        bands = segment_text_bands(gray)
+        self.frames += 1
+        self.last_band_count = len(bands)
+        self.last_miss_count = 0
+        if not bands:
+            return [], []
+
+        rows: list = []
+        missed: List[Tuple[int, str, object]] = []
+        for y0, y1 in bands:
+            crop = gray[y0:y1]
+            key = self._band_key(crop)
+            with self._lock:
+                cached = self._entries.get(key)
+                if cached is not None:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+            if cached is None:
+                missed.append((len(rows), key, crop))
+            rows.append(cached)
+
+        if missed:
+            crops = [crop for _, _, crop in missed]
+            if batch_fn is not None:
+                recognized = batch_fn(crops)
+            else:
+                recognized = [recognize_fn(crop) for crop in crops]
+            with self._lock:
+                for (idx, key, _), (band_texts, band_confs) in zip(missed, recognized):
+                    rows[idx] = (list(band_texts), list(band_confs))
+                    self.misses += 1
+                    self.last_miss_count += 1
+                    self._entries[key] = rows[idx]
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+
+        texts: List[str] = []
+        confidences: List[float] = []
+        for row_texts, row_confs in rows:
+            row = " ".join(t for t in row_texts if t)
+            if row:
+                texts.append(row)
+            confidences.extend(row_confs)
+        return texts, confidences
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            size = len(self._entries)
+        lookups = self.hits + self.misses
+        return {
+            'frames': self.frames,
+            'band_hits': self.hits,
+            'band_misses': self.misses,
+            'band_hit_rate': (self.hits / lookups * 100) if lookups else 0.0,
+            'cached_bands': size,
+            'last_band_count': self.last_band_count,
+            'last_miss_count': self.last_miss_count,
+        }
@@ -0,0 +1,195 @@
+"""
+OCR Autotune - EasyOCR-Parameter und Torch-Threads pro Rechner messen statt raten
+
+``extract_text`` nutzt fest eingetragene EasyOCR-Parameter (canvas_size,
+text_threshold, low_text, link_threshold, paragraph, batch_size); die
+Kommentare in config.py dokumentieren Handmessungen ("~99 scans/min",
+"1.5s → 0.5s"), die auf jedem Rechner anders ausfallen. Hier:
+
+1. Gelabeltes Frame-Set: Aufnahme (.bdofr) + JSON mit den erwarteten
+   Transaktionen pro Frame (``make_labels`` erzeugt einen Entwurf aus der
+   aktuellen Konfiguration, der von Hand korrigiert wird)
+2. Stufe 1: jede Parameter-Kombination aus ``OCR_AUTOTUNE_GRID`` über alle
+   Frames → Median-Latenz + Transaktions-F1 über die geparsten Log-Einträge
+   (Typ, Item, Menge, Preis, Timestamp wie in process_ocr_text)
+3. Stufe 2: nur die Pareto-Front (keine andere Konfig schneller UND genauer)
+   mit jeder Thread-Zahl - Threads ändern die Latenz, nicht das Ergebnis
+4. Auswahl: schnellste Konfig der Front mit F1 ≥ bestes F1 - ``tolerance``;
+   gespeichert in tracker_settings ('ocr_tuning'), ``utils.apply_ocr_tuning``
+   bzw. der EasyOCR-Builder übernehmen sie beim nächsten Start
+
+Aufruf: ``scripts/autotune_ocr.py``.
+"""
+
+import datetime
+import itertools
+import os
+import platform
+import statistics
+import time
+from collections import Counter
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+from config import OCR_AUTOTUNE_GRID, OCR_AUTOTUNE_ACCURACY_TOLERANCE
+
+# evaluate(frames, params, threads) -> (latencies_ms, texts)
+EvaluateFn = Callable[[Sequence[object], dict, int], tuple]
+
+
+def default_threads() -> List[int]:
+    """Thread counts worth trying on this host: 1, 2, half and all cores."""
+    cores = os.cpu_count() or 1
+    return sorted({1, min(2, cores), max(1, cores // 2), cores})
+
+
+def iter_grid(grid: Dict[str, Iterable] = OCR_AUTOTUNE_GRID) -> List[dict]:
+    keys = list(grid)
+    return [dict(zip(keys, values)) for values in itertools.product(*(tuple(grid[k]) for k in keys))]
+
+
+def transaction_keys(text: str) -> List[list]:
+    """OCR text → transaction tuples ``[type, item, qty, price, timestamp]`` as the tracker parses them."""
+    from parsing import extract_details_from_entry, split_text_into_log_entries
+
+    keys = []
+    for _pos, ts_text, snippet in split_text_into_log_entries(text or ""):
+        details = extract_details_from_entry(ts_text, snippet)
+        if not details.get('timestamp') or details.get('type') in (None, 'other'):
+            continue
+        keys.append([
+            details.get('type'),
+            (details.get('item') or '').lower(),
+            details.get('qty'),
+            details.get('price'),
+            details['timestamp'].isoformat(),
+        ])
+    return keys
+
+
+def score(predicted: Sequence[Sequence[list]], labels: Sequence[Sequence[list]]) -> dict:
+    """Micro precision/recall/F1 of predicted vs. labeled transactions over all frames."""
+    tp = pred_total = label_total = 0
+    for pred, label in zip(predicted, labels):
+        pred_counts = Counter(tuple(k) for k in pred)
+        label_counts = Counter(tuple(k) for k in label)
+        tp += sum((pred_counts & label_counts).values())
+        pred_total += sum(pred_counts.values())
+        label_total += sum(label_counts.values())
+    precision = tp / pred_total if pred_total else (1.0 if not label_total else 0.0)
+    recall = tp / label_total if label_total else 1.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    return {'precision': precision, 'recall': recall, 'f1': f1}
+
+
+def pareto_front(results: Sequence[dict]) -> List[dict]:
+    """Results not dominated in (lower ``latency_ms``, higher ``f1``), fastest first."""
+    front = []
+    for cand in results:
+        dominated = any(
+            other['latency_ms'] <= cand['latency_ms'] and other['f1'] >= cand['f1']
+            and (other['latency_ms'] < cand['latency_ms'] or other['f1'] > cand['f1'])
+            for other in results
+        )
+        if not dominated:
+            front.append(cand)
+    return sorted(front, key=lambda r: r['latency_ms'])
+
+
+def select_config(results: Sequence[dict], tolerance: float = OCR_AUTOTUNE_ACCURACY_TOLERANCE) -> Optional[dict]:
+    """Fastest Pareto-front result within ``tolerance`` F1 of the most accurate one."""
+    front = pareto_front(results)
+    if not front:
+        return None
+    best_f1 = max(r['f1'] for r in front)
+    return min((r for r in front if r['f1'] >= best_f1 - tolerance), key=lambda r: r['latency_ms'])
+
+
+def evaluate_easyocr(frames: Sequence[object], params: dict, threads: int) -> tuple:
+    """Default evaluator: preprocess + ``extract_text`` (EasyOCR) per frame with ``params`` applied."""
+    import utils
+    from ocr_registry import set_torch_threads
+    from preprocess_pipeline import get_default_pipeline
+
+    set_torch_threads(threads)
+    utils.apply_ocr_tuning({'params': params})
+    pipeline = get_default_pipeline()
+    latencies, texts = [], []
+    for frame in frames:
+        proc = pipeline.run(frame, adaptive=True, denoise=False, fast_mode=False, reuse_output=False)
+        start = time.perf_counter()
+        texts.append(utils.extract_text(proc, use_roi=True, method='easyocr'))
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies, texts
+
+
+def make_labels(frames: Sequence[object], evaluate: EvaluateFn = evaluate_easyocr,
+                params: Optional[dict] = None, threads: Optional[int] = None) -> List[List[list]]:
+    """Label draft: transactions parsed with the current/given parameters (review before tuning!)."""
+    _latencies, texts = evaluate(frames, params or {}, threads or (os.cpu_count() or 1))
+    return [transaction_keys(text) for text in texts]
+
+
+def _measure(frames, labels, params, threads, evaluate) -> dict:
+    latencies, texts = evaluate(frames, params, threads)
+    result = score([transaction_keys(t) for t in texts], labels)
+    ordered = sorted(latencies)
+    result.update({
+        'params': dict(params),
+        'torch_threads': int(threads),
+        'latency_ms': statistics.median(latencies) if latencies else 0.0,
+        'p95_ms': ordered[max(0, int(len(ordered) * 0.95) - 1)] if ordered else 0.0,
+    })
+    return result
+
+
+def run_autotune(frames: Sequence[object], labels: Sequence[Sequence[list]],
+                 grid: Dict[str, Iterable] = OCR_AUTOTUNE_GRID,
+                 threads: Optional[Sequence[int]] = None,
+                 evaluate: EvaluateFn = evaluate_easyocr,
+                 tolerance: float = OCR_AUTOTUNE_ACCURACY_TOLERANCE,
+                 progress: Optional[Callable[[dict], None]] = None) -> dict:
+    """Two-stage grid search → {'best', 'front', 'results'} (nothing persisted)."""
+    if len(labels) != len(frames):
+        raise ValueError(f"{len(labels)} labels for {len(frames)} frames")
+    threads = list(threads or default_threads())
+    base_threads = max(threads)
+
+    # Stufe 1: Engine-Parameter (Genauigkeit + Latenz) bei voller Thread-Zahl
+    stage1 = []
+    for params in iter_grid(grid):
+        result = _measure(frames, labels, params, base_threads, evaluate)
+        stage1.append(result)
+        if progress:
+            progress(result)
+
+    # Stufe 2: Thread-Zahlen nur für die Pareto-Front (F1 bleibt gleich)
+    results = list(stage1)
+    for cand in pareto_front(stage1):
+        for count in threads:
+            if count == base_threads:
+                continue
+            result = _measure(frames, labels, cand['params'], count, evaluate)
+            results.append(result)
+            if progress:
+                progress(result)
+
+    return {'best': select_config(results, tolerance), 'front': pareto_front(results), 'results': results}
+
+
+def persist_tuning(best: dict) -> dict:
+    """Store ``best`` (from ``run_autotune``) in tracker_settings and apply it in this process."""
+    from config import set_ocr_tuning
+    import utils
+
+    tuning = {
+        'params': dict(best['params']),
+        'torch_threads': int(best['torch_threads']),
+        'latency_ms': round(float(best['latency_ms']), 1),
+        'f1': round(float(best['f1']), 4),
+        'host': platform.node(),
+        'cpu_count': os.cpu_count(),
+        'tuned_at': datetime.datetime.now().isoformat(timespec='seconds'),
+    }
+    set_ocr_tuning(tuning)
+    utils.apply_ocr_tuning(tuning)
+    return tuning
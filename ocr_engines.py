@@ -10,15 +10,30 @@ Unterstützt mehrere OCR-Engines:
 Features:
 - Einheitliches Interface für alle Engines
 - GPU-Support (optional)
-- Automatischer Fallback bei Fehlern
+- Automatischer Fallback bei Fehlern (sequentiell oder als Race mit Deadline)
 - Performance-Optimiert
+- Batched Recognition für Zeilen-/Feld-Crops (recognize_batch)
 """
 
+import math
 import re
+import threading
+import time
 import numpy as np
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from typing import Optional, List, Tuple
 from functools import lru_cache
 
+from config import (
+    OCR_RECOGNIZE_BATCH_SIZE,
+    OCR_RACE_ENABLED,
+    OCR_RACE_DEADLINE_S,
+    OCR_RACE_MIN_CONFIDENCE,
+    TESSERACT_BACKEND,
+)
+from ocr_result import OcrResult, has_timestamp
+
 
 # -----------------------
 # Engine Initialization Status
@@ -116,19 +131,20 @@ def init_easyocr(use_gpu: bool = False, lang: List[str] = None) -> bool:
         return False
 
 
-def ocr_with_paddle(img, confidence_threshold: float = 0.5) -> List[Tuple[str, float]]:
+def ocr_with_paddle(img, confidence_threshold: float = 0.5, structured: bool = False):
     """
     OCR mit PaddleOCR (optimiert für Game-UI).
     
     Args:
         img: Input image (numpy array oder PIL Image)
         confidence_threshold: Minimum confidence score (0-1) - default 0.5 für höhere Qualität
+        structured: OcrResult (Text/Box/Konfidenz pro Zeile) statt Tupel-Liste zurückgeben
         
     Returns:
-        Liste von (text, confidence) Tupeln
+        Liste von (text, confidence) Tupeln (bzw. OcrResult)
     """
     if not _paddle_available or _paddle_reader is None:
-        return []
+        return OcrResult([]) if structured else []
     
     try:
         # PaddleOCR bevorzugt RGB-Bilder (nicht Grayscale)
@@ -149,7 +165,7 @@ def ocr_with_paddle(img, confidence_threshold: float = 0.5) -> List[Tuple[str, f
         result = _paddle_reader.ocr(img)
         
         if not result or not result[0]:
-            return []
+            return OcrResult([]) if structured else []
         
         # Format: [([[x1,y1],[x2,y2],[x3,y3],[x4,y4]], (text, confidence))]
         parsed = []
@@ -161,28 +177,31 @@ def ocr_with_paddle(img, confidence_threshold: float = 0.5) -> List[Tuple[str, f
             
             # Filter by confidence AND text quality
             if conf >= confidence_threshold and len(text.strip()) > 0:
-                parsed.append((text, conf))
+                parsed.append((bbox, text, conf))
         
-        return parsed
+        if structured:
+            return OcrResult.from_detections(parsed, engine='paddle')
+        return [(text, conf) for _, text, conf in parsed]
         
     except Exception as e:
         print(f"⚠️  PaddleOCR error: {e}")
-        return []
+        return OcrResult([]) if structured else []
 
 
-def ocr_with_easyocr(img, confidence_threshold: float = 0.3) -> List[Tuple[str, float]]:
+def ocr_with_easyocr(img, confidence_threshold: float = 0.3, structured: bool = False):
     """
     OCR mit EasyOCR (fallback).
     
     Args:
         img: Input image (numpy array oder PIL Image)
         confidence_threshold: Minimum confidence score (0-1)
+        structured: OcrResult (Text/Box/Konfidenz pro Zeile) statt Tupel-Liste zurückgeben
         
     Returns:
-        Liste von (text, confidence) Tupeln
+        Liste von (text, confidence) Tupeln (bzw. OcrResult)
     """
     if not _easyocr_available or _easyocr_reader is None:
-        return []
+        return OcrResult([]) if structured else []
     
     try:
         # EasyOCR expects numpy array
@@ -201,29 +220,61 @@ def ocr_with_easyocr(img, confidence_threshold: float = 0.3) -> List[Tuple[str,
             
             # Filter by confidence
             if conf >= confidence_threshold:
-                parsed.append((text, conf))
+                parsed.append((bbox, text, conf))
         
-        return parsed
+        if structured:
+            return OcrResult.from_detections(parsed, engine='easyocr')
+        return [(text, conf) for _, text, conf in parsed]
         
     except Exception as e:
         print(f"⚠️  EasyOCR error: {e}")
-        return []
+        return OcrResult([]) if structured else []
+
+
+def get_tesseract_backend():
+    """
+    Persistentes Tesseract-Handle aus der Engine-Registry (tesserocr).
+    
+    Returns:
+        PersistentTesseract oder None (TESSERACT_BACKEND='subprocess' / tesserocr fehlt)
+    """
+    if TESSERACT_BACKEND == 'subprocess':
+        return None
+    from ocr_registry import get_registry
+
+    return get_registry().get('tesseract')
 
 
-def ocr_with_tesseract(img, whitelist: Optional[str] = None) -> List[Tuple[str, float]]:
+def ocr_with_tesseract(img, whitelist: Optional[str] = None, structured: bool = False):
     """
     OCR mit Tesseract (final fallback).
     
+    Persistentes In-Process-Handle (tesserocr) falls verfügbar, sonst
+    pytesseract-Subprozess pro Aufruf.
+    
     Args:
         img: Input image (numpy array oder PIL Image)
         whitelist: Erlaubte Zeichen (z.B. "0-9a-zA-Z .,':x-()[]/")
+        structured: OcrResult (Text/Box/Konfidenz pro Zeile) statt Tupel-Liste zurückgeben
         
     Returns:
-        Liste von (text, confidence) Tupeln (confidence always 1.0 for tesseract)
+        Liste von (text, confidence) Tupeln (Subprozess: keine Konfidenz → NaN, bzw. OcrResult)
     """
     try:
+        backend = get_tesseract_backend()
+        if backend is not None:
+            if not hasattr(img, 'shape'):
+                img = np.array(img)
+            result = backend.recognize(img, whitelist)
+            if structured:
+                return result
+            return [(line.text, line.confidence) for line in result]
+
         import pytesseract
         from PIL import Image
+        from config import TESS_PATH
+
+        pytesseract.pytesseract.tesseract_cmd = TESS_PATH
         
         # Convert to PIL Image if needed
         if hasattr(img, 'shape'):  # numpy array
@@ -237,20 +288,52 @@ def ocr_with_tesseract(img, whitelist: Optional[str] = None) -> List[Tuple[str,
         text = pytesseract.image_to_string(img, config=config)
         
         if text.strip():
-            return [(text.strip(), 1.0)]
+            # image_to_string liefert keine Konfidenz → NaN statt geschöntem 1.0
+            if structured:
+                return OcrResult.from_text(text.strip(), 'tesseract')
+            return [(text.strip(), float('nan'))]
         
-        return []
+        return OcrResult([]) if structured else []
         
     except Exception as e:
         print(f"⚠️  Tesseract error: {e}")
-        return []
+        return OcrResult([]) if structured else []
+
+
+def _engine_order(engine: str) -> List[str]:
+    if engine == 'paddle':
+        return ['paddle', 'easyocr', 'tesseract']
+    if engine == 'easyocr':
+        return ['easyocr', 'paddle', 'tesseract']
+    if engine == 'tesseract':
+        return ['tesseract', 'paddle', 'easyocr']
+    return ['paddle', 'easyocr', 'tesseract']
+
+
+def _engine_ready(eng: str) -> bool:
+    if eng == 'paddle':
+        return _paddle_available
+    if eng == 'easyocr':
+        return _easyocr_available
+    return eng == 'tesseract'
+
+
+def _run_engine(eng: str, img, confidence_threshold: float,
+                tesseract_whitelist: Optional[str]) -> List[Tuple[str, float]]:
+    if eng == 'paddle':
+        return ocr_with_paddle(img, confidence_threshold)
+    if eng == 'easyocr':
+        return ocr_with_easyocr(img, confidence_threshold)
+    return ocr_with_tesseract(img, tesseract_whitelist)
 
 
 def ocr_auto(img, 
              engine: str = 'paddle',
              fallback_enabled: bool = True,
              confidence_threshold: float = 0.3,
-             tesseract_whitelist: Optional[str] = None) -> str:
+             tesseract_whitelist: Optional[str] = None,
+             race: Optional[bool] = None,
+             deadline_s: Optional[float] = None) -> str:
     """
     Automatische OCR mit Multi-Engine-Fallback.
     
@@ -260,35 +343,30 @@ def ocr_auto(img,
         fallback_enabled: Fallback zu anderen Engines bei Fehler
         confidence_threshold: Minimum confidence score (0-1)
         tesseract_whitelist: Erlaubte Zeichen für Tesseract
+        race: Engines parallel statt nacheinander (default: OCR_RACE_ENABLED, nur mit Fallback)
+        deadline_s: Zeitbudget im Racing-Modus (default: OCR_RACE_DEADLINE_S)
         
     Returns:
         Erkannter Text (kombiniert aus allen Zeilen)
     """
-    engines = []
-    
     # Bestimme Engine-Reihenfolge
-    if engine == 'paddle':
-        engines = ['paddle', 'easyocr', 'tesseract']
-    elif engine == 'easyocr':
-        engines = ['easyocr', 'paddle', 'tesseract']
-    elif engine == 'tesseract':
-        engines = ['tesseract', 'paddle', 'easyocr']
-    else:
-        engines = ['paddle', 'easyocr', 'tesseract']
+    engines = _engine_order(engine)
     
     if not fallback_enabled:
         engines = [engine]
     
+    if race is None:
+        race = OCR_RACE_ENABLED
+    if race and len(engines) > 1:
+        return _ocr_race(img, engines, confidence_threshold, tesseract_whitelist,
+                         OCR_RACE_DEADLINE_S if deadline_s is None else deadline_s)
+    
     # Versuche Engines in Reihenfolge
     for eng in engines:
         result = []
         
-        if eng == 'paddle' and _paddle_available:
-            result = ocr_with_paddle(img, confidence_threshold)
-        elif eng == 'easyocr' and _easyocr_available:
-            result = ocr_with_easyocr(img, confidence_threshold)
-        elif eng == 'tesseract':
-            result = ocr_with_tesseract(img, tesseract_whitelist)
+        if _engine_ready(eng):
+            result = _run_engine(eng, img, confidence_threshold, tesseract_whitelist)
         
         if result:
             # Kombiniere alle Textzeilen
@@ -299,6 +377,351 @@ def ocr_auto(img,
     return ""
 
 
+# -----------------------
+# Engine Racing (ocr_auto mit race=True)
+# -----------------------
+# Alle verfügbaren Engines starten gleichzeitig; das erste Ergebnis, das den
+# Qualitätscheck besteht, gewinnt. Verlierer werden nicht abgebrochen (Engines
+# sind nicht unterbrechbar), ihr Ergebnis wird ignoriert - eine Engine, die vom
+# letzten Scan noch rechnet, läuft im nächsten Race nicht mit (kein paralleler
+# Zugriff auf denselben Reader, kein Aufstauen langsamer PaddleOCR-Läufe).
+# Gleiche Anker wie parsing._ANCHOR_PATTERN (parsing importiert utils → hier nicht importierbar)
+_RACE_ANCHOR_PATTERN = re.compile(
+    r"\btransact[il1]on\b|\bsold\b|\bplaced\s+order\b|\border\s+placed\b|\bre-?list(?:ed)?\b|\blisted\b"
+    r"|\bwith\s*draw\b|\bwithdrew\b|\bwithdraw(?:n|ed)?\b|\bpurchased\b|\bbought\b",
+    re.IGNORECASE,
+)
+_race_executor: Optional[ThreadPoolExecutor] = None
+_race_engine_locks = {name: threading.Lock() for name in ('paddle', 'easyocr', 'tesseract')}
+_race_lock = threading.Lock()
+_race_stats = {'races': 0, 'quality_wins': 0, 'deadline_hits': 0, 'fallback_results': 0, 'empty': 0}
+_race_engine_stats = {}  # {engine: {'runs', 'wins', 'quality_passes', 'empty', 'errors', 'busy_skips', 'latencies_ms'}}
+
+
+def passes_quality_check(lines: List[Tuple[str, float]], min_confidence: float = None) -> bool:
+    """Race winner check: a log timestamp, an event anchor keyword and enough mean confidence.
+
+    Lines without a real confidence (NaN, e.g. pytesseract subprocess) do not
+    count; a result with no real confidence at all cannot win on quality.
+    """
+    if not lines:
+        return False
+    if min_confidence is None:
+        min_confidence = OCR_RACE_MIN_CONFIDENCE
+    text = ' '.join(text for text, _ in lines)
+    if not has_timestamp(text) or not _RACE_ANCHOR_PATTERN.search(text):
+        return False
+    confidences = [conf for _, conf in lines if conf is not None and not math.isnan(conf)]
+    if not confidences:
+        return False
+    return sum(confidences) / len(confidences) >= min_confidence
+
+
+def _engine_stats(eng: str) -> dict:
+    return _race_engine_stats.setdefault(eng, {
+        'runs': 0, 'wins': 0, 'quality_passes': 0, 'empty': 0, 'errors': 0, 'busy_skips': 0,
+        'latencies_ms': deque(maxlen=200),
+    })
+
+
+def _race_engine(eng: str, img, confidence_threshold: float, tesseract_whitelist: Optional[str]):
+    lock = _race_engine_locks[eng]
+    start = time.perf_counter()
+    try:
+        return _run_engine(eng, img, confidence_threshold, tesseract_whitelist)
+    finally:
+        latency_ms = (time.perf_counter() - start) * 1000
+        lock.release()
+        with _race_lock:
+            _engine_stats(eng)['latencies_ms'].append(latency_ms)
+
+
+def _ocr_race(img, engines: List[str], confidence_threshold: float,
+              tesseract_whitelist: Optional[str], deadline_s: float) -> str:
+    global _race_executor
+    with _race_lock:
+        if _race_executor is None:
+            _race_executor = ThreadPoolExecutor(max_workers=len(_race_engine_locks),
+                                                thread_name_prefix="ocr-race")
+        _race_stats['races'] += 1
+
+    futures = {}
+    for eng in engines:
+        if not _engine_ready(eng):
+            continue
+        if not _race_engine_locks[eng].acquire(blocking=False):
+            with _race_lock:
+                _engine_stats(eng)['busy_skips'] += 1
+            continue
+        futures[_race_executor.submit(_race_engine, eng, img, confidence_threshold, tesseract_whitelist)] = eng
+        with _race_lock:
+            _engine_stats(eng)['runs'] += 1
+
+    finished = {}
+    winner = None
+    pending = set(futures)
+    deadline = time.monotonic() + max(0.0, deadline_s)
+    while pending and winner is None:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+        for future in done:
+            eng = futures[future]
+            try:
+                lines = future.result()
+            except Exception as e:
+                print(f"⚠️  OCR race error ({eng}): {e}")
+                with _race_lock:
+                    _engine_stats(eng)['errors'] += 1
+                continue
+            finished[eng] = lines
+            passed = passes_quality_check(lines)
+            with _race_lock:
+                stats = _engine_stats(eng)
+                if not lines:
+                    stats['empty'] += 1
+                if passed:
+                    stats['quality_passes'] += 1
+            if passed and winner is None:
+                winner = eng
+
+    if winner is None:
+        # Kein Ergebnis besteht den Check → erstes nicht-leeres in Prioritätsreihenfolge
+        winner = next((eng for eng in engines if finished.get(eng)), None)
+        with _race_lock:
+            if pending:
+                _race_stats['deadline_hits'] += 1
+            _race_stats['fallback_results' if winner else 'empty'] += 1
+    else:
+        with _race_lock:
+            _race_stats['quality_wins'] += 1
+    # Verlierer laufen ggf. weiter; noch nicht gestartete werden abgebrochen
+    for future in pending:
+        if future.cancel():
+            _race_engine_locks[futures[future]].release()
+    if winner is None:
+        return ""
+    with _race_lock:
+        _engine_stats(winner)['wins'] += 1
+    return '\n'.join(line[0] for line in finished[winner])
+
+
+def get_race_stats() -> dict:
+    """
+    Racing-Statistik pro Engine (Gewinnrate, Latenz) + Race-Ausgänge.
+    
+    Returns:
+        {'races', 'quality_wins', 'deadline_hits', 'fallback_results', 'empty',
+         'engines': {engine: {runs, wins, win_rate, quality_rate, avg_ms, p95_ms, empty, errors, busy_skips}},
+         'suggested_order': [...]}
+    """
+    with _race_lock:
+        stats = dict(_race_stats)
+        engines = {eng: dict(values, latencies_ms=list(values['latencies_ms']))
+                   for eng, values in _race_engine_stats.items()}
+    races = stats['races']
+    for values in engines.values():
+        latencies = sorted(values.pop('latencies_ms'))
+        values['win_rate'] = (values['wins'] / races * 100) if races else 0.0
+        values['quality_rate'] = (values['quality_passes'] / values['runs'] * 100) if values['runs'] else 0.0
+        values['avg_ms'] = (sum(latencies) / len(latencies)) if latencies else 0.0
+        values['p95_ms'] = latencies[max(0, int(len(latencies) * 0.95) - 1)] if latencies else 0.0
+    stats['engines'] = engines
+    # Datenbasierte Reihenfolge für OCR_ENGINE/Fallback: meiste Siege, dann schnellste
+    stats['suggested_order'] = sorted(engines, key=lambda eng: (-engines[eng]['wins'], engines[eng]['avg_ms']))
+    return stats
+
+
+def reset_race_stats() -> None:
+    """Racing-Zähler zurücksetzen."""
+    with _race_lock:
+        for key in _race_stats:
+            _race_stats[key] = 0
+        _race_engine_stats.clear()
+
+
+# -----------------------
+# Batched Recognition (Zeilen-/Feld-Crops ohne Detektor)
+# -----------------------
+# Ist das Log bereits in Zeilen- oder Feld-Crops zerlegt, braucht es keinen
+# CRAFT-/DB-Detektor mehr: alle Crops gehen gesammelt durch den Recognizer.
+# EasyOCR: Crops untereinander auf eine Canvas gemeinsamer Breite, eine Box pro
+# Crop → EIN reader.recognize(); der Recognizer normiert die Höhe und polstert
+# jeden Batch auf gemeinsame Breite (AlignCollate). Auf CPU iteriert EasyOCR die
+# Boxen intern trotzdem einzeln - der Gewinn dort ist der eingesparte Detektor
+# und Python-Overhead pro Crop, auf GPU kommt echtes Batching dazu.
+_BATCH_GAP = 4  # px Abstand zwischen gestapelten Crops
+_batch_lock = threading.Lock()
+_batch_stats = {}  # {engine: {'calls', 'crops', 'batches', 'seconds', 'last_crops_per_s'}}
+
+
+def _to_gray(crop):
+    import cv2
+
+    crop = np.asarray(crop)
+    if crop.ndim == 2:
+        return crop.astype(np.uint8, copy=False)
+    if crop.shape[2] == 4:
+        return cv2.cvtColor(crop, cv2.COLOR_BGRA2GRAY)
+    return cv2.cvtColor(crop, cv2.COLOR_BGR2GRAY)
+
+
+def _stack_crops(grays, gap: int = _BATCH_GAP):
+    """Stack crops top-down on a common-width canvas → (canvas, [[x_min, x_max, y_min, y_max], ...])."""
+    width = max(g.shape[1] for g in grays)
+    height = sum(g.shape[0] for g in grays) + gap * (len(grays) - 1)
+    canvas = np.zeros((height, width), dtype=np.uint8)
+    boxes = []
+    y = 0
+    for g in grays:
+        h, w = g.shape[:2]
+        canvas[y:y + h, :w] = g
+        boxes.append([0, w, y, y + h])
+        y += h + gap
+    return canvas, boxes
+
+
+def _crop_box(gray):
+    h, w = gray.shape[:2]
+    return [[0, 0], [w, 0], [w, h], [0, h]]
+
+
+def _recognize_batch_easyocr(reader, grays, batch_size: int, allowlist: Optional[str], kwargs: dict):
+    canvas, boxes = _stack_crops(grays)
+    if allowlist:
+        kwargs = dict(kwargs, allowlist=allowlist)
+    entries = reader.recognize(canvas, horizontal_list=boxes, free_list=[], detail=1,
+                               paragraph=False, batch_size=batch_size, **kwargs)
+    # Rückgabe-Reihenfolge ist nicht garantiert (EasyOCR sortiert nach y) → über y zuordnen
+    tops = [box[2] for box in boxes]
+    per_crop = [[] for _ in grays]
+    for entry in entries:
+        if len(entry) != 3:
+            continue
+        bbox, text, conf = entry
+        top = min(p[1] for p in bbox)
+        idx = min(range(len(tops)), key=lambda i: abs(tops[i] - top))
+        per_crop[idx].append(([[p[0], p[1] - tops[idx]] for p in bbox], text, conf))
+    return per_crop
+
+
+def _recognize_batch_paddle(grays, batch_size: int):
+    import cv2
+
+    per_crop = []
+    for start in range(0, len(grays), batch_size):
+        chunk = grays[start:start + batch_size]
+        try:
+            # det=False + Bildliste → nur Recognizer (rec_batch_num), Ergebnis [[(text, conf), ...]]
+            result = _paddle_reader.ocr([cv2.cvtColor(g, cv2.COLOR_GRAY2RGB) for g in chunk],
+                                        det=False, cls=False)
+            lines = result[0] if result else []
+            if len(lines) != len(chunk):
+                raise ValueError(f"{len(lines)} results for {len(chunk)} crops")
+            for g, (text, conf) in zip(chunk, lines):
+                per_crop.append([(_crop_box(g), text, conf)] if text.strip() else [])
+        except Exception as e:
+            # Ältere/neuere PaddleOCR-APIs ohne Listen-Input → einzeln mit Detektor
+            print(f"⚠️  PaddleOCR batch recognition unavailable ({e}), falling back to per-crop OCR")
+            for g in chunk:
+                single = ocr_with_paddle(g, confidence_threshold=0.0, structured=True)
+                per_crop.append([(_crop_box(g), line.text, line.confidence) for line in single])
+    return per_crop
+
+
+def _record_batch(engine: str, crops: int, batches: int, seconds: float) -> None:
+    with _batch_lock:
+        stats = _batch_stats.setdefault(engine, {'calls': 0, 'crops': 0, 'batches': 0,
+                                                 'seconds': 0.0, 'last_crops_per_s': 0.0})
+        stats['calls'] += 1
+        stats['crops'] += crops
+        stats['batches'] += batches
+        stats['seconds'] += seconds
+        stats['last_crops_per_s'] = crops / seconds if seconds > 0 else 0.0
+
+
+def recognize_batch(crops, engine: str = 'easyocr', batch_size: Optional[int] = None,
+                    allowlist: Optional[str] = None, reader=None, **recognize_kwargs) -> List[OcrResult]:
+    """
+    Erkennt mehrere Zeilen-/Feld-Crops in einem Recognizer-Durchlauf (kein Detektor).
+    
+    Args:
+        crops: Liste von Bild-Crops (Graustufen, BGR oder BGRA), je eine Textzeile/ein Feld
+        engine: 'easyocr', 'paddle' oder 'tesseract' (Tesseract: sequentiell, kein Batching)
+        batch_size: Crops pro Recognizer-Batch (default: OCR_RECOGNIZE_BATCH_SIZE)
+        allowlist: Erlaubte Zeichen (EasyOCR allowlist / Tesseract whitelist)
+        reader: EasyOCR-Reader (default: initialisierter bzw. lazy Registry-Reader)
+        **recognize_kwargs: Weitere EasyOCR-recognize-Parameter (contrast_ths, adjust_contrast, ...)
+        
+    Returns:
+        Ein OcrResult pro Crop (gleiche Reihenfolge, Boxen relativ zum Crop)
+    """
+    if engine not in ('easyocr', 'paddle', 'tesseract'):
+        raise ValueError(f"Unknown OCR engine: {engine}")
+    crops = list(crops)
+    results = [OcrResult([]) for _ in crops]
+    valid = [idx for idx, crop in enumerate(crops)
+             if crop is not None and getattr(crop, 'size', 0) > 0]
+    if not valid:
+        return results
+    batch_size = max(1, int(batch_size or OCR_RECOGNIZE_BATCH_SIZE))
+    grays = [_to_gray(crops[idx]) for idx in valid]
+
+    start = time.perf_counter()
+    try:
+        if engine == 'easyocr':
+            if reader is None:
+                if _easyocr_reader is not None:
+                    reader = _easyocr_reader
+                else:
+                    from ocr_registry import get_registry
+                    reader = get_registry().get('easyocr')
+            if reader is None:
+                return results
+            per_crop = _recognize_batch_easyocr(reader, grays, batch_size, allowlist, recognize_kwargs)
+        elif engine == 'paddle':
+            if not _paddle_available or _paddle_reader is None:
+                return results
+            per_crop = _recognize_batch_paddle(grays, batch_size)
+        elif engine == 'tesseract':
+            batch_size = 1
+            per_crop = [[(_crop_box(g), text, conf) for text, conf in ocr_with_tesseract(g, allowlist)]
+                        for g in grays]
+    except Exception as e:
+        print(f"⚠️  Batch recognition error ({engine}): {e}")
+        return results
+    elapsed = time.perf_counter() - start
+
+    for idx, entries in zip(valid, per_crop):
+        results[idx] = OcrResult.from_detections(entries, engine=engine)
+    _record_batch(engine, len(grays), -(-len(grays) // batch_size), elapsed)
+    return results
+
+
+def get_batch_stats() -> dict:
+    """
+    Durchsatz von recognize_batch pro Engine.
+    
+    Returns:
+        {engine: {calls, crops, batches, avg_batch_size, crops_per_s, avg_ms_per_crop, last_crops_per_s}}
+    """
+    with _batch_lock:
+        snapshot = {engine: dict(stats) for engine, stats in _batch_stats.items()}
+    for stats in snapshot.values():
+        seconds = stats.pop('seconds')
+        stats['avg_batch_size'] = stats['crops'] / stats['batches'] if stats['batches'] else 0.0
+        stats['crops_per_s'] = stats['crops'] / seconds if seconds > 0 else 0.0
+        stats['avg_ms_per_crop'] = seconds * 1000 / stats['crops'] if stats['crops'] else 0.0
+    return snapshot
+
+
+def reset_batch_stats() -> None:
+    """Durchsatz-Zähler zurücksetzen (Benchmarks)."""
+    with _batch_lock:
+        _batch_stats.clear()
+
+
 def get_available_engines() -> List[str]:
     """
     Gibt Liste der verfügbaren OCR-Engines zurück.
@@ -324,20 +747,28 @@ def get_engine_info() -> dict:
     Gibt Informationen über verfügbare Engines zurück.
     
     Returns:
-        Dict mit Engine-Status
+        Dict mit Engine-Status (inkl. Lazy-Registry: state/load_s/mode/error)
     """
+    from ocr_registry import get_registry
+
+    registry = get_registry()
+    lazy = registry.status()
     return {
         'paddle': {
             'available': _paddle_available,
-            'initialized': _paddle_reader is not None
+            'initialized': _paddle_reader is not None,
+            'registry': lazy.get('paddle', {})
         },
         'easyocr': {
-            'available': _easyocr_available,
-            'initialized': _easyocr_reader is not None
+            'available': _easyocr_available or registry.is_ready('easyocr'),
+            'initialized': _easyocr_reader is not None or registry.is_ready('easyocr'),
+            'registry': lazy.get('easyocr', {})
         },
         'tesseract': {
             'available': True,  # System-level installation
-            'initialized': True
+            'initialized': True,
+            'backend': 'tesserocr' if registry.is_ready('tesseract') else 'subprocess',
+            'registry': lazy.get('tesseract', {})
         }
     }
 
@@ -0,0 +1,449 @@
+"""
+OCR Process Pool - OCR in separaten Prozessen, Frames über Shared Memory
+
+Im Tracker-Thread (bzw. im ThreadPoolExecutor der Async-Pipeline) konkurriert
+die OCR unter dem GIL mit der Tk-GUI und dem Python-Parsing. Hier läuft sie in
+eigenen Prozessen:
+
+1. N Worker-Prozesse (spawn), jeder baut seine eigene Engine-Instanz
+   (lazy Registry im Kindprozess, Warm-up direkt nach dem Start)
+2. Frames werden in Shared-Memory-Slots kopiert - über die Queue gehen nur
+   Slot-Name, Shape, Dtype und kwargs, keine gepickelten Pixel
+3. Worker liefern das strukturierte OcrResult zurück (Texte + kompakte Arrays)
+4. Abgestürzte/hängende Worker werden neu gestartet, ihr Frame einmal erneut
+   eingeplant
+5. get_stats(): Queue-Tiefe, In-Flight, Latenz pro Worker, Restarts
+
+Wartende Frames sind begrenzt (max_pending): bei Stau wird der älteste
+verworfen - wie im LatestFrameSlot zählt nur der neueste Zustand.
+"""
+
+import importlib
+import multiprocessing as mp
+import os
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from multiprocessing import shared_memory
+from typing import Optional
+
+import numpy as np
+
+from config import (
+    OCR_PROCESS_WORKERS,
+    OCR_PROCESS_MAX_PENDING,
+    OCR_PROCESS_TASK_TIMEOUT,
+)
+
+DEFAULT_TARGET = "utils:extract_text"
+DEFAULT_WARMUP = "ocr_registry:get_reader"
+
+# Max. gleichzeitig gemappte Slots pro Worker (ersetzte Slots werden so wieder freigegeben)
+_MAX_ATTACHED = 8
+_POLL_INTERVAL = 0.2
+_MAX_RESTART_BACKOFF = 30.0
+# 0.5 × (2**6 - 1) > 30s → höhere Exponenten ändern nichts, würden aber bei langen
+# Crash-Schleifen irgendwann OverflowError im Collector-Thread auslösen
+_MAX_RESTART_EXPONENT = 6
+
+
+def _restart_backoff(crash_streak: int) -> float:
+    """Delay before restarting a worker after ``crash_streak`` consecutive crashes (0, 0.5, 1.5, 3.5 … 30s)."""
+    exponent = min(max(0, crash_streak - 1), _MAX_RESTART_EXPONENT)
+    return min(_MAX_RESTART_BACKOFF, 0.5 * (2 ** exponent - 1))
+
+
+class OcrWorkerError(RuntimeError):
+    """A frame could not be OCR'd: worker crashed twice on it, or the pool was closed."""
+
+
+def _resolve(spec: str):
+    module, _, name = spec.partition(":")
+    return getattr(importlib.import_module(module), name)
+
+
+def _attach(name: str):
+    try:
+        # Python 3.13+: Kindprozess soll das Segment nicht beim Resource-Tracker anmelden
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+def _worker_main(worker_id: int, tasks, results, target: str, warmup: Optional[str]) -> None:
+    """Worker process: build the engine once, then OCR frames from shared memory until ``None``."""
+    start = time.perf_counter()
+    fn, init_error = None, None
+    try:
+        fn = _resolve(target)
+        if warmup:
+            _resolve(warmup)()
+    except Exception as exc:
+        init_error = repr(exc)
+    results.put(('ready', worker_id, os.getpid(), time.perf_counter() - start, init_error))
+
+    attached = {}
+    while True:
+        task = tasks.get()
+        if task is None:
+            break
+        task_id, shm_name, shape, dtype, kwargs = task
+        t0 = time.perf_counter()
+        img = None
+        try:
+            if fn is None:
+                raise RuntimeError(f"OCR target unavailable: {init_error}")
+            shm = attached.get(shm_name)
+            if shm is None:
+                if len(attached) >= _MAX_ATTACHED:
+                    for old in attached.values():
+                        old.close()
+                    attached.clear()
+                shm = attached[shm_name] = _attach(shm_name)
+            img = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+            result = fn(img, **kwargs)
+            results.put(('done', worker_id, task_id, time.perf_counter() - t0, result))
+        except Exception as exc:
+            results.put(('error', worker_id, task_id, time.perf_counter() - t0, repr(exc)))
+        finally:
+            del img  # View freigeben, sonst schlägt shm.close() fehl
+    for shm in attached.values():
+        shm.close()
+
+
+class _Task:
+    __slots__ = ('task_id', 'future', 'slot', 'shape', 'dtype', 'kwargs',
+                 'submitted_at', 'started_at', 'attempts')
+
+    def __init__(self, task_id, slot, img, kwargs) -> None:
+        self.task_id = task_id
+        self.future: Future = Future()
+        self.slot = slot
+        self.shape = img.shape
+        self.dtype = img.dtype.str
+        self.kwargs = kwargs
+        self.submitted_at = time.perf_counter()
+        self.started_at = 0.0
+        self.attempts = 0
+
+
+class _Worker:
+    __slots__ = ('worker_id', 'process', 'tasks', 'task', 'pid', 'ready', 'load_s', 'init_error',
+                 'completed', 'errors', 'restarts', 'crash_streak', 'restart_at', 'total_s', 'last_ms')
+
+    def __init__(self, worker_id: int) -> None:
+        self.worker_id = worker_id
+        self.process = None
+        self.tasks = None
+        self.task: Optional[_Task] = None
+        self.pid = None
+        self.ready = False
+        self.load_s = None
+        self.init_error = None
+        self.completed = 0
+        self.errors = 0
+        self.restarts = 0
+        self.crash_streak = 0
+        self.restart_at = 0.0
+        self.total_s = 0.0
+        self.last_ms = 0.0
+
+
+def _settle(future: Future, result=None, exc: Optional[BaseException] = None) -> None:
+    if future.done():  # vom Aufrufer abgebrochen
+        return
+    if exc is not None:
+        future.set_exception(exc)
+    else:
+        future.set_result(result)
+
+
+class OcrProcessPool:
+    """Pool of OCR worker processes fed through ``multiprocessing.shared_memory`` slots."""
+
+    def __init__(self, worker_count: int = OCR_PROCESS_WORKERS,
+                 target: str = DEFAULT_TARGET,
+                 warmup: Optional[str] = DEFAULT_WARMUP,
+                 max_pending: int = OCR_PROCESS_MAX_PENDING,
+                 task_timeout: float = OCR_PROCESS_TASK_TIMEOUT,
+                 context: str = 'spawn',
+                 latency_window: int = 120) -> None:
+        self.worker_count = max(1, int(worker_count))
+        self.target = target
+        self.warmup = warmup
+        self.max_pending = max(1, int(max_pending))
+        self.task_timeout = float(task_timeout or 0.0)
+        # spawn: kein fork eines Tk-/Torch-Prozesses mit laufenden Threads (und identisch zu Windows)
+        self._ctx = mp.get_context(context)
+        self._results = self._ctx.Queue()
+        self._lock = threading.Lock()
+        self._pending: deque = deque()
+        self._free_slots: list = []
+        self._next_id = 0
+        self._closed = False
+        self._queue_wait_ms: deque = deque(maxlen=max(1, int(latency_window)))
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.dropped = 0
+        self.retried = 0
+        self.restarts = 0
+
+        self._workers = [_Worker(idx) for idx in range(self.worker_count)]
+        for worker in self._workers:
+            self._start_worker(worker)
+        self._collector = threading.Thread(target=self._collect, name="ocr-pool-collector", daemon=True)
+        self._collector.start()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def submit(self, img, **kwargs) -> Future:
+        """Queue ``img`` for ``target(img, **kwargs)`` in a worker → Future with the result."""
+        img = np.ascontiguousarray(img)
+        with self._lock:
+            if self._closed:
+                raise OcrWorkerError("OCR process pool is closed")
+            slot = self._take_slot(img.nbytes)
+            task = _Task(self._next_id, slot, img, kwargs)
+            self._next_id += 1
+        # Slot gehört exklusiv diesem Task → Kopie ohne Lock
+        np.ndarray(img.shape, dtype=img.dtype, buffer=slot.buf)[...] = img
+
+        dropped = []
+        with self._lock:
+            if self._closed:
+                self._release_slot(slot)
+                raise OcrWorkerError("OCR process pool is closed")
+            self.submitted += 1
+            self._pending.append(task)
+            while len(self._pending) > self.max_pending:
+                old = self._pending.popleft()
+                self._release_slot(old.slot)
+                self.dropped += 1
+                dropped.append(old)
+            self._dispatch_locked()
+        for old in dropped:
+            old.future.cancel()
+        return task.future
+
+    def extract(self, img, timeout: Optional[float] = None, **kwargs):
+        """Blocking ``submit(...).result()`` (waiting thread holds no GIL)."""
+        return self.submit(img, **kwargs).result(timeout)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Stop workers, fail outstanding frames and unlink all shared-memory slots."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            outstanding = list(self._pending) + [w.task for w in self._workers if w.task is not None]
+            self._pending.clear()
+            for worker in self._workers:
+                worker.task = None
+        for task in outstanding:
+            _settle(task.future, exc=OcrWorkerError("OCR process pool closed"))
+
+        for worker in self._workers:
+            try:
+                worker.tasks.put(None)
+            except Exception:
+                pass
+        deadline = time.monotonic() + timeout
+        for worker in self._workers:
+            worker.process.join(max(0.0, deadline - time.monotonic()))
+            if worker.process.is_alive():
+                worker.process.terminate()
+                worker.process.join(1.0)
+        self._collector.join(timeout)
+
+        slots = {task.slot.name: task.slot for task in outstanding}
+        slots.update((slot.name, slot) for slot in self._free_slots)
+        self._free_slots.clear()
+        for slot in slots.values():
+            self._unlink(slot)
+        self._results.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        self.close()
+
+    def get_stats(self) -> dict:
+        now = time.perf_counter()
+        with self._lock:
+            waits = list(self._queue_wait_ms)
+            per_worker = [{
+                'worker_id': w.worker_id,
+                'pid': w.pid,
+                'alive': bool(w.process is not None and w.process.is_alive()),
+                'ready': w.ready,
+                'load_s': w.load_s,
+                'init_error': w.init_error,
+                'busy_ms': (now - w.task.started_at) * 1000 if w.task is not None else 0.0,
+                'completed': w.completed,
+                'errors': w.errors,
+                'restarts': w.restarts,
+                'avg_ms': (w.total_s * 1000 / w.completed) if w.completed else 0.0,
+                'last_ms': w.last_ms,
+            } for w in self._workers]
+            return {
+                'workers': self.worker_count,
+                'alive': sum(1 for w in per_worker if w['alive']),
+                'queue_depth': len(self._pending),
+                'inflight': sum(1 for w in self._workers if w.task is not None),
+                'submitted': self.submitted,
+                'completed': self.completed,
+                'failed': self.failed,
+                'dropped': self.dropped,
+                'retried': self.retried,
+                'restarts': self.restarts,
+                'avg_queue_wait_ms': (sum(waits) / len(waits)) if waits else 0.0,
+                'per_worker': per_worker,
+            }
+
+    # ------------------------------------------------------------------
+    # Shared-Memory-Slots
+    # ------------------------------------------------------------------
+    def _take_slot(self, nbytes: int):
+        nbytes = max(1, nbytes)
+        for idx, slot in enumerate(self._free_slots):
+            if slot.size >= nbytes:
+                return self._free_slots.pop(idx)
+        if self._free_slots:
+            # Zu klein (z.B. neue ROI-Geometrie) → ersetzen statt Slots anzuhäufen
+            self._unlink(self._free_slots.pop(0))
+        return shared_memory.SharedMemory(create=True, size=nbytes)
+
+    def _release_slot(self, slot) -> None:
+        self._free_slots.append(slot)
+
+    @staticmethod
+    def _unlink(slot) -> None:
+        try:
+            slot.close()
+            slot.unlink()
+        except (FileNotFoundError, BufferError):
+            pass
+
+    # ------------------------------------------------------------------
+    # Worker-Verwaltung
+    # ------------------------------------------------------------------
+    def _start_worker(self, worker: _Worker) -> None:
+        # Frische Task-Queue: die alte kann nach einem Absturz inkonsistent sein
+        if worker.tasks is not None:
+            worker.tasks.cancel_join_thread()
+            worker.tasks.close()
+        worker.tasks = self._ctx.Queue()
+        worker.ready = False
+        worker.process = self._ctx.Process(
+            target=_worker_main,
+            args=(worker.worker_id, worker.tasks, self._results, self.target, self.warmup),
+            name=f"ocr-worker-{worker.worker_id}",
+            daemon=True,
+        )
+        worker.process.start()
+        worker.pid = worker.process.pid
+
+    def _dispatch_locked(self) -> None:
+        now = time.perf_counter()
+        for worker in self._workers:
+            if not self._pending:
+                return
+            if worker.task is not None or now < worker.restart_at or not worker.process.is_alive():
+                continue
+            task = self._pending.popleft()
+            task.started_at = now
+            worker.task = task
+            self._queue_wait_ms.append((now - task.submitted_at) * 1000)
+            worker.tasks.put((task.task_id, task.slot.name, task.shape, task.dtype, task.kwargs))
+
+    def _collect(self) -> None:
+        while True:
+            with self._lock:
+                if self._closed:
+                    return
+            try:
+                msg = self._results.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                msg = None
+            except (EOFError, OSError, ValueError):
+                return
+            if msg is not None:
+                self._handle(msg)
+            self._check_workers()
+
+    def _handle(self, msg) -> None:
+        kind, worker_id, *rest = msg
+        worker = self._workers[worker_id]
+        if kind == 'ready':
+            pid, load_s, error = rest
+            with self._lock:
+                if pid == worker.pid:
+                    worker.ready, worker.load_s, worker.init_error = True, load_s, error
+            return
+
+        task_id, seconds, payload = rest
+        with self._lock:
+            task = worker.task
+            if task is None or task.task_id != task_id:
+                return  # Nachzügler eines neu gestarteten Workers
+            worker.task = None
+            worker.last_ms = seconds * 1000
+            if kind == 'done':
+                worker.completed += 1
+                worker.total_s += seconds
+                worker.crash_streak = 0
+                self.completed += 1
+            else:
+                worker.errors += 1
+                self.failed += 1
+            self._release_slot(task.slot)
+            self._dispatch_locked()
+        if kind == 'done':
+            _settle(task.future, result=payload)
+        else:
+            _settle(task.future, exc=OcrWorkerError(f"OCR worker {worker_id}: {payload}"))
+
+    def _check_workers(self) -> None:
+        now = time.perf_counter()
+        failed = []
+        with self._lock:
+            if self._closed:
+                return
+            for worker in self._workers:
+                alive = worker.process.is_alive()
+                hung = (alive and worker.task is not None and self.task_timeout > 0
+                        and now - worker.task.started_at > self.task_timeout)
+                if alive and not hung:
+                    continue
+                if not alive and worker.task is None and now < worker.restart_at:
+                    continue  # Backoff läuft
+                if hung:
+                    worker.process.terminate()
+                worker.process.join(1.0)
+                reason = "timed out" if hung else f"exited with code {worker.process.exitcode}"
+                task, worker.task = worker.task, None
+
+                # Crash-Schleifen (z.B. fehlendes Modell) bremsen
+                worker.crash_streak += 1
+                worker.restarts += 1
+                self.restarts += 1
+                worker.restart_at = now + _restart_backoff(worker.crash_streak)
+                self._start_worker(worker)
+
+                if task is not None:
+                    task.attempts += 1
+                    if task.attempts < 2:
+                        self.retried += 1
+                        self._pending.appendleft(task)
+                    else:
+                        self.failed += 1
+                        self._release_slot(task.slot)
+                        failed.append((task, f"OCR worker {worker.worker_id} {reason}"))
+            self._dispatch_locked()
+        for task, reason in failed:
+            _settle(task.future, exc=OcrWorkerError(reason))
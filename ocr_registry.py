@@ -0,0 +1,327 @@
+"""
+OCR Engine Registry - Lazy Engine-Konstruktion statt Import-Zeit-Initialisierung
+
+Bisher hat ``import config`` einen ``easyocr.Reader`` gebaut (inkl. torch-Import
+und CUDA-Probe) und ggf. PaddleOCR initialisiert. Jedes Skript, das nur
+``DB_PATH`` oder eine Konstante braucht (``check_db.py``, Unit-Tests,
+``parsing.py`` über ``MAX_ITEM_QUANTITY``), hat dafür Sekunden Startzeit und
+mehrere hundert MB RAM bezahlt.
+
+Hier werden Engines erst beim ersten ``get()`` gebaut - oder vorab per
+``warmup()`` in einem Hintergrund-Thread, während die GUI startet. Parallele
+Aufrufer warten auf den laufenden Build statt eine zweite Engine zu bauen.
+Fehlgeschlagene Builds werden gemerkt (kein erneuter Versuch pro Scan).
+
+Status pro Engine (``status()``, auch in ``ocr_engines.get_engine_info``):
+idle → loading → ready | failed, plus Ladezeit, Modus (GPU/CPU) und Fehler.
+"""
+
+import gc
+import threading
+import time
+from typing import Callable, Dict, Iterable, Optional
+
+import config
+
+ENGINE_STATES = ("idle", "loading", "ready", "failed")
+
+
+def _print_safe(text: str, plain: str) -> None:
+    # Windows-Konsolen ohne UTF-8 (wie bisher in config.py)
+    try:
+        print(text)
+    except UnicodeEncodeError:
+        print(plain)
+
+
+# -----------------------
+# Engine Builder
+# -----------------------
+def _probe_gpu() -> bool:
+    """CUDA prüfen und Game-friendly GPU-Limits setzen (importiert torch erst hier)."""
+    try:
+        import torch
+    except Exception:
+        _print_safe("[WARNING] PyTorch/CUDA not found, falling back to CPU",
+                    "PyTorch/CUDA not found, falling back to CPU")
+        return False
+    try:
+        if not torch.cuda.is_available():
+            _print_safe("[WARNING] GPU requested but CUDA not available, falling back to CPU",
+                        "GPU requested but CUDA not available, falling back to CPU")
+            return False
+        name = torch.cuda.get_device_name(0)
+        _print_safe(f"[GPU] Detected: {name}", f"GPU detected: {name}")
+
+        # GPU-Memory-Limit setzen (verhindert VRAM-Konkurrenz mit Spiel)
+        if config.GPU_MEMORY_LIMIT:
+            try:
+                total_mem = torch.cuda.get_device_properties(0).total_memory
+                fraction = min(1.0, max(0.0, (config.GPU_MEMORY_LIMIT * 1024 * 1024) / float(total_mem)))
+                torch.cuda.set_per_process_memory_fraction(fraction, device=0)
+                _print_safe(f"   GPU Memory Limit: {config.GPU_MEMORY_LIMIT} MB",
+                            f"GPU Memory Limit: {config.GPU_MEMORY_LIMIT} MB")
+            except Exception as mem_err:
+                _print_safe(f"   [WARNING] Could not set memory limit: {mem_err}",
+                            f"Could not set memory limit: {mem_err}")
+
+        # Low-Priority Mode für OCR (Spiel hat Vorrang)
+        if config.GPU_LOW_PRIORITY:
+            try:
+                torch.cuda.set_stream(torch.cuda.Stream(priority=-1))
+                _print_safe("   GPU Priority: Low (game has priority)",
+                            "GPU Priority: Low (game has priority)")
+            except Exception as prio_err:
+                _print_safe(f"   [WARNING] Could not set priority: {prio_err}",
+                            f"Could not set priority: {prio_err}")
+        return True
+    except Exception:
+        return False
+
+
+# Obergrenze für set_torch_threads (CPU-Governor), None = keine
+_torch_thread_cap: Optional[int] = None
+
+
+def set_torch_thread_cap(cap: Optional[int]) -> None:
+    global _torch_thread_cap
+    _torch_thread_cap = None if cap is None else max(1, int(cap))
+
+
+def set_torch_threads(threads: int) -> bool:
+    """torch intra-op threads for CPU inference (capped by the CPU governor); False without torch."""
+    try:
+        import torch
+    except Exception:
+        return False
+    threads = max(1, int(threads))
+    if _torch_thread_cap is not None:
+        threads = min(threads, _torch_thread_cap)
+    torch.set_num_threads(threads)
+    return True
+
+
+def _apply_tuned_threads(registry: "EngineRegistry") -> None:
+    # Vom Autotuner gemessene Thread-Zahl (nur CPU-Modus, siehe ocr_autotune.py)
+    if not config.OCR_AUTOTUNE_APPLY:
+        return
+    threads = config.get_ocr_tuning().get("torch_threads")
+    if threads and set_torch_threads(threads):
+        registry.set_detail("easyocr", torch_threads=int(threads))
+
+
+def build_easyocr(registry: "EngineRegistry"):
+    """EasyOCR-Reader wie bisher in config.py: erst GPU (falls gewünscht), dann CPU-Retry."""
+    import easyocr
+
+    # Try to free up memory before initialization
+    gc.collect()
+    use_gpu = config.USE_GPU
+    gpu_available = _probe_gpu() if use_gpu else False
+    try:
+        reader = easyocr.Reader(
+            ['en'],
+            gpu=gpu_available,
+            verbose=False,
+            quantize=not gpu_available,  # Quantize nur bei CPU (GPU braucht es nicht)
+            cudnn_benchmark=gpu_available,  # cuDNN-Optimierung bei GPU
+            download_enabled=True,  # Allow model downloads if needed
+            detector=True,
+            recognizer=True
+        )
+        mode = "GPU" if gpu_available else "CPU"
+        registry.set_detail("easyocr", mode=mode)
+        if not gpu_available:
+            _apply_tuned_threads(registry)
+        _print_safe(f"[OK] EasyOCR initialized ({mode} mode)", f"EasyOCR initialized ({mode} mode)")
+        return reader
+    except Exception as e:
+        error_msg = str(e)
+        attempted_mode = "GPU" if use_gpu else "CPU"
+        _print_safe(f"[ERROR] EasyOCR init error ({attempted_mode} mode): {error_msg}",
+                    f"EasyOCR init error ({attempted_mode} mode): {error_msg}")
+        is_memory_error = 'not enough memory' in error_msg.lower() or 'out of memory' in error_msg.lower()
+        if is_memory_error:
+            _print_safe("[WARNING] Memory error detected - Falling back to Tesseract-only mode",
+                        "Memory error detected - using Tesseract only")
+            raise
+        if not use_gpu:
+            raise
+
+    # Only retry without GPU if it's not a general memory issue
+    _print_safe("[WARNING] Retrying EasyOCR initialization without GPU ...",
+                "Retrying EasyOCR initialization without GPU ...")
+    reader = easyocr.Reader(['en'], gpu=False, verbose=False, quantize=True, cudnn_benchmark=False)
+    registry.set_detail("easyocr", mode="CPU")
+    _apply_tuned_threads(registry)
+    _print_safe("[OK] EasyOCR initialized (CPU fallback)", "EasyOCR initialized (CPU fallback)")
+    return reader
+
+
+def build_paddle(registry: "EngineRegistry"):
+    """PaddleOCR über ``ocr_engines.init_paddle_ocr`` (+ EasyOCR-Fallback wie bisher)."""
+    import ocr_engines
+
+    if config.OCR_FALLBACK_ENABLED:
+        ocr_engines.init_easyocr(use_gpu=config.USE_GPU, lang=['en'])
+    if not ocr_engines.init_paddle_ocr(use_gpu=config.USE_GPU, lang='en', show_log=False):
+        raise RuntimeError("PaddleOCR initialization failed")
+    registry.set_detail("paddle", mode="GPU" if config.USE_GPU else "CPU")
+    return ocr_engines._paddle_reader
+
+
+def build_tesseract(registry: "EngineRegistry"):
+    """Persistentes tesserocr-Handle (schlägt ohne tesserocr fehl → pytesseract-Subprozess)."""
+    from tesseract_backend import PersistentTesseract
+
+    backend = PersistentTesseract()
+    registry.set_detail("tesseract", mode="tesserocr")
+    return backend
+
+
+# -----------------------
+# Registry
+# -----------------------
+class EngineRegistry:
+    """Build OCR engines on first use; optional background warm-up; per-engine status."""
+
+    def __init__(self) -> None:
+        self._builders: Dict[str, Callable[["EngineRegistry"], object]] = {}
+        self._engines: Dict[str, object] = {}
+        self._status: Dict[str, dict] = {}
+        self._build_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._warmup_thread: Optional[threading.Thread] = None
+        self._warmup_pending = False
+        self._warmup_callbacks: list = []
+
+    def register(self, name: str, builder: Callable[["EngineRegistry"], object]) -> None:
+        """Register (or replace) the builder for ``name``; drops an already built engine."""
+        with self._lock:
+            self._builders[name] = builder
+            self._engines.pop(name, None)
+            self._build_locks.setdefault(name, threading.Lock())
+            self._status[name] = {'state': 'idle', 'load_s': None, 'mode': None, 'error': None}
+
+    def set_detail(self, name: str, **fields) -> None:
+        """Builders report extra status fields (e.g. ``mode='GPU'``)."""
+        with self._lock:
+            if name in self._status:
+                self._status[name].update(fields)
+
+    def get(self, name: str):
+        """Return the engine, building it on first use. None if unknown or the build failed."""
+        with self._lock:
+            if name in self._engines:
+                return self._engines[name]
+            builder = self._builders.get(name)
+            build_lock = self._build_locks.get(name)
+        if builder is None:
+            return None
+
+        with build_lock:
+            with self._lock:
+                # Anderer Thread (z.B. Warm-up) hat inzwischen gebaut oder ist gescheitert
+                if name in self._engines:
+                    return self._engines[name]
+                if self._status[name]['state'] == 'failed':
+                    return None
+                self._status[name]['state'] = 'loading'
+            start = time.perf_counter()
+            try:
+                engine = builder(self)
+                error = None if engine is not None else "builder returned None"
+            except Exception as e:
+                engine, error = None, f"{type(e).__name__}: {e}"
+            with self._lock:
+                status = self._status[name]
+                status['load_s'] = time.perf_counter() - start
+                status['error'] = error
+                status['state'] = 'ready' if error is None else 'failed'
+                if error is None:
+                    self._engines[name] = engine
+            return engine
+
+    def peek(self, name: str):
+        """Return the engine only if it is already built (never triggers a build)."""
+        with self._lock:
+            return self._engines.get(name)
+
+    def is_ready(self, name: str) -> bool:
+        with self._lock:
+            return name in self._engines
+
+    def reset(self, name: str) -> None:
+        """Forget a built/failed engine so the next ``get`` rebuilds it."""
+        with self._lock:
+            self._engines.pop(name, None)
+            if name in self._status:
+                self._status[name].update(state='idle', load_s=None, error=None)
+
+    def warmup(self, names: Optional[Iterable[str]] = None) -> threading.Thread:
+        """Build ``names`` (default: configured engines) in a daemon thread; returns the thread."""
+        names = list(default_engines() if names is None else names)
+
+        def _run():
+            for name in names:
+                self.get(name)
+            with self._lock:
+                self._warmup_pending = False
+                callbacks, self._warmup_callbacks = self._warmup_callbacks, []
+            for callback in callbacks:
+                try:
+                    callback()
+                except Exception as e:
+                    print(f"⚠️  OCR warm-up callback failed: {e}")
+
+        thread = threading.Thread(target=_run, name="ocr-warmup", daemon=True)
+        with self._lock:
+            self._warmup_pending = True
+        self._warmup_thread = thread
+        thread.start()
+        return thread
+
+    def when_warm(self, callback: Callable[[], None]) -> bool:
+        """Run ``callback`` in the warm-up thread once it has finished; False if no warm-up is running."""
+        with self._lock:
+            if not self._warmup_pending:
+                return False
+            self._warmup_callbacks.append(callback)
+            return True
+
+    def status(self) -> Dict[str, dict]:
+        with self._lock:
+            return {name: dict(status) for name, status in self._status.items()}
+
+
+def default_engines() -> list:
+    """Engines the current config needs (as previously built by config.py on import)."""
+    names = []
+    if config.USE_EASYOCR:
+        names.append("easyocr")
+    if config.OCR_ENGINE == 'paddle' or config.OCR_FALLBACK_ENABLED:
+        names.append("paddle")
+    return names
+
+
+_registry: Optional[EngineRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_registry() -> EngineRegistry:
+    """Shared registry with the EasyOCR, PaddleOCR and persistent Tesseract builders registered."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = EngineRegistry()
+            _registry.register("easyocr", build_easyocr)
+            _registry.register("paddle", build_paddle)
+            _registry.register("tesseract", build_tesseract)
+        return _registry
+
+
+def get_reader():
+    """Shared EasyOCR reader (built on first call), or None if unavailable."""
+    if not config.USE_EASYOCR:
+        return None
+    return get_registry().get("easyocr")
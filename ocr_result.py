@@ -0,0 +1,239 @@
+"""
+OCR Result - Strukturiertes OCR-Ergebnis mit Geometrie statt eines flachen Strings
+
+``extract_text`` hat bisher alle EasyOCR-Texte mit Leerzeichen verbunden und
+Boxen/Konfidenzen verworfen. ``split_text_into_log_entries`` muss deshalb per
+Heuristik erraten, welcher Timestamp zu welchem Event gehört, wenn die OCR
+Zeilen umsortiert hat.
+
+``OcrResult`` hält pro erkannter Zeile Text, Box, Konfidenz und Engine -
+kompakt in numpy-Arrays (``boxes`` (N, 4) int32 als x0, y0, x1, y1,
+``confidences`` float32 mit NaN = unbekannt, ``engine_ids`` uint8) statt
+Listen von Tupeln. ``text`` liefert den bisherigen flachen String.
+
+``reconstruct_log_rows`` baut daraus das Log zeilenweise wieder auf: Spans
+nach y zu Zeilen gruppieren, innerhalb der Zeile nach x sortieren, und
+Timestamps, die die OCR als eigene Zeile erkannt hat, der Log-Zeile auf
+gleicher Höhe zuordnen.
+"""
+
+import re
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from config import LETTER_TO_DIGIT
+
+ENGINES = ("easyocr", "paddle", "tesseract", "glyph", "label", "unknown")
+_ENGINE_IDS = {name: idx for idx, name in enumerate(ENGINES)}
+
+# Wie utils.find_all_timestamps (tolerant gegenüber O/0, C/0, T/7)
+_TS_MAP = str.maketrans({**LETTER_TO_DIGIT, 'C': '0', 'c': '0', 'T': '7'})
+_TIMESTAMP_PATTERN = re.compile(r'20\d{2}[.\-/\s]\d{2}[.\-/]\d{2}\s+\d{2}[:\.,\-]\d{2}')
+# Teil-Spans: Datum oder Uhrzeit allein (Timestamp-Spalte zweizeilig/gesplittet)
+_TS_PART_PATTERN = re.compile(r'^\s*(?:20\d{2}[.\-/]\d{2}[.\-/]\d{2}|\d{2}[:\.,\-]\d{2})\s*$')
+
+
+class OcrLine(NamedTuple):
+    text: str
+    box: tuple  # (x0, y0, x1, y1) oder (-1, -1, -1, -1) ohne Geometrie
+    confidence: float
+    engine: str
+
+
+def _engine_id(engine: str) -> int:
+    return _ENGINE_IDS.get(engine, _ENGINE_IDS["unknown"])
+
+
+class OcrResult:
+    """Per-line OCR output (text, box, confidence, engine) in compact arrays."""
+
+    __slots__ = ("texts", "boxes", "confidences", "engine_ids")
+
+    def __init__(self, texts: Sequence[str], boxes=None, confidences=None, engines="easyocr") -> None:
+        count = len(texts)
+        self.texts: List[str] = list(texts)
+        self.boxes = (np.full((count, 4), -1, dtype=np.int32) if boxes is None
+                      else np.asarray(boxes, dtype=np.int32).reshape(count, 4))
+        self.confidences = (np.full(count, np.nan, dtype=np.float32) if confidences is None
+                            else np.asarray(confidences, dtype=np.float32).reshape(count))
+        if isinstance(engines, str):
+            self.engine_ids = np.full(count, _engine_id(engines), dtype=np.uint8)
+        else:
+            self.engine_ids = np.array([_engine_id(e) for e in engines], dtype=np.uint8)
+
+    # -----------------------
+    # Konstruktion
+    # -----------------------
+    @classmethod
+    def from_detections(cls, entries, engine: str = "easyocr", offset=(0, 0)) -> "OcrResult":
+        """From detector output ``(quad, text[, conf])`` (EasyOCR ``readtext(detail=1)``, PaddleOCR); ``offset`` = ROI origin."""
+        texts, boxes, confs = [], [], []
+        dx, dy = offset
+        for entry in entries:
+            if len(entry) == 3:
+                quad, text, conf = entry
+            elif len(entry) == 2:
+                (quad, text), conf = entry, np.nan  # paragraph=True liefert keine Konfidenz
+            else:
+                continue
+            pts = np.asarray(quad, dtype=np.float32).reshape(-1, 2)
+            x0, y0 = pts.min(axis=0)
+            x1, y1 = pts.max(axis=0)
+            texts.append(text)
+            boxes.append((int(x0) + dx, int(y0) + dy, int(np.ceil(x1)) + dx, int(np.ceil(y1)) + dy))
+            confs.append(conf)
+        return cls(texts, boxes if boxes else None, confs if confs else None, engine)
+
+    @classmethod
+    def from_text(cls, text: str, engine: str = "unknown", confidence: Optional[float] = None) -> "OcrResult":
+        """Single line without geometry (Tesseract/PaddleOCR string output, legacy callers)."""
+        if not text:
+            return cls([], engines=engine)
+        conf = None if confidence is None else [confidence]
+        return cls([text], None, conf, engine)
+
+    @classmethod
+    def concat(cls, results: Iterable["OcrResult"]) -> "OcrResult":
+        results = [r for r in results if len(r)]
+        if not results:
+            return cls([])
+        merged = cls([t for r in results for t in r.texts])
+        merged.boxes = np.concatenate([r.boxes for r in results])
+        merged.confidences = np.concatenate([r.confidences for r in results])
+        merged.engine_ids = np.concatenate([r.engine_ids for r in results])
+        return merged
+
+    # -----------------------
+    # Zugriff
+    # -----------------------
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def __iter__(self) -> Iterator[OcrLine]:
+        for idx, text in enumerate(self.texts):
+            yield self.line(idx)
+
+    def line(self, idx: int) -> OcrLine:
+        return OcrLine(self.texts[idx], tuple(int(v) for v in self.boxes[idx]),
+                       float(self.confidences[idx]), ENGINES[self.engine_ids[idx]])
+
+    @property
+    def text(self) -> str:
+        """Flattened legacy string (identical to the former ``" ".join(texts)``)."""
+        return " ".join(self.texts)
+
+    @property
+    def has_geometry(self) -> bool:
+        return bool(len(self)) and bool((self.boxes[:, 2] > self.boxes[:, 0]).all())
+
+    @property
+    def engine(self) -> str:
+        """Engine of the result ('mixed' if lines come from several engines)."""
+        if not len(self):
+            return "unknown"
+        ids = np.unique(self.engine_ids)
+        return ENGINES[ids[0]] if len(ids) == 1 else "mixed"
+
+    def mean_confidence(self) -> Optional[float]:
+        known = self.confidences[~np.isnan(self.confidences)]
+        return float(known.mean()) if known.size else None
+
+    def log_text(self) -> str:
+        """Geometry-aware flattened string (rows in y order, timestamp first), else ``text``."""
+        if not self.has_geometry:
+            return self.text
+        return " ".join(reconstruct_log_rows(self))
+
+    def __repr__(self) -> str:
+        return f"OcrResult(lines={len(self)}, engine={self.engine!r}, text={self.text[:60]!r})"
+
+
+# -----------------------
+# Log-Rekonstruktion
+# -----------------------
+def has_timestamp(text: str) -> bool:
+    """True if ``text`` contains a full log timestamp (OCR letter/digit confusions tolerated)."""
+    return bool(_TIMESTAMP_PATTERN.search(text.translate(_TS_MAP)))
+
+
+def _is_timestamp(text: str) -> bool:
+    normalized = text.translate(_TS_MAP)
+    return bool(_TIMESTAMP_PATTERN.search(normalized) or _TS_PART_PATTERN.match(normalized))
+
+
+def group_rows(result: OcrResult, min_overlap: float = 0.5) -> List[List[int]]:
+    """Group line indices into visual rows (vertical overlap), rows top→bottom, spans left→right."""
+    if not result.has_geometry:
+        return [list(range(len(result)))] if len(result) else []
+    boxes = result.boxes
+    centers = (boxes[:, 1] + boxes[:, 3]) / 2.0
+    rows: List[List[int]] = []
+    bands: List[List[float]] = []  # [y0, y1] je Zeile
+    for idx in np.argsort(centers, kind="stable"):
+        y0, y1 = float(boxes[idx, 1]), float(boxes[idx, 3])
+        height = max(1.0, y1 - y0)
+        if bands:
+            b0, b1 = bands[-1]
+            overlap = min(y1, b1) - max(y0, b0)
+            if overlap >= min_overlap * min(height, max(1.0, b1 - b0)):
+                rows[-1].append(int(idx))
+                bands[-1] = [min(b0, y0), max(b1, y1)]
+                continue
+        rows.append([int(idx)])
+        bands.append([y0, y1])
+    for row in rows:
+        row.sort(key=lambda i: (boxes[i, 0], boxes[i, 1]))
+    return rows
+
+
+def reconstruct_log_rows(result: OcrResult, max_gap_ratio: float = 1.5) -> List[str]:
+    """Rebuild log rows from geometry: ``["<timestamp> <event text>", ...]`` top→bottom.
+
+    Timestamps, die als eigene Zeile erkannt wurden (leicht versetzt zur
+    Event-Zeile), werden der nächstgelegenen Zeile ohne Timestamp zugeordnet,
+    sofern der Abstand der Zeilenmitten ≤ ``max_gap_ratio`` × Median-Zeilenhöhe.
+    """
+    rows = group_rows(result)
+    if not rows or not result.has_geometry:
+        return [result.text] if len(result) else []
+    boxes = result.boxes
+    texts = result.texts
+    heights = boxes[:, 3] - boxes[:, 1]
+    max_gap = max_gap_ratio * float(np.median(heights))
+
+    def center(row):
+        return float(np.mean([(boxes[i, 1] + boxes[i, 3]) / 2.0 for i in row]))
+
+    ts_flags = [[_is_timestamp(texts[i]) for i in row] for row in rows]
+    ts_only = [all(flags) for flags in ts_flags]
+    has_ts = [any(flags) for flags in ts_flags]
+
+    # Reine Timestamp-Zeilen an die nächste Event-Zeile ohne eigenen Timestamp hängen
+    attached: dict = {}
+    for r_idx, row in enumerate(rows):
+        if not ts_only[r_idx]:
+            continue
+        c = center(row)
+        candidates = [
+            (abs(center(rows[t]) - c), t) for t in range(len(rows))
+            if not ts_only[t] and not has_ts[t] and t not in attached
+        ]
+        if not candidates:
+            continue
+        distance, target = min(candidates)
+        if distance <= max_gap:
+            attached[target] = r_idx
+            has_ts[target] = True
+
+    merged_sources = set(attached.values())
+    out = []
+    for r_idx, row in enumerate(rows):
+        if r_idx in merged_sources:
+            continue
+        ordered = [texts[i] for i in row]
+        # Zugeordneter Timestamp an den Zeilenanfang (BDO: Timestamp-Spalte links)
+        if r_idx in attached:
+            ordered = [texts[i] for i in rows[attached[r_idx]]] + ordered
+        out.append(" ".join(s for s in ordered if s))
+    return out
@@ -0,0 +1,154 @@
+"""
+Preprocess Pipeline - Wiederverwendbares Preprocessing mit vorallokierten Buffern
+
+Ersetzt die Allokationen in ``utils.preprocess`` pro Aufruf:
+- CLAHE-Objekt und Schärfungs-Kernel werden EINMAL gebaut
+- Kontrast per convertScaleAbs direkt in den Ausgabebuffer (gemessen ~3x
+  schneller als eine vorberechnete 256er-Tabelle via cv2.LUT)
+- Zwischen- und Ausgabebuffer pro Thread und Frame-Shape vorallokiert
+  (cvtColor/CLAHE/filter2D/convertScaleAbs schreiben per ``dst=`` direkt hinein)
+- Timing pro Schritt (gray/denoise/clahe/sharpen/contrast) für das PERF-Logging
+
+Ergebnis ist pixelgleich zur bisherigen Implementierung.
+
+WICHTIG: Mit ``reuse_output=True`` (Default) gehört das Ergebnis der Pipeline
+und wird beim nächsten Aufruf DESSELBEN Threads mit gleicher Shape
+überschrieben. Wer es länger halten muss, nutzt ``reuse_output=False``.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+import cv2
+import numpy as np
+
+# Parameter wie bisher in utils.preprocess
+CLAHE_CLIP_LIMIT = 1.5
+CLAHE_TILE_GRID = (8, 8)
+SHARPEN_KERNEL = (
+    (0, -0.5, 0),
+    (-0.5, 3, -0.5),
+    (0, -0.5, 0),
+)
+BALANCED_ALPHA, BALANCED_BETA = 1.2, 10
+FAST_ALPHA, FAST_BETA = 1.3, 15
+
+
+class PreprocessPipeline:
+    """Grayscale → (denoise) → CLAHE → sharpen → contrast with reused buffers."""
+
+    def __init__(self, clip_limit: float = CLAHE_CLIP_LIMIT, tile_grid=CLAHE_TILE_GRID,
+                 timing_window: int = 120, max_shapes: int = 4) -> None:
+        self.clip_limit = float(clip_limit)
+        self.max_shapes = max(1, int(max_shapes))
+        self.tile_grid = tuple(tile_grid)
+        self._local = threading.local()
+        self._timings: deque = deque(maxlen=max(1, int(timing_window)))
+        self.last_timing: dict[str, float] = {}
+        self.frames = 0
+        self._kernel = None
+
+    def _ensure_kernel(self) -> None:
+        # Lazy: Tracker-Konstruktion soll ohne numpy/OpenCV-Arbeit auskommen
+        if self._kernel is None:
+            self._kernel = np.array(SHARPEN_KERNEL, dtype=np.float64)
+
+    def _clahe(self):
+        # CLAHE-Objekte sind nicht thread-safe → eins pro Thread
+        clahe = getattr(self._local, "clahe", None)
+        if clahe is None:
+            clahe = cv2.createCLAHE(clipLimit=self.clip_limit, tileGridSize=self.tile_grid)
+            self._local.clahe = clahe
+        return clahe
+
+    def _buffers(self, shape) -> dict:
+        cache = getattr(self._local, "buffers", None)
+        if cache is None:
+            cache = self._local.buffers = {}
+        buffers = cache.get(shape)
+        if buffers is None:
+            # Neue Shape (Region/Teilbereich) → allokieren, älteste Shape verwerfen
+            while len(cache) >= self.max_shapes:
+                cache.pop(next(iter(cache)))
+            buffers = {name: np.empty(shape, dtype=np.uint8) for name in ("gray", "clahe", "sharp", "out")}
+            cache[shape] = buffers
+        return buffers
+
+    def run(self, img, adaptive: bool = True, denoise: bool = False, fast_mode: bool = False,
+            reuse_output: bool = True):
+        """Preprocess ``img`` (BGR/BGRA/gray) exactly like ``utils.preprocess``."""
+        self._ensure_kernel()
+        timing: dict[str, float] = {}
+        start = time.perf_counter()
+        shape = img.shape[:2]
+        buffers = self._buffers(shape)
+
+        if img.ndim == 3:
+            code = cv2.COLOR_BGRA2GRAY if img.shape[2] == 4 else cv2.COLOR_BGR2GRAY
+            gray = cv2.cvtColor(img, code, dst=buffers["gray"])
+        else:
+            gray = img
+        t = time.perf_counter()
+        timing["gray_ms"] = (t - start) * 1000
+
+        out = buffers["out"] if reuse_output else np.empty(shape, dtype=np.uint8)
+        if fast_mode:
+            cv2.convertScaleAbs(gray, dst=out, alpha=FAST_ALPHA, beta=FAST_BETA)
+            timing["contrast_ms"] = (time.perf_counter() - t) * 1000
+            return self._finish(out, timing, start)
+
+        if denoise:
+            gray = cv2.fastNlMeansDenoising(gray, h=7, templateWindowSize=7, searchWindowSize=21)
+            t2 = time.perf_counter()
+            timing["denoise_ms"] = (t2 - t) * 1000
+            t = t2
+
+        if adaptive:
+            gray = self._clahe().apply(gray, dst=buffers["clahe"])
+            t2 = time.perf_counter()
+            timing["clahe_ms"] = (t2 - t) * 1000
+            t = t2
+
+        sharp = cv2.filter2D(gray, -1, self._kernel, dst=buffers["sharp"])
+        t2 = time.perf_counter()
+        timing["sharpen_ms"] = (t2 - t) * 1000
+
+        cv2.convertScaleAbs(sharp, dst=out, alpha=BALANCED_ALPHA, beta=BALANCED_BETA)
+        timing["contrast_ms"] = (time.perf_counter() - t2) * 1000
+        return self._finish(out, timing, start)
+
+    __call__ = run
+
+    def _finish(self, out, timing, start):
+        timing["total_ms"] = (time.perf_counter() - start) * 1000
+        self.last_timing = timing
+        self._timings.append(timing)
+        self.frames += 1
+        return out
+
+    def get_stats(self) -> dict:
+        """Average per-step timings over the rolling window."""
+        timings = list(self._timings)
+        stats = {"frames": self.frames}
+        if not timings:
+            return stats
+        steps = sorted({key for t in timings for key in t})
+        for key in steps:
+            values = [t[key] for t in timings if key in t]
+            stats[f"avg_{key}"] = sum(values) / len(values)
+        return stats
+
+
+_default_pipeline: Optional[PreprocessPipeline] = None
+_default_pipeline_lock = threading.Lock()
+
+
+def get_default_pipeline() -> PreprocessPipeline:
+    """Shared pipeline behind ``utils.preprocess``."""
+    global _default_pipeline
+    with _default_pipeline_lock:
+        if _default_pipeline is None:
+            _default_pipeline = PreprocessPipeline()
+        return _default_pipeline
@@ -0,0 +1,212 @@
+"""
+ROI Detector - Automatische Erkennung des Text-Bereichs im Marktfenster
+
+``detect_log_roi`` lieferte bisher einen festen Anteil (oberste 75%) - ein Wert,
+der über mehrere "CRITICAL FIX"-Revisionen hin- und hergeschoben wurde. Hier
+wird der tatsächliche Text-Bereich (Notifications/Log + Metriken) aus dem
+Frame-Layout bestimmt:
+
+1. Textdichte: horizontale Hell/Dunkel-Wechsel pro Pixelzeile → Textbänder
+2. Icon-Zeilen (Inventar unten, Bänder deutlich höher als eine Textzeile)
+   am oberen/unteren Rand abschneiden
+3. Linke Kante = Timestamp-Spalte (erste Spalte mit Textdichte), rechte
+   Kante = letzte Spalte mit Text
+
+Die Geometrie wird pro Frame-Shape (≙ Capture-Region) und Bild-Art (Kanäle,
+dtype, optionaler Tag wie 'raw') gecacht und alle N Aufrufe bzw. nach
+``mark_stale`` (Change-Gate meldet Layout-Wechsel) auf einem stärker
+verkleinerten Frame günstig gegengeprüft; weicht das Ergebnis deutlich ab oder
+ragt Text über die gecachte Kante hinaus, wird neu erkannt.
+"""
+
+import threading
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+
+from config import (
+    LOG_ROI_DOWNSCALE,
+    LOG_ROI_EDGE_DELTA,
+    LOG_ROI_MIN_EDGE_RATIO,
+    LOG_ROI_MAX_BAND_HEIGHT_RATIO,
+    LOG_ROI_MIN_BANDS,
+    LOG_ROI_MARGIN,
+    LOG_ROI_REVALIDATE_EVERY,
+    LOG_ROI_MIN_IOU,
+)
+
+Roi = Tuple[int, int, int, int]  # (x, y, w, h)
+
+
+def _runs(mask, gap_tolerance: int = 1):
+    """Contiguous True runs ``[(start, end), ...]`` allowing small gaps."""
+    runs = []
+    start = None
+    gap = 0
+    for idx, value in enumerate(mask):
+        if value:
+            if start is None:
+                start = idx
+            gap = 0
+        elif start is not None:
+            gap += 1
+            if gap > gap_tolerance:
+                runs.append((start, idx - gap + 1))
+                start, gap = None, 0
+    if start is not None:
+        runs.append((start, len(mask) - gap))
+    return runs
+
+
+def detect_text_roi(img,
+                    downscale: int = LOG_ROI_DOWNSCALE,
+                    edge_delta: int = LOG_ROI_EDGE_DELTA,
+                    min_edge_ratio: float = LOG_ROI_MIN_EDGE_RATIO,
+                    max_band_height_ratio: float = LOG_ROI_MAX_BAND_HEIGHT_RATIO,
+                    min_bands: int = LOG_ROI_MIN_BANDS,
+                    margin: int = LOG_ROI_MARGIN) -> Optional[Roi]:
+    """Detect the text-bearing area of a market frame → (x, y, w, h) or None."""
+    if img is None or img.ndim < 2:
+        return None
+    gray = img
+    if img.ndim == 3:
+        gray = cv2.cvtColor(img, cv2.COLOR_BGRA2GRAY if img.shape[2] == 4 else cv2.COLOR_BGR2GRAY)
+    full_h, full_w = gray.shape[:2]
+    downscale = max(1, int(downscale))
+    small = gray
+    if downscale > 1:
+        small = cv2.resize(gray, (max(2, full_w // downscale), max(2, full_h // downscale)),
+                           interpolation=cv2.INTER_AREA)
+    h, w = small.shape[:2]
+
+    signed = small.astype(np.int16)
+    edges = np.abs(signed[:, 1:] - signed[:, :-1]) > edge_delta
+    row_profile = np.count_nonzero(edges, axis=1)
+    text_rows = row_profile >= max(2, int(min_edge_ratio * w))
+    bands = [b for b in _runs(text_rows) if b[1] - b[0] >= 2]
+    if len(bands) < min_bands:
+        return None
+
+    # Icon-Zeilen am Rand: Band deutlich höher als eine typische Textzeile
+    median_h = float(np.median([b[1] - b[0] for b in bands]))
+    limit = max_band_height_ratio * median_h
+    while bands and bands[-1][1] - bands[-1][0] > limit:
+        bands.pop()
+    while bands and bands[0][1] - bands[0][0] > limit:
+        bands.pop(0)
+    if len(bands) < min_bands:
+        return None
+    y0, y1 = bands[0][0], bands[-1][1]
+
+    # Spalten-Profil nur innerhalb der Textbänder → Timestamp-Spalte = linke Kante
+    band_rows = np.zeros(h, dtype=bool)
+    for start, end in bands:
+        band_rows[start:end] = True
+    col_profile = np.count_nonzero(edges[band_rows], axis=0)
+    text_cols = np.flatnonzero(col_profile >= 2)
+    if text_cols.size == 0:
+        return None
+    x0, x1 = int(text_cols[0]), int(text_cols[-1]) + 2
+
+    x0 = max(0, x0 * downscale - margin)
+    y0 = max(0, y0 * downscale - margin)
+    x1 = min(full_w, x1 * downscale + margin)
+    y1 = min(full_h, y1 * downscale + margin)
+    if x1 <= x0 or y1 <= y0:
+        return None
+    return x0, y0, x1 - x0, y1 - y0
+
+
+def roi_iou(a: Roi, b: Roi) -> float:
+    ax0, ay0, aw, ah = a
+    bx0, by0, bw, bh = b
+    ix = max(0, min(ax0 + aw, bx0 + bw) - max(ax0, bx0))
+    iy = max(0, min(ay0 + ah, by0 + bh) - max(ay0, by0))
+    inter = ix * iy
+    union = aw * ah + bw * bh - inter
+    return inter / union if union else 0.0
+
+
+def roi_covers(outer: Roi, inner: Roi, tolerance: int = 0) -> bool:
+    """True if ``inner`` lies within ``outer`` grown by ``tolerance`` pixels."""
+    ox, oy, ow, oh = outer
+    ix, iy, iw, ih = inner
+    return (ix >= ox - tolerance and iy >= oy - tolerance
+            and ix + iw <= ox + ow + tolerance and iy + ih <= oy + oh + tolerance)
+
+
+class RoiGeometryCache:
+    """Cache detected ROIs per frame shape and image kind; re-validate cheaply every N lookups."""
+
+    def __init__(self, revalidate_every: int = LOG_ROI_REVALIDATE_EVERY,
+                 min_iou: float = LOG_ROI_MIN_IOU, downscale: int = LOG_ROI_DOWNSCALE) -> None:
+        self.revalidate_every = max(1, int(revalidate_every))
+        self.min_iou = float(min_iou)
+        self.downscale = max(1, int(downscale))
+        self._lock = threading.Lock()
+        # {(h, w, channels, dtype, kind): [roi, lookups_since_validation]}
+        self._entries: dict = {}
+        self.detections = 0
+        self.validations = 0
+        self.invalidations = 0
+        self.hits = 0
+
+    @staticmethod
+    def _key(img, kind: Optional[str]) -> tuple:
+        # Rohbild und preprocessed Bild teilen die Shape, aber nicht das Kantenprofil
+        channels = img.shape[2] if img.ndim == 3 else 1
+        return (img.shape[0], img.shape[1], channels, img.dtype.str, kind)
+
+    def get(self, img, kind: Optional[str] = None) -> Optional[Roi]:
+        """Return the cached/detected text ROI for ``img`` (None → caller falls back)."""
+        key = self._key(img, kind)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry[1] += 1
+                if entry[1] < self.revalidate_every:
+                    self.hits += 1
+                    return entry[0]
+        if entry is not None:
+            # Günstige Gegenprobe auf doppelt so stark verkleinertem Frame
+            with self._lock:
+                self.validations += 1
+            check = detect_text_roi(img, downscale=self.downscale * 2)
+            # Text unterhalb/außerhalb der gecachten Kante (z.B. neue Zeilen) → neu erkennen
+            if (check is not None and roi_iou(check, entry[0]) >= self.min_iou
+                    and roi_covers(entry[0], check, tolerance=self.downscale * 4)):
+                with self._lock:
+                    entry[1] = 0
+                return entry[0]
+            with self._lock:
+                self.invalidations += 1
+        roi = detect_text_roi(img, downscale=self.downscale)
+        with self._lock:
+            self.detections += 1
+            if roi is None:
+                self._entries.pop(key, None)
+            else:
+                self._entries[key] = [roi, 0]
+        return roi
+
+    def mark_stale(self) -> None:
+        """Re-validate every cached ROI on its next lookup (e.g. the change gate saw a layout change)."""
+        with self._lock:
+            for entry in self._entries.values():
+                entry[1] = self.revalidate_every
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {
+                'entries': {f"{k[1]}x{k[0]}x{k[2]}" + (f"/{k[4]}" if k[4] else ""): v[0]
+                            for k, v in self._entries.items()},
+                'hits': self.hits,
+                'detections': self.detections,
+                'validations': self.validations,
+                'invalidations': self.invalidations,
+            }
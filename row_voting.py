@@ -0,0 +1,183 @@
+"""
+Row Voting - Log-Zeilen über mehrere Scans per Mehrheitsentscheid lesen
+
+Dieselbe Log-Zeile ist meist über viele aufeinanderfolgende Scans sichtbar,
+wird aber bisher pro Scan einzeln ausgewertet. Ein OCR-Ausrutscher in einem
+Frame ("xl,O00", "1C-13", "Silve_") landet in Sonderfall-Parsing oder als
+Beinahe-Duplikat, das ``make_content_hash`` und das 20-Minuten-Hash-Fenster
+wieder unterdrücken müssen. Hier:
+
+1. Jede Zeile aus ``split_text_into_log_entries`` wird einer Spur zugeordnet
+   (Ähnlichkeit Timestamp + Text ≥ ``match_threshold``, jede Spur max. einmal
+   pro Scan → echte Doppelzeilen bleiben getrennt)
+2. Die Spur hält die letzten ``history`` Lesungen; Konsens = zeichenweiser
+   Mehrheitsentscheid über die Lesungen der häufigsten Länge (Gleichstand → jüngste)
+3. Übergeben wird eine Zeile erst, wenn sie stabil ist: ≥ ``min_readings``
+   Lesungen und Konsens unverändert zum vorigen Scan. Danach jeden Scan ihr Konsens.
+4. Fehlt eine noch nicht übergebene Zeile in einem Scan, wird ihr Konsens
+   trotzdem übergeben (keine verlorenen Transaktionen) - hinter den Zeilen des
+   aktuellen Scans, untereinander in ihrer alten Reihenfolge (ihre ``pos`` stammt
+   aus dem vorigen Text); nach ``max_age`` Scans ohne Sichtung wird die Spur verworfen
+5. Fensterwechsel (sell/buy overview) → alle Spuren neu
+"""
+
+import difflib
+import threading
+from collections import Counter, deque
+from typing import List, Optional, Sequence, Tuple
+
+from config import (
+    LETTER_TO_DIGIT,
+    ROW_VOTING_HISTORY,
+    ROW_VOTING_MIN_READINGS,
+    ROW_VOTING_MATCH_THRESHOLD,
+    ROW_VOTING_MAX_AGE,
+)
+
+Entry = Tuple[int, str, str]  # (pos, ts_text, snippet) wie split_text_into_log_entries
+
+# Wie utils.find_all_timestamps (tolerant gegenüber O/0, C/0, T/7)
+_TS_MAP = str.maketrans({**LETTER_TO_DIGIT, 'C': '0', 'c': '0', 'T': '7'})
+
+
+def vote_string(readings: Sequence[str]) -> str:
+    """Per-character majority over the readings of the most common length (ties → most recent)."""
+    if not readings:
+        return ""
+    lengths = Counter(len(r) for r in readings)
+    top = max(lengths.values())
+    length = next(len(r) for r in reversed(readings) if lengths[len(r)] == top)
+    same = [r for r in readings if len(r) == length]
+    chars = []
+    for idx in range(length):
+        counts = Counter(r[idx] for r in same)
+        best = max(counts.values())
+        chars.append(next(r[idx] for r in reversed(same) if counts[r[idx]] == best))
+    return "".join(chars)
+
+
+def _match_key(ts_text: str, snippet: str) -> str:
+    ts = "".join(ch for ch in (ts_text or "").translate(_TS_MAP) if ch.isdigit())
+    return f"{ts} {' '.join((snippet or '').lower().split())}"
+
+
+class _RowTrack:
+    __slots__ = ("ts_readings", "snippet_readings", "pos", "consensus", "key", "committed", "age")
+
+    def __init__(self, history: int) -> None:
+        self.ts_readings: deque = deque(maxlen=history)
+        self.snippet_readings: deque = deque(maxlen=history)
+        self.pos = 0
+        self.consensus: Optional[Tuple[str, str]] = None
+        self.key = ""
+        self.committed = False
+        self.age = 0
+
+    def add(self, pos: int, ts_text: str, snippet: str) -> bool:
+        """Add a reading; True if the consensus is unchanged by it (first reading counts as unchanged)."""
+        self.ts_readings.append(ts_text)
+        self.snippet_readings.append(snippet)
+        self.pos = pos
+        self.age = 0
+        previous = self.consensus
+        self.consensus = (vote_string(self.ts_readings), vote_string(self.snippet_readings))
+        self.key = _match_key(*self.consensus)
+        return previous is None or previous == self.consensus
+
+
+class RowVoter:
+    """Per-row reading history across scans with per-character consensus and stable-only commits."""
+
+    def __init__(self, history: int = ROW_VOTING_HISTORY,
+                 min_readings: int = ROW_VOTING_MIN_READINGS,
+                 match_threshold: float = ROW_VOTING_MATCH_THRESHOLD,
+                 max_age: int = ROW_VOTING_MAX_AGE) -> None:
+        self.history = max(1, int(history))
+        self.min_readings = max(1, min(int(min_readings), self.history))
+        self.match_threshold = float(match_threshold)
+        self.max_age = max(1, int(max_age))
+        self._lock = threading.Lock()
+        self._tracks: List[_RowTrack] = []
+        self._context = None
+        self.scans = 0
+        self.readings = 0
+        self.committed = 0
+        self.withheld = 0
+        self.corrected = 0
+        self.orphans = 0
+
+    def reset(self) -> None:
+        with self._lock:
+            self._tracks = []
+            self._context = None
+
+    def _best_track(self, key: str, taken: set) -> Optional[_RowTrack]:
+        best, best_ratio = None, self.match_threshold
+        for track in self._tracks:
+            if id(track) in taken:
+                continue
+            matcher = difflib.SequenceMatcher(None, key, track.key, autojunk=False)
+            if matcher.real_quick_ratio() < best_ratio or matcher.quick_ratio() < best_ratio:
+                continue
+            ratio = matcher.ratio()
+            if ratio >= best_ratio:
+                best, best_ratio = track, ratio
+        return best
+
+    def update(self, entries: Sequence[Entry], context=None) -> List[Entry]:
+        """One scan's entries → consensus entries of stable rows (sorted by ``pos``, orphans last)."""
+        with self._lock:
+            if context != self._context:
+                self._tracks = []
+                self._context = context
+            self.scans += 1
+            taken: set = set()
+            output = []
+            for pos, ts_text, snippet in entries:
+                track = self._best_track(_match_key(ts_text, snippet), taken)
+                if track is None:
+                    track = _RowTrack(self.history)
+                    self._tracks.append(track)
+                taken.add(id(track))
+                unchanged = track.add(pos, ts_text, snippet)
+                self.readings += 1
+                if not track.committed and len(track.ts_readings) >= self.min_readings and unchanged:
+                    track.committed = True
+                    self.committed += 1
+                if not track.committed:
+                    self.withheld += 1
+                    continue
+                ts_vote, snippet_vote = track.consensus
+                if (ts_vote, snippet_vote) != (ts_text, snippet):
+                    self.corrected += 1
+                output.append((pos, ts_vote, snippet_vote))
+
+            # pos der Waisen gilt im vorigen Text → hinter den aktuellen Scan schieben
+            end = max((entry[0] for entry in entries), default=-1) + 1
+            orphans = []
+            kept = []
+            for track in self._tracks:
+                if id(track) not in taken:
+                    track.age += 1
+                    if not track.committed:
+                        # Verschwindet vor der Stabilisierung → trotzdem übergeben
+                        track.committed = True
+                        self.orphans += 1
+                        orphans.append((end + track.pos, *track.consensus))
+                if track.age <= self.max_age:
+                    kept.append(track)
+            self._tracks = kept
+        return sorted(output, key=lambda entry: entry[0]) + sorted(orphans, key=lambda entry: entry[0])
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {
+                'scans': self.scans,
+                'active_rows': len(self._tracks),
+                'readings': self.readings,
+                'committed_rows': self.committed,
+                'withheld_readings': self.withheld,
+                'corrected_readings': self.corrected,
+                'correction_rate': (self.corrected / self.readings * 100) if self.readings else 0.0,
+                'orphan_commits': self.orphans,
+            }
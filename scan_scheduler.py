@@ -0,0 +1,190 @@
+"""
+Scan Scheduler - Messwertbasierte Scan-Kadenz statt fester Poll-Konstanten
+
+Ersetzt die festen Werte (poll_interval ≤ 0.5s, Burst 0.08s) durch eine
+Entscheidung pro Scan auf Basis von Messungen:
+
+- OCR-Latenz (rollierender Median der Scans mit OCR)
+- Frame-Änderungsrate (EWMA: Anteil Scans, die das Change-Gate passieren)
+- Fenster-Übergänge (Detail ↔ Overview → kurzes Burst-Fenster)
+- Markt geschlossen / kein Fokus → exponentielles Backoff
+
+Intervall = max(Latenz-Intervall, CPU-Budget-Intervall), begrenzt auf
+[min_interval, max_interval]:
+
+    Latenz:  interval + ocr_p50            ≤ target_latency
+    Budget:  cost / (cost + interval)      ≤ cpu_budget
+             cost = change_rate * ocr_cost + (1 - change_rate) * skip_cost
+
+Jede Entscheidung wird mit Grund und Eingangswerten als Metrik festgehalten.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+from config import (
+    SCHED_TARGET_LATENCY,
+    SCHED_BURST_TARGET_LATENCY,
+    SCHED_CPU_BUDGET,
+    SCHED_BURST_CPU_BUDGET,
+    SCHED_MIN_INTERVAL,
+    SCHED_CLOSED_BACKOFF_MAX,
+    SCHED_TRANSITION_BURST_SECONDS,
+    SCHED_SAMPLE_WINDOW,
+    SCHED_CHANGE_RATE_ALPHA,
+)
+
+_OVERVIEW_WINDOWS = ("sell_overview", "buy_overview")
+_DETAIL_WINDOWS = ("sell_item", "buy_item")
+# 2**16 × max_interval liegt weit über jedem closed_backoff_max; verhindert OverflowError
+_MAX_BACKOFF_EXPONENT = 16
+
+
+class ScanScheduler:
+    """Choose the next scan time from measured OCR latency, change rate and window state."""
+
+    def __init__(self,
+                 max_interval: float,
+                 min_interval: float = SCHED_MIN_INTERVAL,
+                 target_latency: float = SCHED_TARGET_LATENCY,
+                 burst_target_latency: float = SCHED_BURST_TARGET_LATENCY,
+                 cpu_budget: float = SCHED_CPU_BUDGET,
+                 burst_cpu_budget: float = SCHED_BURST_CPU_BUDGET,
+                 closed_backoff_max: float = SCHED_CLOSED_BACKOFF_MAX,
+                 transition_burst_seconds: float = SCHED_TRANSITION_BURST_SECONDS,
+                 sample_window: int = SCHED_SAMPLE_WINDOW,
+                 change_rate_alpha: float = SCHED_CHANGE_RATE_ALPHA) -> None:
+        self.min_interval = max(0.0, float(min_interval))
+        self.max_interval = max(self.min_interval, float(max_interval))
+        self.target_latency = float(target_latency)
+        self.burst_target_latency = float(burst_target_latency)
+        self.cpu_budget = min(1.0, max(0.01, float(cpu_budget)))
+        self.burst_cpu_budget = min(1.0, max(0.01, float(burst_cpu_budget)))
+        self.closed_backoff_max = max(self.max_interval, float(closed_backoff_max))
+        self.transition_burst_seconds = float(transition_burst_seconds)
+        self.change_rate_alpha = min(1.0, max(0.01, float(change_rate_alpha)))
+
+        self._lock = threading.Lock()
+        self._ocr_samples: deque = deque(maxlen=max(1, int(sample_window)))
+        self._skip_samples: deque = deque(maxlen=max(1, int(sample_window)))
+        self.change_rate = 1.0  # pessimistisch starten: jeder Scan kostet OCR
+        self.closed_streak = 0
+        self._idle = False  # Streak stammt aus record_idle (kein Frame)
+        self.window_type: Optional[str] = None
+        self._transition_burst_until = 0.0
+        self.decisions: deque = deque(maxlen=200)
+        self.last_decision: dict = {}
+
+    # -----------------------
+    # Observations
+    # -----------------------
+    def record_scan(self, cost_s: float, ocr_ran: bool, window_type: Optional[str] = None,
+                    now: Optional[float] = None) -> None:
+        """Record one scan: total processing cost, whether OCR ran and the detected window."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            cost_s = max(0.0, float(cost_s))
+            if ocr_ran:
+                self._ocr_samples.append(cost_s)
+            else:
+                self._skip_samples.append(cost_s)
+            a = self.change_rate_alpha
+            self.change_rate = (1 - a) * self.change_rate + a * (1.0 if ocr_ran else 0.0)
+            if self._idle:
+                # Wieder ein Frame (Fokus zurück) → Backoff sofort beenden, auch wenn das
+                # Change-Gate die OCR überspringt und kein window_type kommt
+                self._idle = False
+                self.closed_streak = 0
+                self.window_type = None
+            if window_type is not None:
+                self._record_window_locked(window_type, now)
+
+    def record_idle(self, reason: str = "closed") -> None:
+        """No usable market frame (focus lost / no capture) → counts toward closed backoff."""
+        with self._lock:
+            self.closed_streak += 1
+            self._idle = True
+            self.window_type = reason
+
+    def _record_window_locked(self, window_type: str, now: float) -> None:
+        prev = self.window_type
+        if window_type in _OVERVIEW_WINDOWS or window_type in _DETAIL_WINDOWS:
+            self.closed_streak = 0
+            if prev is not None and prev != window_type and (
+                    prev in _DETAIL_WINDOWS or window_type in _DETAIL_WINDOWS):
+                self._transition_burst_until = now + self.transition_burst_seconds
+        else:
+            self.closed_streak += 1
+        self.window_type = window_type
+
+    # -----------------------
+    # Decision
+    # -----------------------
+    @staticmethod
+    def _median(values) -> float:
+        ordered = sorted(values)
+        if not ordered:
+            return 0.0
+        mid = len(ordered) // 2
+        if len(ordered) % 2:
+            return ordered[mid]
+        return (ordered[mid - 1] + ordered[mid]) / 2
+
+    def next_interval(self, burst_hint: bool = False, now: Optional[float] = None) -> float:
+        """Return seconds until the next scan (``burst_hint`` = tracker requested a burst)."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            ocr_p50 = self._median(self._ocr_samples)
+            skip_cost = (sum(self._skip_samples) / len(self._skip_samples)) if self._skip_samples else 0.0
+            expected_cost = self.change_rate * ocr_p50 + (1.0 - self.change_rate) * skip_cost
+            burst = burst_hint or now < self._transition_burst_until
+
+            if self.closed_streak > 0 and not burst:
+                interval = min(self.closed_backoff_max,
+                               self.max_interval * (2 ** min(self.closed_streak - 1, _MAX_BACKOFF_EXPONENT)))
+                reason = "closed_backoff"
+            else:
+                target = self.burst_target_latency if burst else self.target_latency
+                budget = self.burst_cpu_budget if burst else self.cpu_budget
+                latency_iv = target - ocr_p50
+                budget_iv = expected_cost * (1.0 - budget) / budget
+                if budget_iv > latency_iv:
+                    interval, reason = budget_iv, "cpu_budget"
+                else:
+                    interval, reason = latency_iv, "latency"
+                interval = min(self.max_interval, max(self.min_interval, interval))
+                if burst:
+                    reason = f"burst_{reason}"
+
+            decision = {
+                'interval': interval,
+                'reason': reason,
+                'ocr_p50_ms': ocr_p50 * 1000,
+                'expected_cost_ms': expected_cost * 1000,
+                'change_rate': self.change_rate,
+                'closed_streak': self.closed_streak,
+                'burst': burst,
+                'window': self.window_type,
+            }
+            self.last_decision = decision
+            self.decisions.append(decision)
+            return interval
+
+    def get_metrics(self) -> dict:
+        """Return the latest decision plus aggregate scheduler metrics."""
+        with self._lock:
+            decisions = list(self.decisions)
+            last = dict(self.last_decision)
+        reasons: dict[str, int] = {}
+        for d in decisions:
+            reasons[d['reason']] = reasons.get(d['reason'], 0) + 1
+        avg_interval = (sum(d['interval'] for d in decisions) / len(decisions)) if decisions else 0.0
+        return {
+            'last': last,
+            'avg_interval': avg_interval,
+            'scans_per_minute': (60.0 / avg_interval) if avg_interval > 0 else 0.0,
+            'reasons': reasons,
+            'ocr_samples': len(self._ocr_samples),
+        }
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+OCR Autotune: EasyOCR-Parameter + Torch-Threads für DIESEN Rechner bestimmen
+
+Spielt ein gelabeltes Frame-Set (.bdofr, siehe scripts/utils/replay_frames.py)
+über das Raster aus config.OCR_AUTOTUNE_GRID ab, misst Latenz und
+Transaktions-Genauigkeit und speichert die Pareto-beste Konfiguration in
+tracker_settings ('ocr_tuning'). extract_text und der EasyOCR-Reader nutzen
+sie ab dem nächsten Start (config.OCR_AUTOTUNE_APPLY).
+
+    # 1. Label-Entwurf aus der aktuellen Konfiguration, danach von Hand prüfen
+    python scripts/autotune_ocr.py session.bdofr --labels session.labels.json --make-labels
+    # 2. Tunen und speichern
+    python scripts/autotune_ocr.py session.bdofr --labels session.labels.json
+    # Gespeichertes Tuning verwerfen
+    python scripts/autotune_ocr.py --reset
+
+Labels: JSON-Liste pro Frame, je Frame eine Liste von
+[type, item, qty, price, timestamp-ISO] (Format von ocr_autotune.transaction_keys).
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmark_preprocess import load_frames
+import ocr_autotune
+from config import OCR_AUTOTUNE_ACCURACY_TOLERANCE, get_ocr_tuning, set_ocr_tuning
+
+
+def _format(result):
+    params = " ".join(f"{key}={value}" for key, value in result['params'].items())
+    return (f"{result['latency_ms']:7.1f}ms (p95 {result['p95_ms']:7.1f}ms) "
+            f"F1 {result['f1'] * 100:5.1f}% threads={result['torch_threads']:<2} {params}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("recording", nargs="?", help="Frame-Aufnahme (.bdofr)")
+    parser.add_argument("--labels", help="Label-Datei (JSON, eine Liste pro Frame)")
+    parser.add_argument("--make-labels", action="store_true", help="Label-Entwurf schreiben statt zu tunen")
+    parser.add_argument("--frames", type=int, default=20, help="Max. Frames aus der Aufnahme (0 = alle)")
+    parser.add_argument("--threads", type=int, nargs="+", help="Torch-Thread-Zahlen (Default: 1, 2, Hälfte, alle)")
+    parser.add_argument("--tolerance", type=float, default=OCR_AUTOTUNE_ACCURACY_TOLERANCE,
+                        help="Max. F1-Verlust gegenüber der genauesten Konfiguration")
+    parser.add_argument("--dry-run", action="store_true", help="Nur anzeigen, nicht speichern")
+    parser.add_argument("--reset", action="store_true", help="Gespeichertes Tuning löschen")
+    args = parser.parse_args()
+
+    if args.reset:
+        set_ocr_tuning(None)
+        print("✅ OCR-Tuning zurückgesetzt (eingebaute EasyOCR-Parameter)")
+        return 0
+    if not args.recording or not args.labels:
+        parser.error("Aufnahme und --labels angeben")
+
+    frames = load_frames(args.recording, args.frames)
+    if not frames:
+        print("❌ Keine Frames gefunden")
+        return 1
+
+    print("=" * 80)
+    print("🔧 OCR Autotune: EasyOCR-Parameter × Torch-Threads")
+    print("=" * 80)
+    print(f"Quelle: {args.recording} | Frames: {len(frames)} | Shape: {frames[0].shape}")
+    previous = get_ocr_tuning()
+    if previous:
+        print(f"Bisheriges Tuning: {previous.get('params')} threads={previous.get('torch_threads')}")
+    print()
+
+    if args.make_labels:
+        labels = ocr_autotune.make_labels(frames)
+        Path(args.labels).write_text(json.dumps(labels, indent=1), encoding="utf-8")
+        print(f"📝 {sum(len(l) for l in labels)} Transaktionen in {args.labels} - bitte prüfen/korrigieren")
+        return 0
+
+    labels = json.loads(Path(args.labels).read_text(encoding="utf-8"))[:len(frames)]
+    grid_size = len(ocr_autotune.iter_grid())
+    print(f"Raster: {grid_size} Parameter-Kombinationen, danach Threads für die Pareto-Front")
+    report = ocr_autotune.run_autotune(
+        frames, labels, threads=args.threads, tolerance=args.tolerance,
+        progress=lambda result: print("   " + _format(result)),
+    )
+
+    print()
+    print("Pareto-Front (schnellste zuerst):")
+    for result in report['front']:
+        print("   " + _format(result))
+    best = report['best']
+    if best is None:
+        print("❌ Keine Konfiguration gemessen")
+        return 1
+    print()
+    print("Auswahl: " + _format(best))
+    if args.dry_run:
+        print("(dry run - nicht gespeichert)")
+        return 0
+    tuning = ocr_autotune.persist_tuning(best)
+    print(f"✅ In tracker_settings gespeichert (host={tuning['host']}, cpu_count={tuning['cpu_count']})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Import-Zeit-Benchmark: lädt ``import <modul>`` noch OCR-Modelle?
+
+Früher hat ``import config`` (und damit ``import parsing``, ``check_db.py``,
+die Unit-Tests, ...) einen EasyOCR-Reader gebaut, torch importiert und CUDA
+geprüft. Seit der Lazy-Engine-Registry (ocr_registry.py) passiert das erst
+beim ersten OCR-Aufruf.
+
+Jedes Modul wird in einem frischen Interpreter importiert (kein Cache-Effekt):
+
+    python scripts/benchmark_import_time.py
+    python scripts/benchmark_import_time.py parsing config database --repeat 5
+
+Exit-Code 1, wenn eines der Module easyocr/torch/paddleocr lädt (oder nicht
+importierbar ist).
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+HEAVY_MODULES = ("easyocr", "torch", "paddleocr", "paddle")
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "seconds": elapsed,
+    "heavy": sorted(m for m in {heavy!r} if m in sys.modules),
+    "modules": len(sys.modules),
+}}))
+"""
+
+
+def measure(module, repeat):
+    runs = []
+    for _ in range(repeat):
+        proc = subprocess.run(
+            [sys.executable, "-c", _PROBE.format(module=module, heavy=HEAVY_MODULES)],
+            cwd=ROOT, capture_output=True, text=True,
+        )
+        if proc.returncode != 0:
+            return {"error": proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "failed"}
+        runs.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+    return {
+        "median_s": statistics.median(r["seconds"] for r in runs),
+        "heavy": runs[-1]["heavy"],
+        "modules": runs[-1]["modules"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("modules", nargs="*", default=["config", "parsing", "database"])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("🔬 Import-Zeit-Benchmark (frischer Interpreter pro Import)")
+    print("=" * 80)
+
+    failed = errors = False
+    for module in args.modules:
+        result = measure(module, max(1, args.repeat))
+        if "error" in result:
+            print(f"   {module:<12} ❌ Import fehlgeschlagen: {result['error']}")
+            errors = True
+            continue
+        heavy = result["heavy"]
+        marker = "❌" if heavy else "✅"
+        print(f"   {module:<12} {marker} median {result['median_s'] * 1000:8.1f}ms | "
+              f"{result['modules']:4d} Module | Modelle: {', '.join(heavy) if heavy else 'keine'}")
+        failed = failed or bool(heavy)
+
+    print()
+    if failed:
+        print("❌ OCR-Modelle beim Import geladen")
+    elif errors:
+        print("⚠️  Nicht alle Module importierbar (fehlende Abhängigkeiten?)")
+    else:
+        print("✅ Kein Import lädt OCR-Modelle")
+    return 1 if failed or errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
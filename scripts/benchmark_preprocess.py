@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Performance Benchmark: PreprocessPipeline vs. bisheriges utils.preprocess
+
+Vergleicht auf aufgenommenen Frames (.bdofr, siehe scripts/utils/replay_frames.py):
+1. Legacy-Implementation (neues CLAHE-Objekt/Kernel + neue Arrays pro Aufruf)
+2. PreprocessPipeline (einmal gebaut, vorallokierte Buffer)
+
+    python scripts/benchmark_preprocess.py session.bdofr --repeat 5
+    python scripts/benchmark_preprocess.py --synthetic 50
+
+Prüft zusätzlich, dass beide Varianten pixelgleiche Ergebnisse liefern.
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import cv2
+import numpy as np
+
+from preprocess_pipeline import PreprocessPipeline
+
+
+def preprocess_legacy(img, adaptive=True, denoise=False, fast_mode=False):
+    """
+    Legacy implementation of utils.preprocess.
+    Kept for benchmark comparison only.
+    """
+    if img.ndim == 3:
+        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+    else:
+        gray = img.copy()
+    if fast_mode:
+        return cv2.convertScaleAbs(gray, alpha=1.3, beta=15)
+    if denoise:
+        gray = cv2.fastNlMeansDenoising(gray, h=7, templateWindowSize=7, searchWindowSize=21)
+    if adaptive:
+        clahe = cv2.createCLAHE(clipLimit=1.5, tileGridSize=(8, 8))
+        gray = clahe.apply(gray)
+    kernel_sharp = np.array([
+        [0, -0.5, 0],
+        [-0.5, 3, -0.5],
+        [0, -0.5, 0]
+    ])
+    sharpened = cv2.filter2D(gray, -1, kernel_sharp)
+    return cv2.convertScaleAbs(sharpened, alpha=1.2, beta=10)
+
+
+def load_frames(path, limit):
+    from frame_recorder import FrameRecording
+
+    recording = FrameRecording(path)
+    count = len(recording) if limit <= 0 else min(limit, len(recording))
+    # Kopieren: Recording wird danach geschlossen (mmap)
+    frames = [np.array(recording[i]) for i in range(count)]
+    recording.close()
+    return frames
+
+
+def synthetic_frames(count, width=1089, height=699):
+    # Größe der Standard-Region (734,371 – 1823,1070)
+    rng = np.random.default_rng(0)
+    frames = []
+    for idx in range(count):
+        img = np.full((height, width, 3), 25, dtype=np.uint8)
+        img += rng.integers(0, 12, size=img.shape, dtype=np.uint8)
+        for row in range(12):
+            cv2.putText(img, f"2025.10.18 15.{idx % 60:02d} Transaction of Birch Sap x{row}000",
+                        (10, 30 + 45 * row), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (220, 220, 220), 1)
+        frames.append(img)
+    return frames
+
+
+def bench(fn, frames, repeat, **kwargs):
+    timings = []
+    for _ in range(repeat):
+        for frame in frames:
+            start = time.perf_counter()
+            fn(frame, **kwargs)
+            timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("recording", nargs="?", help="Frame-Aufnahme (.bdofr)")
+    parser.add_argument("--frames", type=int, default=0, help="Max. Frames aus der Aufnahme (0 = alle)")
+    parser.add_argument("--synthetic", type=int, default=0, help="Synthetische Frames statt Aufnahme")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.recording:
+        frames = load_frames(args.recording, args.frames)
+        source = args.recording
+    elif args.synthetic > 0:
+        frames = synthetic_frames(args.synthetic)
+        source = "synthetic"
+    else:
+        parser.error("Aufnahme angeben oder --synthetic N")
+    if not frames:
+        print("❌ Keine Frames gefunden")
+        return 1
+
+    print("=" * 80)
+    print("🔬 Performance Benchmark: PreprocessPipeline vs Legacy preprocess")
+    print("=" * 80)
+    print(f"Quelle: {source} | Frames: {len(frames)} | Shape: {frames[0].shape} | Repeat: {args.repeat}")
+    print()
+
+    pipeline = PreprocessPipeline()
+    for label, kwargs in (("balanced", {"adaptive": True}), ("fast_mode", {"fast_mode": True})):
+        mismatches = sum(
+            not np.array_equal(preprocess_legacy(f, **kwargs), pipeline.run(f, **kwargs)) for f in frames
+        )
+        legacy = bench(preprocess_legacy, frames, args.repeat, **kwargs)
+        piped = bench(pipeline.run, frames, args.repeat, **kwargs)
+        legacy_med, piped_med = statistics.median(legacy), statistics.median(piped)
+        speedup = legacy_med / piped_med if piped_med > 0 else float("inf")
+        print(f"[{label}]")
+        print(f"   Legacy:   median {legacy_med:7.2f}ms  p95 {sorted(legacy)[int(len(legacy) * 0.95) - 1]:7.2f}ms")
+        print(f"   Pipeline: median {piped_med:7.2f}ms  p95 {sorted(piped)[int(len(piped) * 0.95) - 1]:7.2f}ms")
+        print(f"   Speedup:  {speedup:.2f}x | Pixel-Abweichungen: {mismatches}/{len(frames)}")
+        print()
+
+    stats = pipeline.get_stats()
+    print("Pipeline-Schritte (Ø ms): " + ", ".join(
+        f"{key[4:-3]}={value:.2f}" for key, value in stats.items() if key.startswith("avg_")
+    ))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Performance Benchmark: Batched Recognition (ocr_engines.recognize_batch)
+
+Zerlegt Frames in Zeilen-Crops (Textbänder wie line_band_ocr) und misst den
+Recognizer-Durchsatz:
+1. Einzeln: ein readtext()-Aufruf (Detektor + Recognizer) pro Crop
+2. Batched: recognize_batch() mit verschiedenen Batch-Größen (nur Recognizer)
+
+    python scripts/benchmark_recognize_batch.py session.bdofr --frames 20
+    python scripts/benchmark_recognize_batch.py --synthetic 5 --batch-sizes 1 8 16 32
+
+Ergebnis → OCR_RECOGNIZE_BATCH_SIZE in config.py.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import cv2
+
+from benchmark_preprocess import load_frames, synthetic_frames
+from line_band_ocr import segment_text_bands
+from ocr_engines import get_batch_stats, recognize_batch, reset_batch_stats
+from ocr_registry import get_reader
+
+
+def frame_crops(frames):
+    crops = []
+    for frame in frames:
+        gray = frame if frame.ndim == 2 else cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        crops.extend(gray[y0:y1] for y0, y1 in segment_text_bands(gray))
+    return crops
+
+
+def bench_single(reader, crops):
+    start = time.perf_counter()
+    texts = [" ".join(reader.readtext(crop, detail=0)) for crop in crops]
+    return time.perf_counter() - start, texts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("recording", nargs="?", help="Frame-Aufnahme (.bdofr)")
+    parser.add_argument("--frames", type=int, default=10, help="Max. Frames aus der Aufnahme (0 = alle)")
+    parser.add_argument("--synthetic", type=int, default=0, help="Synthetische Frames statt Aufnahme")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 4, 8, 16, 32])
+    parser.add_argument("--engine", default="easyocr", choices=["easyocr", "paddle", "tesseract"])
+    parser.add_argument("--skip-single", action="store_true", help="readtext()-Referenz überspringen")
+    args = parser.parse_args()
+
+    if args.recording:
+        frames = load_frames(args.recording, args.frames)
+        source = args.recording
+    elif args.synthetic > 0:
+        frames = synthetic_frames(args.synthetic)
+        source = "synthetic"
+    else:
+        parser.error("Aufnahme angeben oder --synthetic N")
+    crops = frame_crops(frames)
+    if not crops:
+        print("❌ Keine Textbänder gefunden")
+        return 1
+
+    print("=" * 80)
+    print(f"🔬 Performance Benchmark: Batched Recognition ({args.engine})")
+    print("=" * 80)
+    print(f"Quelle: {source} | Frames: {len(frames)} | Zeilen-Crops: {len(crops)}")
+    print()
+
+    reader = get_reader() if args.engine == "easyocr" else None
+    if args.engine == "easyocr" and reader is None:
+        print("❌ EasyOCR nicht verfügbar")
+        return 1
+
+    reference = None
+    if reader is not None and not args.skip_single:
+        seconds, reference = bench_single(reader, crops)
+        print(f"[readtext pro Crop]  {len(crops) / seconds:7.1f} crops/s  ({seconds * 1000 / len(crops):6.1f}ms/crop)")
+
+    for batch_size in args.batch_sizes:
+        reset_batch_stats()
+        results = recognize_batch(crops, engine=args.engine, batch_size=batch_size, reader=reader)
+        stats = get_batch_stats().get(args.engine)
+        if not stats:
+            print(f"[batch_size={batch_size:3d}]  ⚠️ keine Ergebnisse")
+            continue
+        line = (f"[batch_size={batch_size:3d}]  {stats['crops_per_s']:7.1f} crops/s  "
+                f"({stats['avg_ms_per_crop']:6.1f}ms/crop, {stats['batches']} Batches)")
+        if reference is not None:
+            same = sum(ref.strip() == res.text.strip() for ref, res in zip(reference, results))
+            line += f" | gleicher Text wie readtext: {same}/{len(crops)}"
+        print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
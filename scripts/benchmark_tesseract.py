@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Performance Benchmark: Persistentes Tesseract (tesserocr) vs. pytesseract-Subprozess
+
+Vergleicht auf aufgenommenen Frames (.bdofr) oder synthetischen Frames:
+1. pytesseract.image_to_string (Prozess-Start + Temp-Bild + Modell-Laden pro Aufruf)
+2. PersistentTesseract (ein C-API-Handle, numpy-Buffer direkt)
+
+    python scripts/benchmark_tesseract.py session.bdofr --frames 20
+    python scripts/benchmark_tesseract.py --synthetic 10 --repeat 3
+
+Beide Varianten nutzen PSM 6 + die Whitelist aus utils.extract_text; die
+Ausgaben werden auf Gleichheit verglichen.
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import cv2
+
+from benchmark_preprocess import load_frames, synthetic_frames
+from config import TESS_PATH
+
+WHITELIST = "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ .,':x-()[]/"
+
+
+def bench(fn, frames, repeat):
+    timings, texts = [], []
+    for _ in range(repeat):
+        for frame in frames:
+            start = time.perf_counter()
+            texts.append(fn(frame))
+            timings.append((time.perf_counter() - start) * 1000)
+    return timings, texts
+
+
+def report(label, timings):
+    p95 = sorted(timings)[max(0, int(len(timings) * 0.95) - 1)]
+    print(f"   {label:<12} median {statistics.median(timings):8.2f}ms  p95 {p95:8.2f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("recording", nargs="?", help="Frame-Aufnahme (.bdofr)")
+    parser.add_argument("--frames", type=int, default=10, help="Max. Frames aus der Aufnahme (0 = alle)")
+    parser.add_argument("--synthetic", type=int, default=0, help="Synthetische Frames statt Aufnahme")
+    parser.add_argument("--repeat", type=int, default=2)
+    args = parser.parse_args()
+
+    if args.recording:
+        frames = load_frames(args.recording, args.frames)
+        source = args.recording
+    elif args.synthetic > 0:
+        frames = synthetic_frames(args.synthetic)
+        source = "synthetic"
+    else:
+        parser.error("Aufnahme angeben oder --synthetic N")
+    if not frames:
+        print("❌ Keine Frames gefunden")
+        return 1
+    frames = [f if f.ndim == 2 else cv2.cvtColor(f, cv2.COLOR_BGR2GRAY) for f in frames]
+
+    print("=" * 80)
+    print("🔬 Performance Benchmark: Tesseract persistent (tesserocr) vs subprocess (pytesseract)")
+    print("=" * 80)
+    print(f"Quelle: {source} | Frames: {len(frames)} | Shape: {frames[0].shape} | Repeat: {args.repeat}")
+    print()
+
+    import pytesseract
+    from PIL import Image
+
+    pytesseract.pytesseract.tesseract_cmd = TESS_PATH
+    sub_config = f'--psm 6 --oem 3 -c tessedit_char_whitelist="{WHITELIST}"'
+    sub_timings, sub_texts = bench(
+        lambda f: pytesseract.image_to_string(Image.fromarray(f), config=sub_config), frames, args.repeat
+    )
+
+    try:
+        from tesseract_backend import PersistentTesseract
+        backend = PersistentTesseract()
+    except Exception as exc:
+        print(f"❌ tesserocr nicht verfügbar ({exc}) - nur Subprozess gemessen")
+        report("subprocess", sub_timings)
+        return 1
+    print(f"Handle-Init (einmalig): {backend.init_ms:.1f}ms")
+    api_timings, api_texts = bench(lambda f: backend.image_to_string(f, whitelist=WHITELIST), frames, args.repeat)
+    backend.close()
+
+    report("subprocess", sub_timings)
+    report("persistent", api_timings)
+    speedup = statistics.median(sub_timings) / max(1e-9, statistics.median(api_timings))
+    same = sum(a.strip() == b.strip() for a, b in zip(sub_texts, api_texts))
+    print(f"   Speedup:     {speedup:.2f}x | Gleicher Text: {same}/{len(sub_texts)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Genauigkeit/Speed: EasyOCR-Detection auf verkleinerter ROI (EASYOCR_DETECT_SCALE)
+
+Für jeden Frame des Replay-Korpus (.bdofr, siehe scripts/utils/replay_frames.py):
+1. Preprocessing + Log-ROI wie im Tracker
+2. Referenz: Detection + Recognition in voller Auflösung (Scale 1.0)
+3. Pro Scale: Detection auf verkleinerter Kopie, Recognition im vollen Bild
+4. Vergleich mit der Referenz über ``split_text_into_log_entries``:
+   Timestamp-Recall, Eintrags-Recall (Timestamp + Text identisch), Text-Ähnlichkeit
+
+    python scripts/evaluate_detect_scale.py session.bdofr --scales 1.0 0.75 0.5
+    python scripts/evaluate_detect_scale.py --synthetic 20
+
+Braucht EasyOCR (Modelle werden beim ersten Aufruf geladen).
+"""
+
+import argparse
+import difflib
+import statistics
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmark_preprocess import load_frames, synthetic_frames
+
+
+def prepare(frames):
+    import utils
+    from preprocess_pipeline import get_default_pipeline
+
+    pipeline = get_default_pipeline()
+    rois = []
+    for frame in frames:
+        proc = pipeline.run(frame, adaptive=True, denoise=False, fast_mode=False, reuse_output=False)
+        x, y, w, h = utils.detect_log_roi(proc)
+        rois.append(proc[y:y + h, x:x + w].copy())
+    return rois
+
+
+def run_scale(rois, scale):
+    import utils
+
+    outputs, timings = [], []
+    for roi in rois:
+        start = time.perf_counter()
+        result = utils._easyocr_read(roi, reuse_boxes=False, detect_scale=scale)
+        timings.append((time.perf_counter() - start) * 1000)
+        text = utils.flatten_ocr_result(result)
+        outputs.append((text, len(result)))
+    return outputs, timings
+
+
+def entry_keys(text):
+    from parsing import split_text_into_log_entries
+
+    entries = split_text_into_log_entries(text)
+    timestamps = Counter(ts for _, ts, _ in entries)
+    full = Counter((ts, " ".join(snippet.lower().split())) for _, ts, snippet in entries)
+    return timestamps, full
+
+
+def recall(reference: Counter, candidate: Counter):
+    total = sum(reference.values())
+    if not total:
+        return None
+    return sum((reference & candidate).values()) / total
+
+
+def p95(values):
+    ordered = sorted(values)
+    return ordered[max(0, int(len(ordered) * 0.95) - 1)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("recording", nargs="?", help="Frame-Aufnahme (.bdofr)")
+    parser.add_argument("--frames", type=int, default=0, help="Max. Frames aus der Aufnahme (0 = alle)")
+    parser.add_argument("--synthetic", type=int, default=0, help="Synthetische Frames statt Aufnahme")
+    parser.add_argument("--scales", type=float, nargs="+", default=[0.75, 0.6, 0.5],
+                        help="Detection-Faktoren (< 1.0), verglichen mit 1.0")
+    args = parser.parse_args()
+
+    if args.recording:
+        frames = load_frames(args.recording, args.frames)
+        source = args.recording
+    elif args.synthetic > 0:
+        frames = synthetic_frames(args.synthetic)
+        source = "synthetic"
+    else:
+        parser.error("Aufnahme angeben oder --synthetic N")
+    if not frames:
+        print("❌ Keine Frames gefunden")
+        return 1
+
+    print("=" * 80)
+    print("🔬 EasyOCR Multi-Scale: Detection verkleinert, Recognition in voller Auflösung")
+    print("=" * 80)
+    print(f"Quelle: {source} | Frames: {len(frames)} | Shape: {frames[0].shape}")
+    print()
+
+    rois = prepare(frames)
+    # Erster Aufruf lädt die Modelle → nicht mitmessen
+    run_scale(rois[:1], 1.0)
+    reference, ref_timings = run_scale(rois, 1.0)
+    ref_keys = [entry_keys(text) for text, _ in reference]
+    ref_ms = statistics.median(ref_timings)
+    print(f"[1.00] Referenz: median {ref_ms:7.1f}ms  p95 {p95(ref_timings):7.1f}ms  "
+          f"Ø Boxen {statistics.mean(n for _, n in reference):.1f}")
+
+    for scale in args.scales:
+        if not 0.0 < scale < 1.0:
+            continue
+        outputs, timings = run_scale(rois, scale)
+        ts_recalls, entry_recalls, similarity = [], [], []
+        for (text, _), (ref_text, _), (ref_ts, ref_full) in zip(outputs, reference, ref_keys):
+            timestamps, full = entry_keys(text)
+            ts_recall, entry_recall = recall(ref_ts, timestamps), recall(ref_full, full)
+            if ts_recall is not None:
+                ts_recalls.append(ts_recall)
+                entry_recalls.append(entry_recall)
+            similarity.append(difflib.SequenceMatcher(None, ref_text, text).ratio())
+        med = statistics.median(timings)
+        speedup = ref_ms / med if med > 0 else float("inf")
+        print(f"[{scale:.2f}] median {med:7.1f}ms  p95 {p95(timings):7.1f}ms  Speedup {speedup:.2f}x  "
+              f"Ø Boxen {statistics.mean(n for _, n in outputs):.1f}")
+        if ts_recalls:
+            print(f"       Timestamp-Recall {statistics.mean(ts_recalls) * 100:5.1f}% | "
+                  f"Eintrags-Recall {statistics.mean(entry_recalls) * 100:5.1f}% | "
+                  f"Frames mit fehlendem Timestamp {sum(r < 1.0 for r in ts_recalls)}/{len(ts_recalls)}")
+        print(f"       Text-Ähnlichkeit Ø {statistics.mean(similarity) * 100:5.1f}%")
+    print()
+    print("Übernehmen: config.EASYOCR_DETECT_SCALE auf den kleinsten Faktor mit 100% Timestamp-Recall setzen.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
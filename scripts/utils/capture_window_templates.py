@@ -0,0 +1,89 @@
+"""
+Window-Template Capture Tool
+
+Schneidet eine UI-Landmarke (Header-Text, Button) aus dem aktuellen
+Marktfenster bzw. aus einer Frame-Aufnahme aus und trägt sie in
+config/window_templates/templates.json für den WindowClassifier ein.
+
+    # Detail-Fenster "Sell" offen, Landmarke = "Set Price"-Label (Box relativ zur Region)
+    python scripts/utils/capture_window_templates.py sell_item --box 0.05 0.30 0.25 0.36 --name set_price
+    python scripts/utils/capture_window_templates.py buy_overview --box 0.6 0.1 0.8 0.16 \\
+        --recording session.bdofr --index 120
+
+Pro Fenster-Typ 1-3 Landmarken erfassen; ALLE Landmarken eines Typs müssen
+matchen (Score ≥ WINDOW_CLASSIFIER_THRESHOLD).
+"""
+import argparse
+import json
+import os
+import sys
+
+# Add project root (two levels up from scripts/utils/) to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+import cv2
+
+from config import DEFAULT_REGION, WINDOW_TEMPLATE_DIR
+from window_classifier import MANIFEST_NAME, WINDOW_TYPES, WindowClassifier
+
+
+def load_frame(recording, index):
+    if recording:
+        from frame_recorder import FrameRecording
+
+        rec = FrameRecording(recording)
+        frame = rec[index].copy()
+        rec.close()
+        return frame
+    from capture_backend import CaptureBackend
+
+    backend = CaptureBackend()
+    frame = backend.grab(DEFAULT_REGION, copy=True)
+    backend.close()
+    return frame
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("window", choices=WINDOW_TYPES)
+    parser.add_argument("--box", nargs=4, type=float, required=True, metavar=("X0", "Y0", "X1", "Y1"),
+                        help="Landmarke relativ zur Capture-Region (0.0-1.0)")
+    parser.add_argument("--name", default=None, help="Dateiname-Suffix (Default: Index)")
+    parser.add_argument("--recording", default=None, help="Frame-Aufnahme (.bdofr) statt Live-Capture")
+    parser.add_argument("--index", type=int, default=0, help="Frame-Index in der Aufnahme")
+    parser.add_argument("--dir", default=WINDOW_TEMPLATE_DIR)
+    args = parser.parse_args()
+
+    frame = load_frame(args.recording, args.index)
+    h, w = frame.shape[:2]
+    x0, y0, x1, y1 = args.box
+    crop = frame[int(y0 * h):int(y1 * h), int(x0 * w):int(x1 * w)]
+    if crop.size == 0:
+        print("❌ Leere Box - Koordinaten prüfen")
+        return 1
+
+    os.makedirs(args.dir, exist_ok=True)
+    manifest_path = os.path.join(args.dir, MANIFEST_NAME)
+    entries = []
+    if os.path.exists(manifest_path):
+        with open(manifest_path, "r", encoding="utf-8") as fh:
+            entries = json.load(fh)
+
+    suffix = args.name or str(sum(1 for e in entries if e["window"] == args.window))
+    filename = f"{args.window}_{suffix}.png"
+    cv2.imwrite(os.path.join(args.dir, filename), crop)
+    entries = [e for e in entries if e["file"] != filename]
+    entries.append({"window": args.window, "file": filename, "box": [x0, y0, x1, y1]})
+    with open(manifest_path, "w", encoding="utf-8") as fh:
+        json.dump(entries, fh, indent=2)
+    print(f"✅ Template gespeichert: {filename} ({crop.shape[1]}x{crop.shape[0]})")
+
+    # Gegenprobe auf demselben Frame
+    classifier = WindowClassifier(template_dir=args.dir)
+    wtype, score = classifier.classify(frame)
+    print(f"   Gegenprobe: {wtype} (score={score:.2f}) | Scores: {classifier.last_scores}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
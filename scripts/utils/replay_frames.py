@@ -0,0 +1,109 @@
+"""
+Frame Recording & Replay Tool
+
+Nimmt Capture-Frames des Marktfensters auf bzw. spielt eine Aufnahme durch die
+komplette Pipeline (capture → OCR → parse → DB) von MarketTracker ab.
+
+    python scripts/utils/replay_frames.py record session.bdofr --seconds 60
+    python scripts/utils/replay_frames.py replay session.bdofr --max-speed
+
+Replay schreibt erkannte Transaktionen in eine eigene Datenbank (Default:
+neue temporäre Datei, Pfad wird ausgegeben) - die Live-Historie in DB_PATH
+bleibt unberührt. ``--db bdo_tracker.db`` schreibt bewusst in die Live-DB.
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+# Add project root (two levels up from scripts/utils/) to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from config import DEFAULT_REGION, POLL_INTERVAL
+from frame_recorder import FrameRecorder, FrameReplaySource
+
+
+def record(path, seconds, interval, compression):
+    from capture_backend import CaptureBackend
+
+    backend = CaptureBackend()
+    deadline = time.perf_counter() + seconds
+    with FrameRecorder(path, compression=compression) as recorder:
+        while time.perf_counter() < deadline:
+            frame = backend.grab(DEFAULT_REGION)
+            recorder.append(frame, time.time())
+            time.sleep(interval)
+        recorder.flush()
+        print(f"✅ {recorder.frames_written} Frames aufgenommen ({recorder.bytes_written / 1e6:.1f} MB) → {path}")
+    backend.close()
+
+
+def replay(path, realtime, speed, db_path):
+    import config
+
+    # Vor dem ersten Import von database/tracker: die Verbindung wird beim Import geöffnet
+    config.DB_PATH = db_path
+    from tracker import MarketTracker
+
+    source = FrameReplaySource(path, realtime=realtime, speed=speed)
+    tracker = MarketTracker(debug=False, frame_source=source)
+    tracker.running = True
+
+    timings = []
+    started = time.perf_counter()
+    while tracker.running:
+        frame = tracker._capture_frame()
+        if frame is None:
+            continue
+        scan_start = time.perf_counter()
+        tracker._process_image(frame, context='replay', allow_debug=False)
+        timings.append((time.perf_counter() - scan_start) * 1000)
+    elapsed = time.perf_counter() - started
+    source.close()
+
+    print("=" * 80)
+    print(f"🎞️  REPLAY: {path} ({'realtime x%.2f' % speed if realtime else 'max speed'})")
+    print(f"DB: {db_path}")
+    print("=" * 80)
+    if not timings:
+        print("Keine Frames in der Aufnahme.")
+        return
+    timings.sort()
+    print(f"Frames:         {len(timings)}")
+    print(f"Gesamtdauer:    {elapsed:.2f}s ({len(timings) / elapsed:.1f} Frames/s)")
+    print(f"Scan avg/median: {statistics.mean(timings):.1f}ms / {statistics.median(timings):.1f}ms")
+    print(f"Scan p95/max:   {timings[int(0.95 * (len(timings) - 1))]:.1f}ms / {timings[-1]:.1f}ms")
+    print(f"Fehler:         {tracker.error_count}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    rec = sub.add_parser("record", help="Live-Frames aufnehmen")
+    rec.add_argument("path")
+    rec.add_argument("--seconds", type=float, default=30.0)
+    rec.add_argument("--interval", type=float, default=POLL_INTERVAL)
+    rec.add_argument("--compression", choices=["zlib", "raw"], default="zlib")
+
+    rep = sub.add_parser("replay", help="Aufnahme durch MarketTracker abspielen")
+    rep.add_argument("path")
+    rep.add_argument("--max-speed", action="store_true", help="Ohne Wartezeiten abspielen")
+    rep.add_argument("--speed", type=float, default=1.0, help="Realtime-Faktor (2.0 = doppelt so schnell)")
+    rep.add_argument("--db", help="Ziel-Datenbank (Default: neue temporäre Datei statt DB_PATH)")
+
+    args = parser.parse_args()
+    if args.command == "record":
+        record(args.path, args.seconds, args.interval, args.compression)
+    else:
+        db_path = args.db
+        if not db_path:
+            fd, db_path = tempfile.mkstemp(prefix="bdo_replay_", suffix=".db")
+            os.close(fd)
+        replay(args.path, realtime=not args.max_speed, speed=args.speed, db_path=db_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Glyph-Template Training für die Ziffern-Erkennung (glyph_ocr.py)
+
+Erwartet einen Ordner mit gelabelten Zahlenfeld-Crops aus dem Spiel. Das Label
+steht im Dateinamen vor "__" (Suffix frei wählbar):
+
+    samples/599,400,000__worth.png
+    samples/x222__qty.png
+    samples/1590__orders_completed.png
+
+    python scripts/utils/train_glyphs.py samples/
+    python scripts/utils/train_glyphs.py samples/ --out config/glyphs.npz
+
+Jede Ziffer 0-9 sollte in mehreren Samples vorkommen. Nach dem Training werden
+alle Samples gegengeprüft (Trefferquote + minimale Konfidenz).
+"""
+import argparse
+import os
+import sys
+import time
+
+# Add project root (two levels up from scripts/utils/) to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+import cv2
+
+from config import GLYPH_TEMPLATE_PATH
+from glyph_ocr import GlyphRecognizer
+
+
+def load_samples(folder):
+    samples = []
+    for name in sorted(os.listdir(folder)):
+        if not name.lower().endswith(".png"):
+            continue
+        label = os.path.splitext(name)[0].split("__")[0]
+        crop = cv2.imread(os.path.join(folder, name))
+        if crop is not None and label:
+            samples.append((crop, label))
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("folder")
+    parser.add_argument("--out", default=GLYPH_TEMPLATE_PATH)
+    args = parser.parse_args()
+
+    samples = load_samples(args.folder)
+    if not samples:
+        print("❌ Keine Samples gefunden")
+        return 1
+
+    recognizer = GlyphRecognizer(template_path=None)
+    report = recognizer.train(samples)
+    print(f"📚 {len(samples)} Samples, verworfen: {report['rejected']}")
+    print("   Zeichen: " + ", ".join(f"{c}×{n}" for c, n in sorted(report['samples_per_char'].items())))
+    missing = [d for d in "0123456789" if d not in report['samples_per_char']]
+    if missing:
+        print(f"⚠️  Keine Samples für: {' '.join(missing)}")
+
+    correct = 0
+    timings = []
+    for crop, label in samples:
+        start = time.perf_counter()
+        result = recognizer.recognize(crop)
+        timings.append((time.perf_counter() - start) * 1000)
+        ok = result.text.replace(".", ",") == label.replace(".", ",")
+        correct += ok
+        if not ok:
+            print(f"   ✗ {label!r} → {result.text!r} (min conf {result.min_confidence:.2f})")
+    print(f"✅ Gegenprobe: {correct}/{len(samples)} korrekt, Ø {sum(timings) / len(timings):.3f}ms pro Feld")
+
+    recognizer.save(args.out)
+    print(f"💾 Templates gespeichert → {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
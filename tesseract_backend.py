@@ -0,0 +1,112 @@
+"""
+Tesseract Backend - Persistentes In-Process-Tesseract statt Subprozess pro Aufruf
+
+``pytesseract.image_to_string`` startet bei JEDEM Aufruf einen tesseract-Prozess,
+schreibt das Bild als Temp-Datei und lädt das Sprachmodell neu - Dutzende ms,
+bevor die eigentliche Erkennung beginnt. Hier:
+
+1. EIN TessBaseAPI-Handle (tesserocr, C-API-Bindings) pro Prozess, Modell einmal geladen
+2. PSM/OEM beim Start, Whitelist nur bei Änderung neu setzen
+3. numpy-Buffer direkt per ``SetImageBytes`` (keine PIL-Konvertierung, keine Temp-Datei)
+4. Zeilen mit Box + Konfidenz über den ResultIterator → OcrResult
+
+Das Handle ist nicht thread-safe → ein Lock serialisiert die Aufrufe. Ohne
+tesserocr baut die Engine-Registry kein Backend und ``ocr_with_tesseract``
+bleibt beim pytesseract-Subprozess.
+"""
+
+import threading
+import time
+from typing import Optional
+
+import cv2
+import numpy as np
+
+from config import TESSDATA_PATH, TESSERACT_LANG
+from ocr_result import OcrResult
+
+PSM_SINGLE_BLOCK = 6  # wie '--psm 6' (uniform block of text)
+OEM_DEFAULT = 3       # wie '--oem 3' (LSTM + Legacy)
+
+
+class PersistentTesseract:
+    """Single long-lived Tesseract API handle fed with numpy buffers."""
+
+    def __init__(self, tessdata: Optional[str] = TESSDATA_PATH, lang: str = TESSERACT_LANG,
+                 psm: int = PSM_SINGLE_BLOCK, oem: int = OEM_DEFAULT, module=None) -> None:
+        if module is None:
+            import tesserocr as module
+        self._module = module
+        kwargs = {'lang': lang, 'psm': psm, 'oem': oem}
+        if tessdata:
+            kwargs['path'] = tessdata
+        start = time.perf_counter()
+        self._api = module.PyTessBaseAPI(**kwargs)
+        self.init_ms = (time.perf_counter() - start) * 1000
+        self._lock = threading.Lock()
+        self._whitelist: Optional[str] = None
+        self.calls = 0
+        self.total_ms = 0.0
+
+    def _set_image(self, img) -> None:
+        img = np.asarray(img)
+        if img.ndim == 3:
+            code = cv2.COLOR_BGRA2RGB if img.shape[2] == 4 else cv2.COLOR_BGR2RGB
+            img = cv2.cvtColor(img, code)
+        img = np.ascontiguousarray(img, dtype=np.uint8)
+        height, width = img.shape[:2]
+        bytes_per_pixel = 1 if img.ndim == 2 else img.shape[2]
+        self._api.SetImageBytes(img.tobytes(), width, height, bytes_per_pixel, width * bytes_per_pixel)
+
+    def _apply_whitelist(self, whitelist: Optional[str]) -> None:
+        if whitelist != self._whitelist:
+            self._api.SetVariable("tessedit_char_whitelist", whitelist or "")
+            self._whitelist = whitelist
+
+    def image_to_string(self, img, whitelist: Optional[str] = None) -> str:
+        """Drop-in for ``pytesseract.image_to_string`` (PSM 6) on a numpy image."""
+        start = time.perf_counter()
+        with self._lock:
+            try:
+                self._apply_whitelist(whitelist)
+                self._set_image(img)
+                text = self._api.GetUTF8Text()
+            finally:
+                self._api.Clear()
+            self.calls += 1
+            self.total_ms += (time.perf_counter() - start) * 1000
+        return text
+
+    def recognize(self, img, whitelist: Optional[str] = None) -> OcrResult:
+        """Text lines with box and confidence (0-1) → OcrResult (engine 'tesseract')."""
+        ril = self._module.RIL.TEXTLINE
+        start = time.perf_counter()
+        entries = []
+        with self._lock:
+            try:
+                self._apply_whitelist(whitelist)
+                self._set_image(img)
+                self._api.Recognize()
+                for line in self._module.iterate_level(self._api.GetIterator(), ril):
+                    text = (line.GetUTF8Text(ril) or "").strip()
+                    box = line.BoundingBox(ril)
+                    if not text or box is None:
+                        continue
+                    x0, y0, x1, y1 = box
+                    entries.append(([[x0, y0], [x1, y0], [x1, y1], [x0, y1]], text, line.Confidence(ril) / 100.0))
+            finally:
+                self._api.Clear()
+            self.calls += 1
+            self.total_ms += (time.perf_counter() - start) * 1000
+        return OcrResult.from_detections(entries, engine='tesseract')
+
+    def close(self) -> None:
+        with self._lock:
+            self._api.End()
+
+    def get_stats(self) -> dict:
+        return {
+            'init_ms': self.init_ms,
+            'calls': self.calls,
+            'avg_ms': (self.total_ms / self.calls) if self.calls else 0.0,
+        }
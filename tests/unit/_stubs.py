@@ -1,6 +1,7 @@
 """Utility helpers to install lightweight test doubles for native deps."""
 from __future__ import annotations
 
+import importlib
 import sys
 import types
 
@@ -9,7 +10,12 @@ def install_dependency_stubs() -> None:
     modules: dict[str, types.ModuleType] = {}
 
     for name in ("cv2", "mss", "numpy"):
-        modules[name] = modules.get(name, types.ModuleType(name))
+        # Prefer the real package when it is installed so array-level helpers
+        # (capture buffers, change gate, ...) can be exercised in unit tests.
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            modules[name] = modules.get(name, types.ModuleType(name))
 
     if "pytesseract" not in sys.modules:
         pytesseract_stub = types.ModuleType("pytesseract")
@@ -0,0 +1,206 @@
+import sys
+import threading
+import time
+import types
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+try:
+    from ._stubs import install_dependency_stubs  # type: ignore
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from _stubs import install_dependency_stubs  # type: ignore
+
+install_dependency_stubs()
+
+np = pytest.importorskip("numpy")
+if not hasattr(np, "frombuffer"):
+    pytest.skip("numpy not installed", allow_module_level=True)
+
+import capture_backend  # noqa: E402
+
+
+class _FakeShot:
+    def __init__(self, width: int, height: int, value: int) -> None:
+        self.width = width
+        self.height = height
+        bgra = np.zeros((height, width, 4), dtype=np.uint8)
+        bgra[..., 0] = value  # B
+        bgra[..., 1] = value + 1  # G
+        bgra[..., 2] = value + 2  # R
+        bgra[..., 3] = 255
+        self.raw = bytearray(bgra.tobytes())
+
+
+class _FakeGrabber:
+    instances = 0
+
+    def __init__(self) -> None:
+        type(self).instances += 1
+        self.calls = 0
+        self.closed = False
+
+    def grab(self, mon):
+        self.calls += 1
+        return _FakeShot(mon["width"], mon["height"], self.calls)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def fake_mss(monkeypatch):
+    _FakeGrabber.instances = 0
+    monkeypatch.setattr(capture_backend, "mss", types.SimpleNamespace(mss=_FakeGrabber))
+    return _FakeGrabber
+
+
+def test_grabber_reused_per_thread(fake_mss):
+    backend = capture_backend.CaptureBackend(ring_size=2)
+    for _ in range(5):
+        backend.grab((0, 0, 8, 4))
+    assert fake_mss.instances == 1
+
+    worker = threading.Thread(target=backend.grab, args=((0, 0, 8, 4),))
+    worker.start()
+    worker.join()
+    assert fake_mss.instances == 2
+
+    grabbers = list(backend._grabbers.values())
+    backend.close()
+    assert grabbers and all(sct.closed for sct in grabbers)
+
+
+def test_grabbers_of_finished_threads_are_closed(fake_mss):
+    backend = capture_backend.CaptureBackend(ring_size=2)
+    for _ in range(3):
+        worker = threading.Thread(target=backend.grab, args=((0, 0, 8, 4),))
+        worker.start()
+        worker.join()
+    # jeder neue Grabber räumt die der beendeten Threads ab
+    assert len(backend._grabbers) == 1
+    finished = next(iter(backend._grabbers.values()))
+    backend.grab((0, 0, 8, 4))
+    assert list(backend._grabbers) == [threading.current_thread()]
+    assert finished.closed
+    assert fake_mss.instances == 4
+
+
+def test_ring_buffers_are_reused(fake_mss):
+    backend = capture_backend.CaptureBackend(ring_size=2)
+    first = backend.grab((0, 0, 8, 4))
+    second = backend.grab((0, 0, 8, 4))
+    third = backend.grab((0, 0, 8, 4))
+
+    assert first.shape == (4, 8, 3)
+    assert first is not second
+    assert third is first  # ring wrapped around
+    assert third[0, 0].tolist() == [3, 4, 5]
+
+
+def test_grayscale_and_copy(fake_mss):
+    backend = capture_backend.CaptureBackend(ring_size=1, grayscale=True)
+    gray = backend.grab((10, 10, 20, 15))
+    assert gray.shape == (5, 10)
+
+    kept = backend.grab((10, 10, 20, 15), copy=True)
+    backend.grab((10, 10, 20, 15))
+    assert kept is not gray
+
+    color = backend.grab((10, 10, 20, 15), grayscale=False)
+    assert color.shape == (5, 10, 3)
+
+
+def test_timing_stats(fake_mss):
+    backend = capture_backend.CaptureBackend(ring_size=2)
+    backend.grab((0, 0, 4, 4))
+    backend.grab((0, 0, 4, 4))
+
+    assert set(backend.last_timing) == {"grab_ms", "convert_ms", "total_ms"}
+    stats = backend.get_stats()
+    assert stats["frames"] == 2
+    assert stats["avg_total_ms"] >= 0.0
+
+
+def test_leased_buffers_are_skipped(fake_mss):
+    backend = capture_backend.CaptureBackend(ring_size=2)
+    held = backend.grab((0, 0, 8, 4))
+    backend.lease(held)
+    snapshot = held.copy()
+
+    others = [backend.grab((0, 0, 8, 4)) for _ in range(4)]
+    assert all(frame is not held for frame in others)
+    assert np.array_equal(held, snapshot)
+
+    # every buffer leased → ring grows instead of overwriting
+    backend.lease(others[-1])
+    extra = backend.grab((0, 0, 8, 4))
+    assert extra is not held and extra is not others[-1]
+
+    backend.release(held)
+    assert any(backend.grab((0, 0, 8, 4)) is held for _ in range(3))
+
+
+def test_rings_kept_for_multiple_region_shapes(fake_mss):
+    backend = capture_backend.CaptureBackend(ring_size=1, max_shapes=2)
+    band = backend.grab((0, 0, 8, 2))
+    window = backend.grab((0, 2, 8, 6))
+    assert backend.grab((0, 0, 8, 2)) is band
+    assert backend.grab((0, 2, 8, 6)) is window
+
+    backend.grab((0, 0, 4, 4))  # third shape evicts the oldest ring
+    assert backend.grab((0, 0, 8, 2)) is not band
+
+
+def test_lease_through_view_protects_ring_buffer(fake_mss):
+    backend = capture_backend.CaptureBackend(ring_size=2)
+    held = backend.grab((0, 0, 8, 4))
+    backend.lease(held[1:3])                            # View (z.B. Sub-Region-Crop)
+    assert all(backend.grab((0, 0, 8, 4)) is not held for _ in range(4))
+
+    backend.lease(held.copy())                          # Kopie: nichts zu schützen
+    backend.release(held[1:3])
+    assert any(backend.grab((0, 0, 8, 4)) is held for _ in range(3))
+
+
+def test_ring_growth_is_capped(fake_mss):
+    backend = capture_backend.CaptureBackend(ring_size=1, max_ring_size=2)
+    first = backend.grab((0, 0, 8, 4))
+    backend.lease(first)
+    second = backend.grab((0, 0, 8, 4))                 # Ring wächst auf 2
+    backend.lease(second)
+
+    extra = backend.grab((0, 0, 8, 4))                  # Obergrenze → ungepoolt
+    assert extra is not first and extra is not second
+    assert len(backend._rings[(4, 8, 3)]) == 2
+    assert backend.get_stats()["unpooled_frames"] == 1
+
+
+def test_tracker_close_waits_for_auto_track_before_closing_backend(monkeypatch):
+    import tracker
+
+    monkeypatch.setattr(tracker, "USE_ASYNC_PIPELINE", False)
+    mt = tracker.MarketTracker(debug=False)
+    scanning = threading.Event()
+    events = []
+
+    def slow_scan():
+        scanning.set()
+        time.sleep(0.2)                                 # mitten in Capture/OCR
+        events.append("scan_done")
+
+    monkeypatch.setattr(mt, "single_scan", slow_scan)
+    monkeypatch.setattr(mt.capture_backend, "close", lambda: events.append("backend_closed"))
+    worker = threading.Thread(target=mt.auto_track, daemon=True)
+    worker.start()
+    assert scanning.wait(2.0)
+
+    mt.close()
+    worker.join(2.0)
+    assert events == ["scan_done", "backend_closed"]
@@ -0,0 +1,96 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+try:
+    from ._stubs import install_dependency_stubs  # type: ignore
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from _stubs import install_dependency_stubs  # type: ignore
+
+install_dependency_stubs()
+
+from capture_regions import CaptureSubRegion, MultiRegionScanner  # noqa: E402
+import tracker  # noqa: E402
+
+
+REGIONS = [
+    {'name': 'notifications', 'box': (0.0, 0.0, 1.0, 0.25), 'interval': 0.5, 'burst_interval': 0.08},
+    {'name': 'window', 'box': (0.0, 0.25, 1.0, 0.75), 'interval': 2.0, 'burst_interval': 1.0},
+]
+
+
+def test_relative_box_maps_onto_capture_region():
+    region = CaptureSubRegion('notifications', (0.0, 0.0, 1.0, 0.25), interval=0.5)
+    assert region.absolute((734, 371, 1823, 1070)) == (734, 371, 1823, 546)
+    with pytest.raises(ValueError):
+        CaptureSubRegion('broken', (0.5, 0.0, 0.4, 1.0), interval=1.0)
+
+
+def test_due_regions_follow_their_own_rates():
+    scanner = MultiRegionScanner.from_config(REGIONS)
+    assert [r.name for r in scanner.due(now=0.0)] == ['notifications', 'window']
+    scanner.mark_captured(['notifications', 'window'], now=0.0)
+
+    assert scanner.due(now=0.3) == []
+    assert [r.name for r in scanner.due(now=0.6)] == ['notifications']
+    # burst: notification band at burst rate, window still throttled
+    assert [r.name for r in scanner.due(now=0.1, burst=True)] == ['notifications']
+    assert [r.name for r in scanner.due(now=2.1)] == ['notifications', 'window']
+
+    scanner.mark_captured(['notifications'], now=0.6)
+    stats = scanner.get_stats()
+    assert stats['captures'] == {'notifications': 2, 'window': 1}
+    assert stats['avg_area_per_scan'] == pytest.approx((0.75 + 0.25) / 2)
+
+
+def test_tracker_merges_region_texts_in_config_order(monkeypatch):
+    seen = []
+    monkeypatch.setattr(tracker, "ocr_image_cached",
+                        lambda img, **_: (f"text-{img}", False, {}))
+    monkeypatch.setattr(tracker.MarketTracker, "process_ocr_text", lambda self, text: seen.append(text))
+
+    mt = tracker.MarketTracker(debug=False)
+    mt.change_gate = None
+    monkeypatch.setattr(mt.preprocessor, "run", lambda img, **_: img)
+    mt.region_scanner = MultiRegionScanner.from_config(REGIONS)
+
+    mt._process_image({'window': 'w1', 'notifications': 'n1'})
+    mt._process_image({'notifications': 'n2'})
+
+    assert seen == ["text-n1 text-w1", "text-n2 text-w1"]
+    assert mt.region_scanner.get_stats()['ocr_runs'] == {'notifications': 2, 'window': 1}
+
+
+def test_inner_edges_snap_to_row_gaps():
+    np = pytest.importorskip("numpy")
+    cv2 = pytest.importorskip("cv2")
+    if not hasattr(np, "zeros") or not hasattr(cv2, "putText"):
+        pytest.skip("numpy/OpenCV not installed")
+
+    window = np.full((400, 600, 3), 22, dtype=np.uint8)
+    for baseline in (40, 70, 104, 134, 164):      # Zeile bei 104 schneidet die 0.25-Kante (y=100)
+        cv2.putText(window, "2025.10.18 15.42 Transaction of Birch Sap x1,000", (10, baseline),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.5, (220, 220, 220), 1)
+    from line_band_ocr import segment_text_bands
+
+    capture = (0, 0, 600, 400)
+    rows = {}
+    for entry in REGIONS:
+        region = CaptureSubRegion.from_dict(dict(entry, snap=0.05))
+        (x1, y1, x2, y2), edges = region.capture_box(capture)
+        crop = region.crop_to_rows(window[y1:y2, x1:x2], edges)
+        rows[region.name] = len(segment_text_bands(cv2.cvtColor(crop, cv2.COLOR_BGR2GRAY)))
+
+    # Zeilenmitte über der Kante → ganze Zeile in 'notifications'; jede Zeile genau einmal
+    assert rows == {'notifications': 3, 'window': 2}
+
+    # Ohne snap: feste Kante schneidet die Zeile (Halbzeile in beiden Bereichen)
+    region = CaptureSubRegion.from_dict(REGIONS[1])
+    assert region.capture_box(capture) == ((0, 100, 600, 300), (None, None))
@@ -0,0 +1,143 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+try:
+    from ._stubs import install_dependency_stubs  # type: ignore
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from _stubs import install_dependency_stubs  # type: ignore
+
+install_dependency_stubs()
+
+import cpu_governor  # noqa: E402
+from cpu_governor import CpuGovernor  # noqa: E402
+
+
+class _Clock:
+    def __init__(self):
+        self.wall = 0.0
+        self.cpu = 0.0
+
+    def advance(self, wall, cpu):
+        self.wall += wall
+        self.cpu += cpu
+
+
+def test_throttle_stretches_interval_only_over_budget():
+    clock = _Clock()
+    gov = CpuGovernor(budget=0.25, cpu_count=8, window_s=5.0, max_delay=2.0,
+                      clock=lambda: clock.wall, cpu_clock=lambda: clock.cpu)
+    gov.active = True
+    assert gov.thread_cap == 2
+    assert gov.throttle(0.5) == 0.5                     # erste Messung
+
+    # 1s Wand, 1s CPU auf 8 Kernen = 12.5% → im Budget (25%)
+    clock.advance(1.0, 1.0)
+    assert gov.throttle(0.5) == 0.5
+    assert gov.utilization == pytest.approx(0.125)
+
+    # weitere 1s Wand, 5s CPU → 6s CPU in 2s = 37.5%; Budget braucht 3s Wand → +0.5s
+    clock.advance(1.0, 5.0)
+    assert gov.throttle(0.5) == pytest.approx(1.0)
+    assert gov.last_delay == pytest.approx(0.5)
+
+    # Extremlast → gekappt auf max_delay
+    clock.advance(1.0, 8.0)
+    assert gov.throttle(0.5) == pytest.approx(2.5)
+    stats = gov.get_stats()
+    assert stats['throttled'] == 2 and stats['throttle_rate'] == pytest.approx(200 / 3)
+    assert "gedrosselt +2000ms" in gov.status_text()
+
+    # Inaktiv (GPU-Modus) → nie drosseln
+    gov.apply(cpu_mode=False)
+    clock.advance(1.0, 8.0)
+    assert gov.throttle(0.5) == 0.5
+    assert gov.status_text() == "CPU-Governor: GPU-Modus (inaktiv)"
+
+
+def test_apply_sets_threads_priority_and_affinity(monkeypatch):
+    calls = {}
+    monkeypatch.setattr(cpu_governor, "set_torch_thread_cap", lambda cap: calls.setdefault('cap', cap))
+    monkeypatch.setattr(cpu_governor, "set_torch_threads", lambda n: calls.setdefault('threads', n) or True)
+    monkeypatch.setattr(cpu_governor, "get_ocr_tuning", lambda: {'torch_threads': 6})
+    monkeypatch.setattr(cpu_governor, "_thread_ids", lambda: [101, 102])
+    monkeypatch.setattr(cpu_governor.sys, "platform", "linux")
+    monkeypatch.setattr(cpu_governor.os, "getpriority", lambda which, tid: {101: 0, 102: 12}[tid], raising=False)
+    monkeypatch.setattr(cpu_governor.os, "setpriority",
+                        lambda which, tid, value: calls.setdefault('nice', []).append((tid, value)), raising=False)
+    monkeypatch.setattr(cpu_governor.os, "sched_setaffinity",
+                        lambda tid, cores: calls.setdefault('affinity', []).append((tid, list(cores))), raising=False)
+
+    gov = CpuGovernor(budget=0.25, nice=10, affinity=True, cpu_count=8)
+    applied = gov.apply(cpu_mode=True)
+
+    # Autotune-Wert (6) wird auf das Budget gekappt
+    assert calls['cap'] == 2 and calls['threads'] == 2
+    # nice als Inkrement, bei 19 gekappt
+    assert calls['nice'] == [(101, 10), (102, 19)]
+    assert calls['affinity'] == [(101, [6, 7]), (102, [6, 7])]
+    assert applied == {'mode': 'CPU', 'threads': 2, 'nice': '+10', 'cores': [6, 7]}
+    assert gov.status_text().startswith("CPU-Governor: CPU 0% / Budget 25% · 2 Threads · Prio +10 · Kerne 6-7")
+
+    # Erneutes apply (z.B. nach dem Warm-up) erhöht nice nicht noch einmal
+    gov.apply(cpu_mode=True)
+    assert len(calls['nice']) == 2 and gov.applied['nice'] == '+10'
+
+
+def test_tracker_sleep_interval_goes_through_governor(monkeypatch):
+    np = pytest.importorskip("numpy")
+    if not hasattr(np, "zeros"):
+        pytest.skip("numpy not installed")
+    import tracker
+
+    mt = tracker.MarketTracker(debug=False)
+    assert mt.cpu_governor is None                      # Default: aus
+    monkeypatch.setattr(mt.scheduler, "next_interval", lambda burst_hint=False: 0.3)
+    assert mt._get_next_sleep_interval() == 0.3
+
+    clock = _Clock()
+    mt.cpu_governor = CpuGovernor(budget=0.25, cpu_count=8, window_s=5.0, max_delay=2.0,
+                                  clock=lambda: clock.wall, cpu_clock=lambda: clock.cpu)
+    mt.cpu_governor.active = True
+    mt._get_next_sleep_interval()
+    clock.advance(1.0, 8.0)                             # 100% Last auf 8 Kernen
+    assert mt._get_next_sleep_interval() == pytest.approx(2.3)
+
+
+def test_mode_comes_from_registry_and_reapplies_after_warmup(monkeypatch):
+    import config
+
+    class _Registry:
+        mode = None
+        callbacks = []
+
+        def status(self):
+            return {'easyocr': {'state': 'loading' if self.mode is None else 'ready', 'mode': self.mode}}
+
+        def when_warm(self, callback):
+            self.callbacks.append(callback)
+            return True
+
+    registry = _Registry()
+    monkeypatch.setattr(cpu_governor, "get_registry", lambda: registry)
+    monkeypatch.setattr(cpu_governor, "set_torch_thread_cap", lambda cap: None)
+    monkeypatch.setattr(cpu_governor, "set_torch_threads", lambda n: True)
+    monkeypatch.setattr(config, "USE_GPU", True)   # GPU gewünscht ...
+
+    gov = CpuGovernor(budget=0.5, nice=0, affinity=False, cpu_count=4)
+    assert gov.apply() == {'mode': 'pending'}
+    assert gov.status_text() == "CPU-Governor: wartet auf OCR-Engine"
+
+    registry.mode = "CPU"                          # ... aber CUDA-Init gescheitert → CPU-Fallback
+    registry.callbacks.pop()()
+    assert gov.active and gov.applied == {'mode': 'CPU', 'threads': 2}
+
+    registry.mode = "GPU"
+    assert gov.apply() == {'mode': 'GPU'} and not gov.active
@@ -0,0 +1,162 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+try:
+    from ._stubs import install_dependency_stubs  # type: ignore
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from _stubs import install_dependency_stubs  # type: ignore
+
+install_dependency_stubs()
+
+np = pytest.importorskip("numpy")
+cv2 = pytest.importorskip("cv2")
+if not hasattr(np, "zeros") or not hasattr(cv2, "putText"):
+    pytest.skip("numpy/OpenCV not installed", allow_module_level=True)
+
+from detection_cache import DetectionBoxCache, detect_boxes, layout_fingerprint  # noqa: E402
+
+
+class _FakeReader:
+    def __init__(self):
+        self.detects = 0
+        self.recognizes = []
+        self.detect_shapes = []
+        self.detect_kwargs = []
+        self.recognize_shapes = []
+
+    def detect(self, rgb, **kwargs):
+        self.detects += 1
+        self.detect_shapes.append(rgb.shape[:2])
+        self.detect_kwargs.append(kwargs)
+        boxes = [[int(x0), int(x1), int(y0), int(y1)]
+                 for y0, y1, x0, x1 in layout_fingerprint(cv2.cvtColor(rgb, cv2.COLOR_RGB2GRAY))]
+        return [boxes], [[]]
+
+    def recognize(self, gray, horizontal_list=None, free_list=None, **_kwargs):
+        self.recognizes.append(list(horizontal_list))
+        self.recognize_shapes.append(gray.shape[:2])
+        return [([[b[0], b[2]], [b[1], b[2]], [b[1], b[3]], [b[0], b[3]]], f"row{i}", 0.9)
+                for i, b in enumerate(horizontal_list)]
+
+
+def _frame(lines, top=20, width=560):
+    img = np.full((200, width), 25, dtype=np.uint8)
+    for idx, line in enumerate(lines):
+        cv2.putText(img, line, (10, top + 30 * idx), cv2.FONT_HERSHEY_SIMPLEX, 0.6, 220, 1)
+    return img
+
+
+def _read(cache, reader, gray):
+    rgb = cv2.cvtColor(gray, cv2.COLOR_GRAY2RGB)
+    return cache.read(reader, rgb, gray, {}, {"detail": 1})
+
+
+ROWS = ["2025.10.18 15.42 Transaction of Birch Sap", "2025.10.18 15.40 Placed order"]
+
+
+def test_same_layout_reuses_boxes_and_only_recognizes():
+    cache, reader = DetectionBoxCache(max_reuse=10), _FakeReader()
+    first = _read(cache, reader, _frame(ROWS))
+    assert reader.detects == 1 and len(first) == 2
+    assert not cache.last_timing["reused"]
+
+    # Anderer Text, gleiche Zeilen/Ausdehnung → nur Recognition
+    second = _read(cache, reader, _frame(["2025.10.18 15.43 Transaction of Birch Sap", "2025.10.18 15.41 Placed order"]))
+    assert reader.detects == 1
+    assert len(second) == 2
+    assert cache.last_timing["reused"] and cache.last_timing["detect_ms"] == 0.0
+    assert reader.recognizes[0] == reader.recognizes[1]
+
+    stats = cache.get_stats()
+    assert stats["detections"] == 1 and stats["reuses"] == 1
+    assert stats["reuse_rate"] == 50.0
+
+
+def test_moved_rows_or_wider_text_trigger_detection():
+    cache, reader = DetectionBoxCache(max_reuse=10), _FakeReader()
+    _read(cache, reader, _frame(ROWS))
+    _read(cache, reader, _frame(["2025.10.18 15.44 Withdrew order"] + ROWS))  # neue Zeile oben
+    assert reader.detects == 2
+    assert cache.last_timing["reason"] == "layout_changed"
+
+    widened = [ROWS[0] + " x5,000 worth 1,234,000", ROWS[1], ROWS[1]]
+    _read(cache, reader, _frame(["2025.10.18 15.44 Withdrew order"] + ROWS))
+    assert reader.detects == 2
+    _read(cache, reader, _frame(widened))
+    assert reader.detects == 3
+
+
+def test_invalidate_max_reuse_and_geometry_keys():
+    cache, reader = DetectionBoxCache(max_reuse=2), _FakeReader()
+    frame = _frame(ROWS)
+    for _ in range(4):
+        _read(cache, reader, frame)
+    # detect, reuse, reuse, detect (max_reuse erreicht)
+    assert reader.detects == 2
+    assert cache.get_stats()["reasons"]["max_reuse"] == 1
+
+    cache.invalidate()
+    _read(cache, reader, frame)
+    assert reader.detects == 3
+
+    _read(cache, reader, _frame(ROWS, width=500))
+    assert reader.detects == 4
+    assert cache.get_stats()["geometries"] == 2
+
+
+def test_easyocr_read_uses_detection_cache_when_enabled(monkeypatch):
+    import utils
+
+    reader = _FakeReader()
+    monkeypatch.setattr(utils, "get_reader", lambda: reader)
+    monkeypatch.setattr(utils, "EASYOCR_BOX_REUSE_ENABLED", True)
+    utils.invalidate_detection_boxes()
+    try:
+        frame = _frame(ROWS)
+        result = utils._easyocr_read(frame, offset=(100, 50))
+        utils._easyocr_read(frame, offset=(100, 50))
+        assert reader.detects == 1 and len(reader.recognizes) == 2
+        assert result.texts == ["row0", "row1"]
+        assert result.boxes[0][0] >= 100 and result.boxes[0][1] >= 50
+    finally:
+        utils.invalidate_detection_boxes()
+
+
+def test_detect_boxes_downscaled_maps_back_to_full_resolution():
+    gray = _frame(ROWS)
+    rgb = cv2.cvtColor(gray, cv2.COLOR_GRAY2RGB)
+    full_reader, small_reader = _FakeReader(), _FakeReader()
+    full, _ = detect_boxes(full_reader, rgb, {}, 1.0)
+    scaled, free = detect_boxes(small_reader, rgb, {"min_size": 20}, 0.5)
+
+    assert full_reader.detect_shapes == [(200, 560)]
+    assert small_reader.detect_shapes == [(100, 280)]
+    assert small_reader.detect_kwargs[0]["min_size"] == 10
+    assert free == [] and len(scaled) == len(full) == 2
+    for big, small in zip(full, scaled):
+        # zurückskaliert, nach außen gerundet → umschließt die volle Box bis auf Rundung
+        assert small[0] <= big[0] + 2 and small[1] >= big[1] - 2
+        assert small[2] <= big[2] + 2 and small[3] >= big[3] - 2
+        assert 0 <= small[0] < small[1] <= 560 and 0 <= small[2] < small[3] <= 200
+
+
+def test_easyocr_read_detect_scale_recognizes_full_resolution(monkeypatch):
+    import utils
+
+    reader = _FakeReader()
+    monkeypatch.setattr(utils, "get_reader", lambda: reader)
+    monkeypatch.setattr(utils, "EASYOCR_BOX_REUSE_ENABLED", False)
+    result = utils._easyocr_read(_frame(ROWS), offset=(100, 50), detect_scale=0.5)
+
+    assert reader.detect_shapes == [(100, 280)]
+    assert reader.recognize_shapes == [(200, 560)]
+    assert result.texts == ["row0", "row1"]
+    assert result.boxes[0][0] >= 100 and result.boxes[0][1] >= 50
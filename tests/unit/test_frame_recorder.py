@@ -0,0 +1,102 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+try:
+    from ._stubs import install_dependency_stubs  # type: ignore
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from _stubs import install_dependency_stubs  # type: ignore
+
+install_dependency_stubs()
+
+np = pytest.importorskip("numpy")
+if not hasattr(np, "frombuffer"):
+    pytest.skip("numpy not installed", allow_module_level=True)
+
+from frame_recorder import FrameRecorder, FrameRecording, FrameReplaySource  # noqa: E402
+
+
+def _frame(value: int, shape=(6, 10, 3)):
+    return np.full(shape, value, dtype=np.uint8)
+
+
+@pytest.mark.parametrize("compression", [None, "zlib"])
+def test_roundtrip_with_chunks_and_shape_change(tmp_path, compression):
+    path = tmp_path / "session.bdofr"
+    with FrameRecorder(str(path), compression=compression, chunk_frames=2) as recorder:
+        for idx in range(5):
+            recorder.append(_frame(idx), captured_at=100.0 + idx)
+        recorder.append(_frame(42, shape=(4, 4)), captured_at=200.0)
+
+    recording = FrameRecording(str(path))
+    assert len(recording) == 6
+    assert recording.timestamps[:2] == [100.0, 101.0]
+    assert recording[3].shape == (6, 10, 3)
+    assert int(recording[3][0, 0, 0]) == 3
+    assert recording[-1].shape == (4, 4)
+    assert int(recording[-1][0, 0]) == 42
+    recording.close()
+
+
+def test_compression_runs_off_the_capture_thread(tmp_path, monkeypatch):
+    import threading
+    import frame_recorder
+
+    threads = []
+    real_compress = frame_recorder.zlib.compress
+
+    def compress(data, level):
+        threads.append(threading.current_thread().name)
+        return real_compress(data, level)
+
+    monkeypatch.setattr(frame_recorder.zlib, "compress", compress)
+    recorder = FrameRecorder(str(tmp_path / "s.bdofr"), compression="zlib", chunk_frames=2)
+    for idx in range(4):
+        recorder.append(_frame(idx), captured_at=float(idx))
+    recorder.flush()
+    assert recorder.frames_written == 4
+    recorder.close()
+    assert threads == ["frame-recorder", "frame-recorder"]
+
+
+def test_truncated_tail_is_ignored(tmp_path):
+    path = tmp_path / "crash.bdofr"
+    with FrameRecorder(str(path), compression=None, chunk_frames=1) as recorder:
+        recorder.append(_frame(1), captured_at=1.0)
+        recorder.append(_frame(2), captured_at=2.0)
+    data = path.read_bytes()
+    path.write_bytes(data[:-10])
+
+    recording = FrameRecording(str(path))
+    assert len(recording) == 1
+    recording.close()
+
+
+def test_replay_source_max_speed_exhausts(tmp_path):
+    path = tmp_path / "replay.bdofr"
+    with FrameRecorder(str(path), chunk_frames=4) as recorder:
+        for idx in range(3):
+            recorder.append(_frame(idx), captured_at=10.0 + 5 * idx)
+
+    source = FrameReplaySource(str(path), realtime=False)
+    values = []
+    while True:
+        frame = source((0, 0, 10, 6))
+        if frame is None:
+            break
+        values.append(int(frame[0, 0, 0]))
+    assert values == [0, 1, 2]
+    assert source.exhausted
+    assert source.last_captured_at == 20.0
+
+    source.rewind()
+    assert not source.exhausted
+    assert int(source.capture()[0, 0, 0]) == 0
+    source.close()
@@ -0,0 +1,77 @@
+import sys
+import threading
+import time
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from frame_slot import LatestFrameSlot  # noqa: E402
+
+
+def test_unconsumed_frames_are_superseded():
+    slot = LatestFrameSlot()
+    for idx in range(5):
+        slot.publish(f"frame-{idx}", captured_at=time.perf_counter())
+
+    ticket = slot.take(timeout=0)
+    assert ticket.image == "frame-4"
+    assert ticket.seq == 5
+    assert ticket.age_ms >= 0.0
+    # slot is empty again until the next publish
+    assert slot.take(timeout=0) is None
+
+    stats = slot.get_stats()
+    assert stats["published"] == 5
+    assert stats["superseded"] == 4
+    assert stats["taken"] == 1
+    assert stats["last_taken_seq"] == 5
+
+
+def test_reader_waits_for_next_frame_and_close_wakes_it():
+    slot = LatestFrameSlot()
+    results = []
+
+    def reader():
+        while True:
+            ticket = slot.take(timeout=1.0)
+            if ticket is None:
+                break
+            results.append(ticket.image)
+
+    thread = threading.Thread(target=reader)
+    thread.start()
+    slot.publish("a")
+    deadline = time.monotonic() + 1.0
+    while not results and time.monotonic() < deadline:
+        time.sleep(0.01)
+    slot.close()
+    thread.join(timeout=2.0)
+
+    assert not thread.is_alive()
+    assert results == ["a"]
+    assert slot.closed
+
+
+def test_frame_age_measured_at_take():
+    slot = LatestFrameSlot()
+    slot.publish("old", captured_at=time.perf_counter() - 0.25)
+    ticket = slot.take(timeout=0)
+    assert ticket.age_ms >= 250.0
+    assert slot.get_stats()["age_max_ms"] >= 250.0
+
+
+def test_lease_taken_at_publish_and_handed_over_on_take():
+    leased = []
+    slot = LatestFrameSlot(lease=leased.append, release=leased.remove)
+    slot.publish("a")
+    assert leased == ["a"]                # geschützt, bevor ein Worker ihn holt
+    slot.publish("b")
+    assert leased == ["b"]                # verdrängter Frame freigegeben
+    ticket = slot.take(timeout=0)
+    assert ticket.image == "b" and leased == ["b"]   # Lease gehört jetzt dem Worker
+    slot.publish("c")
+    slot.close()
+    assert leased == ["b"]                # nie abgeholter Frame beim Schließen freigegeben
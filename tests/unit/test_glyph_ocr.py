@@ -0,0 +1,116 @@
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+try:
+    from ._stubs import install_dependency_stubs  # type: ignore
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from _stubs import install_dependency_stubs  # type: ignore
+
+install_dependency_stubs()
+
+np = pytest.importorskip("numpy")
+cv2 = pytest.importorskip("cv2")
+if not hasattr(np, "zeros") or not hasattr(cv2, "threshold"):
+    pytest.skip("numpy/OpenCV not installed", allow_module_level=True)
+
+from glyph_ocr import GlyphRecognizer  # noqa: E402
+
+
+def _field(text, scale=0.8):
+    # light digits on dark background like the market UI
+    (w, h), base = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, scale, 2)
+    img = np.full((h + base + 10, w + 12, 3), 28, dtype=np.uint8)
+    cv2.putText(img, text, (6, h + 5), cv2.FONT_HERSHEY_SIMPLEX, scale, (225, 225, 225), 2)
+    return img
+
+
+TRAINING = ["1234567890", "9876543210", "5550", "111", "80,000", "7,642"]
+
+
+def _trained(tmp_path=None):
+    recognizer = GlyphRecognizer(template_path=None, glyph_size=(10, 14), min_confidence=0.85)
+    report = recognizer.train((_field(text), text) for text in TRAINING)
+    assert report["rejected"] == 0
+    return recognizer
+
+
+def test_recognizes_prices_with_separators():
+    recognizer = _trained()
+    for text in ["599,400,000", "2,510,860", "222", "1590"]:
+        result = recognizer.recognize(_field(text))
+        assert result.text == text
+        assert result.source == "glyph"
+        assert result.min_confidence > 0.85
+        assert len(result.confidences) == len(text)
+
+
+def test_low_confidence_uses_fallback():
+    recognizer = _trained()
+    calls = []
+
+    def fallback(crop):
+        calls.append(crop.shape)
+        return "42"
+
+    # letters are not in the digit template set → low confidence
+    result = recognizer.recognize_number(_field("WKM"), fallback=fallback)
+    assert result.source == "fallback"
+    assert result.text == "42"
+    assert calls
+    assert recognizer.get_stats()["fallbacks"] == 1
+
+
+def test_save_load_roundtrip_and_speed(tmp_path):
+    recognizer = _trained()
+    path = tmp_path / "glyphs.npz"
+    recognizer.save(str(path))
+
+    loaded = GlyphRecognizer(template_path=str(path))
+    assert loaded.available
+    field = _field("62,000,000")
+    assert loaded.recognize(field).text == "62,000,000"
+
+    start = time.perf_counter()
+    for _ in range(200):
+        loaded.recognize(field)
+    per_field_ms = (time.perf_counter() - start) / 200 * 1000
+    assert per_field_ms < 5.0  # typ. well below 1ms; generous bound for CI noise
+
+
+def test_without_templates_returns_empty(tmp_path):
+    recognizer = GlyphRecognizer(template_path=str(tmp_path / "missing.npz"))
+    assert not recognizer.available
+    result = recognizer.recognize_number(_field("123"), fallback=lambda crop: "123")
+    assert result.source == "fallback"
+
+
+def test_numeric_spans_read_by_glyph_templates_on_live_path(monkeypatch):
+    import utils
+    from ocr_result import OcrResult
+
+    price = _field("599,400,000")
+    h, w = price.shape[:2]
+    img = np.concatenate([price, np.full((h, 80, 3), 28, dtype=np.uint8)], axis=1)
+    result = OcrResult(["599,4OO,0O0", "Silver"], boxes=[[0, 0, w, h], [w, 0, w + 80, h]],
+                       confidences=[0.41, 0.97])
+
+    monkeypatch.setattr(utils, "_glyph_recognizer", _trained())
+    read = utils.read_numeric_fields(img, result)
+    assert read.texts == ["599,400,000", "Silver"]
+    lines = list(read)
+    assert lines[0].engine == "glyph" and lines[0].confidence > 0.85
+    assert lines[1].engine == "easyocr"
+    assert utils.recognize_numeric_field(price)[0] == 599400000
+
+    # Ohne Templates: unverändert, kein EasyOCR-Aufruf
+    monkeypatch.setattr(utils, "_glyph_recognizer", GlyphRecognizer(template_path=None))
+    assert utils.read_numeric_fields(img, result) is result
@@ -0,0 +1,71 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+try:
+    from ._stubs import install_dependency_stubs  # type: ignore
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from _stubs import install_dependency_stubs  # type: ignore
+
+install_dependency_stubs()
+
+np = pytest.importorskip("numpy")
+cv2 = pytest.importorskip("cv2")
+if not hasattr(np, "zeros") or not hasattr(cv2, "putText"):
+    pytest.skip("numpy/OpenCV not installed", allow_module_level=True)
+
+from line_band_ocr import LineBandCache, segment_text_bands  # noqa: E402
+
+
+def _log_frame(lines):
+    img = np.full((260, 520), 25, dtype=np.uint8)
+    for idx, line in enumerate(lines):
+        cv2.putText(img, line, (10, 34 + 40 * idx), cv2.FONT_HERSHEY_SIMPLEX, 0.7, 220, 2)
+    return img
+
+
+class _CountingRecognizer:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self, crop):
+        self.calls += 1
+        return [f"row-{crop.shape[0]}-{int(crop.sum()) % 9973}"], [0.9]
+
+
+def test_projection_profile_finds_each_row():
+    frame = _log_frame(["Transaction of Birch Sap x5000", "Placed order of Spirit's Leaf", "Orders Completed 1590"])
+    bands = segment_text_bands(frame)
+    assert len(bands) == 3
+    assert all(y0 < y1 for y0, y1 in bands)
+    assert bands == sorted(bands)
+
+
+def test_blank_frame_has_no_bands():
+    assert segment_text_bands(np.full((100, 200), 25, dtype=np.uint8)) == []
+
+
+def test_shifted_rows_hit_cache():
+    cache = LineBandCache(max_entries=32)
+    recognizer = _CountingRecognizer()
+    old_rows = ["Transaction of Birch Sap x5000", "Placed order of Spirit's Leaf"]
+
+    texts, confs = cache.recognize(_log_frame(old_rows), recognizer)
+    assert len(texts) == 2 and confs == [0.9, 0.9]
+    assert recognizer.calls == 2
+
+    # New transaction on top, older rows shift down → only the new row is recognized
+    shifted = _log_frame(["Withdrew order of Black Stone x10"] + old_rows)
+    texts2, _ = cache.recognize(shifted, recognizer)
+    assert recognizer.calls == 3
+    assert texts2[1:] == texts
+    stats = cache.get_stats()
+    assert stats["band_hits"] == 2
+    assert stats["last_miss_count"] == 1
@@ -0,0 +1,92 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+try:
+    from ._stubs import install_dependency_stubs  # type: ignore
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from _stubs import install_dependency_stubs  # type: ignore
+
+install_dependency_stubs()
+
+import ocr_autotune  # noqa: E402
+
+
+def _result(latency, f1, **params):
+    return {'latency_ms': latency, 'f1': f1, 'params': params, 'torch_threads': 4}
+
+
+def test_pareto_front_and_selection_with_tolerance():
+    results = [
+        _result(900, 1.0, canvas_size=2240),
+        _result(600, 0.995, canvas_size=1920),
+        _result(700, 0.99, canvas_size=1600),   # dominiert von 1920
+        _result(300, 0.80, canvas_size=1280),
+    ]
+    front = ocr_autotune.pareto_front(results)
+    assert [r['params']['canvas_size'] for r in front] == [1280, 1920, 2240]
+    assert ocr_autotune.select_config(results, tolerance=0.01)['params']['canvas_size'] == 1920
+    assert ocr_autotune.select_config(results, tolerance=0.0)['params']['canvas_size'] == 2240
+    assert ocr_autotune.select_config([]) is None
+
+
+def test_run_autotune_sweeps_threads_only_for_front(monkeypatch):
+    # "Text" = Transaktionen durch ';' getrennt; kleine Canvas verliert die zweite
+    monkeypatch.setattr(ocr_autotune, "transaction_keys", lambda text: [[t] for t in text.split(";") if t])
+    calls = []
+
+    def evaluate(frames, params, threads):
+        calls.append((params['canvas_size'], params['paragraph'], threads))
+        latency = params['canvas_size'] / threads + (50 if params['paragraph'] else 0)
+        text = "a;b" if params['canvas_size'] >= 1600 else "a"
+        return [latency] * len(frames), [text] * len(frames)
+
+    grid = {'canvas_size': (1280, 1600, 2240), 'paragraph': (True, False)}
+    report = ocr_autotune.run_autotune([0, 1], [[["a"], ["b"]]] * 2, grid=grid, threads=[1, 4],
+                                       evaluate=evaluate, tolerance=0.0)
+
+    assert len([c for c in calls if c[2] == 4]) == 6
+    # Front nach Stufe 1: 1280/False (schnell, ungenau) und 1600/False (genau) → nur diese mit 1 Thread
+    assert sorted(c[:2] for c in calls if c[2] == 1) == [(1280, False), (1600, False)]
+    best = report['best']
+    assert best['params'] == {'canvas_size': 1600, 'paragraph': False}
+    assert best['torch_threads'] == 4 and best['f1'] == 1.0
+    assert ocr_autotune.score([[["a"]]], [[["a"], ["b"]]])['recall'] == 0.5
+
+    with pytest.raises(ValueError):
+        ocr_autotune.run_autotune([0], [], grid=grid, evaluate=evaluate)
+
+
+def test_tuning_persisted_and_applied(monkeypatch, tmp_path):
+    np = pytest.importorskip("numpy")
+    if not hasattr(np, "zeros"):
+        pytest.skip("numpy not installed")
+    import config
+    import utils
+
+    monkeypatch.setattr(config, "DB_PATH", str(tmp_path / "settings.db"))
+    monkeypatch.setattr(config, "_SETTINGS_CACHE", None)
+    best = {'params': {'canvas_size': 1600, 'paragraph': False, 'batch_size': 4, 'bogus': 1},
+            'torch_threads': 2, 'latency_ms': 412.34, 'f1': 0.98765}
+    try:
+        tuning = ocr_autotune.persist_tuning(best)
+        assert tuning['torch_threads'] == 2 and tuning['latency_ms'] == 412.3
+
+        monkeypatch.setattr(config, "_SETTINGS_CACHE", None)  # frisch aus der DB
+        assert config.get_ocr_tuning()['params']['canvas_size'] == 1600
+        applied = utils.apply_ocr_tuning()
+        assert applied == {'canvas_size': 1600, 'paragraph': False, 'batch_size': 4}
+        assert utils._EASYOCR_DETECT_PARAMS['canvas_size'] == 1600
+        assert utils._EASYOCR_RECOGNIZE_PARAMS['batch_size'] == 4
+        assert utils._EASYOCR_PARAGRAPH is False
+    finally:
+        utils.apply_ocr_tuning({})
+    assert utils._EASYOCR_DETECT_PARAMS['canvas_size'] == 2240
+    assert utils._EASYOCR_PARAGRAPH is True
@@ -0,0 +1,102 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+try:
+    from ._stubs import install_dependency_stubs  # type: ignore
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from _stubs import install_dependency_stubs  # type: ignore
+
+install_dependency_stubs()
+
+np = pytest.importorskip("numpy")
+if not hasattr(np, "zeros"):
+    pytest.skip("numpy not installed", allow_module_level=True)
+
+from ocr_process_pool import OcrProcessPool, OcrWorkerError, _restart_backoff  # noqa: E402
+from ocr_result import OcrResult  # noqa: E402
+
+
+def _fake_ocr(img, **kwargs):
+    """Runs in the worker process: echoes shape/checksum/kwargs, dies on a white top-left pixel."""
+    if img.size and img.flat[0] == 255:
+        os._exit(3)
+    return OcrResult.from_text(f"{img.shape} {int(img.sum())} {kwargs.get('method')} pid={os.getpid()}", "easyocr", 0.9)
+
+
+def _pool(**kwargs):
+    return OcrProcessPool(target=f"{__name__}:_fake_ocr", warmup=None, **kwargs)
+
+
+def test_frames_roundtrip_through_shared_memory():
+    frames = [np.full((40, 60), 7, dtype=np.uint8), np.full((30, 50, 3), 2, dtype=np.uint8),
+              np.arange(200, dtype=np.uint8).reshape(10, 20)]
+    with _pool(worker_count=2) as pool:
+        futures = [pool.submit(frame, method="auto") for frame in frames]
+        results = [future.result(timeout=60) for future in futures]
+
+        for frame, result in zip(frames, results):
+            assert isinstance(result, OcrResult)
+            assert result.text.startswith(f"{frame.shape} {int(frame.sum())} auto")
+            assert not result.text.endswith(f"pid={os.getpid()}")
+
+        stats = pool.get_stats()
+        assert stats["completed"] == 3 and stats["failed"] == 0
+        assert stats["queue_depth"] == 0 and stats["inflight"] == 0
+        assert sum(w["completed"] for w in stats["per_worker"]) == 3
+        assert all(w["alive"] for w in stats["per_worker"])
+
+
+def test_crashed_worker_is_restarted_and_frame_retried_once():
+    crash = np.full((8, 8), 255, dtype=np.uint8)
+    with _pool(worker_count=1) as pool:
+        with pytest.raises(OcrWorkerError):
+            pool.extract(crash, timeout=60)
+        stats = pool.get_stats()
+        assert stats["retried"] == 1 and stats["restarts"] == 2
+
+        # Neu gestarteter Worker nimmt weiter Frames an
+        ok = pool.extract(np.ones((8, 8), dtype=np.uint8), timeout=60)
+        assert ok.text.startswith("(8, 8) 64")
+        assert pool.get_stats()["per_worker"][0]["restarts"] == 2
+    with pytest.raises(OcrWorkerError):
+        pool.submit(crash)
+
+
+def test_restart_backoff_is_bounded_for_long_crash_loops():
+    assert [_restart_backoff(n) for n in (1, 2, 3, 4)] == [0.0, 0.5, 1.5, 3.5]
+    assert _restart_backoff(7) == 30.0
+    assert _restart_backoff(5000) == 30.0               # kein OverflowError
+
+
+def test_ocr_image_cached_routes_cache_misses_through_pool():
+    import utils
+
+    class _Pool:
+        def __init__(self):
+            self.calls = []
+
+        def extract(self, img, **kwargs):
+            self.calls.append((img.shape, kwargs))
+            return OcrResult.from_text("2025.10.18 15.42 Sold", "easyocr")
+
+    pool = _Pool()
+    utils.clear_cache()
+    utils.set_ocr_process_pool(pool)
+    try:
+        frame = np.full((50, 80, 3), 30, dtype=np.uint8)
+        text, cached, _ = utils.ocr_image_cached(frame, use_roi=False, preprocessed=frame[:, :, 0])
+        assert text == "2025.10.18 15.42 Sold" and not cached
+        assert pool.calls == [((50, 80), {"use_roi": False, "method": "auto", "fast_mode": True, "structured": True,
+                                         "window_type": None})]
+    finally:
+        utils.set_ocr_process_pool(None)
+        utils.clear_cache()
@@ -0,0 +1,91 @@
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+try:
+    from ._stubs import install_dependency_stubs  # type: ignore
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from _stubs import install_dependency_stubs  # type: ignore
+
+install_dependency_stubs()
+
+np = pytest.importorskip("numpy")
+if not hasattr(np, "zeros"):
+    pytest.skip("numpy not installed", allow_module_level=True)
+
+import ocr_engines  # noqa: E402
+
+
+GOOD = [("2025.10.18 15.42", 0.95), ("Transaction of Birch Sap x5,000 worth 1,234,000 Silver", 0.9)]
+NO_TIMESTAMP = [("Transaction of Birch Sap", 0.9)]
+
+
+@pytest.fixture
+def engines(monkeypatch):
+    """Fake engines: {name: (delay_s, lines)}; Tesseract liefert nichts."""
+    behaviour = {}
+
+    def _run(eng, _img, _threshold, _whitelist):
+        delay, lines = behaviour.get(eng, (0.0, []))
+        time.sleep(delay)
+        return lines
+
+    monkeypatch.setattr(ocr_engines, "_run_engine", _run)
+    monkeypatch.setattr(ocr_engines, "_paddle_available", True)
+    monkeypatch.setattr(ocr_engines, "_easyocr_available", True)
+    ocr_engines.reset_race_stats()
+    yield behaviour
+    # Noch laufende Verlierer abwarten, damit kein Engine-Lock in andere Tests leakt
+    for lock in ocr_engines._race_engine_locks.values():
+        assert lock.acquire(timeout=5)
+        lock.release()
+    ocr_engines.reset_race_stats()
+
+
+def test_quality_check_requires_timestamp_anchor_and_confidence():
+    assert ocr_engines.passes_quality_check(GOOD)
+    assert not ocr_engines.passes_quality_check(NO_TIMESTAMP)
+    assert not ocr_engines.passes_quality_check([("2025.10.18 15.42 Silver", 0.9)])
+    assert not ocr_engines.passes_quality_check([(g[0], 0.2) for g in GOOD])
+    # pytesseract-Subprozess: keine echte Konfidenz → kein Qualitätssieg
+    assert not ocr_engines.passes_quality_check([(g[0], float("nan")) for g in GOOD])
+    assert ocr_engines.passes_quality_check(GOOD + [("Silver", float("nan"))])
+
+
+def test_fast_engine_wins_without_waiting_for_slow_paddle(engines):
+    engines.update(paddle=(0.6, GOOD), easyocr=(0.05, GOOD))
+    start = time.perf_counter()
+    text = ocr_engines.ocr_auto(None, engine="paddle", race=True, deadline_s=5.0)
+    assert time.perf_counter() - start < 0.5
+    assert text.startswith("2025.10.18 15.42")
+
+    stats = ocr_engines.get_race_stats()
+    assert stats["races"] == 1 and stats["quality_wins"] == 1
+    assert stats["engines"]["easyocr"]["wins"] == 1 and stats["engines"]["easyocr"]["win_rate"] == 100.0
+    assert stats["suggested_order"][0] == "easyocr"
+
+
+def test_deadline_falls_back_and_busy_engine_is_skipped(engines):
+    engines.update(paddle=(0.8, GOOD), easyocr=(0.01, NO_TIMESTAMP))
+    text = ocr_engines.ocr_auto(None, engine="paddle", race=True, deadline_s=0.2)
+    assert text == "Transaction of Birch Sap"
+    stats = ocr_engines.get_race_stats()
+    assert stats["deadline_hits"] == 1 and stats["fallback_results"] == 1
+
+    # PaddleOCR rechnet noch am letzten Frame → nicht erneut starten
+    ocr_engines.ocr_auto(None, engine="paddle", race=True, deadline_s=0.1)
+    assert ocr_engines.get_race_stats()["engines"]["paddle"]["busy_skips"] == 1
+
+
+def test_sequential_mode_unchanged(engines):
+    engines.update(paddle=(0.2, NO_TIMESTAMP), easyocr=(0.0, GOOD))
+    assert ocr_engines.ocr_auto(None, engine="paddle", race=False) == "Transaction of Birch Sap"
+    assert ocr_engines.get_race_stats()["races"] == 0
@@ -0,0 +1,110 @@
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+try:
+    from ._stubs import install_dependency_stubs  # type: ignore
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from _stubs import install_dependency_stubs  # type: ignore
+
+install_dependency_stubs()
+
+from ocr_registry import EngineRegistry  # noqa: E402
+
+
+def test_engine_is_built_once_on_first_use_even_when_requested_concurrently():
+    calls = []
+
+    def builder(registry):
+        calls.append(1)
+        time.sleep(0.05)
+        registry.set_detail("fake", mode="CPU")
+        return object()
+
+    registry = EngineRegistry()
+    registry.register("fake", builder)
+    assert registry.status()["fake"]["state"] == "idle"
+    assert registry.peek("fake") is None
+    assert not calls
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(registry.get("fake"))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert len({id(r) for r in results}) == 1
+    status = registry.status()["fake"]
+    assert status["state"] == "ready"
+    assert status["mode"] == "CPU"
+    assert status["load_s"] >= 0.04
+
+
+def test_failed_build_is_remembered_until_reset():
+    calls = []
+
+    def builder(_registry):
+        calls.append(1)
+        raise RuntimeError("no model")
+
+    registry = EngineRegistry()
+    registry.register("broken", builder)
+    assert registry.get("broken") is None
+    assert registry.get("broken") is None
+    assert len(calls) == 1
+    status = registry.status()["broken"]
+    assert status["state"] == "failed"
+    assert "no model" in status["error"]
+
+    registry.reset("broken")
+    assert registry.get("broken") is None
+    assert len(calls) == 2
+    assert registry.get("unknown") is None
+
+
+def test_warmup_builds_in_background_thread():
+    started = threading.Event()
+    release = threading.Event()
+
+    def builder(_registry):
+        started.set()
+        release.wait(1.0)
+        return "engine"
+
+    registry = EngineRegistry()
+    registry.register("slow", builder)
+    assert registry.when_warm(lambda: None) is False
+    thread = registry.warmup(["slow"])
+    assert started.wait(1.0)
+    assert registry.status()["slow"]["state"] == "loading"
+    warm = []
+    assert registry.when_warm(lambda: warm.append(registry.is_ready("slow")))
+    release.set()
+    thread.join(1.0)
+    assert registry.is_ready("slow")
+    assert registry.get("slow") == "engine"
+    assert warm == [True]
+    assert registry.when_warm(lambda: None) is False
+
+
+def test_import_config_loads_no_ocr_model_and_touches_no_database(tmp_path):
+    probe = (
+        "import sys; sys.path.insert(0, %r)\n"
+        "import config\n"
+        "assert config.MAX_ITEM_QUANTITY > 0\n"
+        "print(sorted(m for m in ('easyocr', 'torch', 'paddleocr') if m in sys.modules))\n"
+    ) % str(ROOT)
+    proc = subprocess.run([sys.executable, "-c", probe], cwd=tmp_path, capture_output=True, text=True)
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout.strip().splitlines()[-1] == "[]"
+    assert not (tmp_path / "bdo_tracker.db").exists()
@@ -0,0 +1,113 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+try:
+    from ._stubs import install_dependency_stubs  # type: ignore
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from _stubs import install_dependency_stubs  # type: ignore
+
+install_dependency_stubs()
+
+np = pytest.importorskip("numpy")
+if not hasattr(np, "zeros"):
+    pytest.skip("numpy not installed", allow_module_level=True)
+
+from ocr_result import OcrResult, reconstruct_log_rows  # noqa: E402
+
+
+def _quad(x0, y0, x1, y1):
+    return [[x0, y0], [x1, y0], [x1, y1], [x0, y1]]
+
+
+# EasyOCR (paragraph=False) liefert die Spans nicht zwingend in Lesereihenfolge;
+# der Timestamp der zweiten Zeile sitzt 12px höher als ihr Event-Text.
+_ENTRIES = [
+    (_quad(150, 60, 600, 80), "Placed order of Spirit's Leaf x100 for 1,230,000 Silver", 0.91),
+    (_quad(10, 20, 140, 40), "2025.10.18 15.42", 0.97),
+    (_quad(150, 20, 600, 40), "Transaction of Birch Sap x5,000 worth 1,234,000 Silver", 0.88),
+    (_quad(10, 48, 140, 66), "2025.10.18 15.40", 0.95),
+]
+
+
+def test_from_detections_keeps_geometry_in_compact_arrays():
+    result = OcrResult.from_detections(_ENTRIES, offset=(5, 100))
+
+    assert len(result) == 4
+    assert result.boxes.dtype == np.int32 and result.boxes.shape == (4, 4)
+    assert result.confidences.dtype == np.float32
+    assert tuple(result.boxes[1]) == (15, 120, 145, 140)
+    assert result.has_geometry
+    assert result.engine == "easyocr"
+    assert result.text == " ".join(text for _, text, _ in _ENTRIES)
+    assert result.mean_confidence() == pytest.approx(np.mean([e[2] for e in _ENTRIES]))
+    line = result.line(1)
+    assert line.text == "2025.10.18 15.42" and line.engine == "easyocr"
+
+
+def test_paragraph_entries_without_confidence():
+    result = OcrResult.from_detections([(_quad(0, 0, 50, 10), "Sold")])
+    assert np.isnan(result.confidences[0])
+    assert result.mean_confidence() is None
+
+
+def test_reconstruction_pairs_timestamps_with_their_rows():
+    rows = reconstruct_log_rows(OcrResult.from_detections(_ENTRIES))
+    assert rows == [
+        "2025.10.18 15.42 Transaction of Birch Sap x5,000 worth 1,234,000 Silver",
+        "2025.10.18 15.40 Placed order of Spirit's Leaf x100 for 1,230,000 Silver",
+    ]
+
+
+def test_reconstructed_text_feeds_existing_parser():
+    from parsing import split_text_into_log_entries
+
+    text = OcrResult.from_detections(_ENTRIES).log_text()
+    entries = split_text_into_log_entries(text)
+    pairs = [(ts, snippet.split(" ")[2]) for _, ts, snippet in entries]
+    assert pairs == [("2025.10.18 15.42", "Transaction"), ("2025.10.18 15.40", "Placed")]
+
+
+def test_text_only_results_and_concat():
+    tess = OcrResult.from_text("2025.10.18 15.42 Sold", "tesseract")
+    assert not tess.has_geometry
+    assert tess.log_text() == tess.text == "2025.10.18 15.42 Sold"
+    merged = OcrResult.concat([OcrResult.from_detections(_ENTRIES[:1]), tess, OcrResult.from_text("")])
+    assert len(merged) == 2
+    assert merged.engine == "mixed"
+
+
+def test_ocr_image_cached_stores_structured_result(monkeypatch):
+    cv2 = pytest.importorskip("cv2")
+    if not hasattr(cv2, "resize"):
+        pytest.skip("OpenCV not installed")
+    import utils
+
+    calls = []
+
+    def _extract(_img, **kwargs):
+        calls.append(kwargs.get("structured"))
+        return OcrResult.from_detections(_ENTRIES)
+
+    monkeypatch.setattr(utils, "extract_text", _extract)
+    utils.clear_cache()
+    try:
+        frame = np.full((120, 620, 3), 30, dtype=np.uint8)
+        text, cached, _ = utils.ocr_image_cached(frame, use_roi=False, preprocessed=frame)
+        assert not cached and text == OcrResult.from_detections(_ENTRIES).text
+        result, cached, _ = utils.ocr_image_cached(frame, use_roi=False, preprocessed=frame, structured=True)
+        assert cached and isinstance(result, OcrResult) and len(result) == 4
+        assert calls == [True]
+
+        monkeypatch.setattr(utils, "OCR_GEOMETRY_RECONSTRUCTION", True)
+        text, cached, _ = utils.ocr_image_cached(frame, use_roi=False, preprocessed=frame)
+        assert cached and text.startswith("2025.10.18 15.42 Transaction")
+    finally:
+        utils.clear_cache()
@@ -0,0 +1,117 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+try:
+    from ._stubs import install_dependency_stubs  # type: ignore
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from _stubs import install_dependency_stubs  # type: ignore
+
+install_dependency_stubs()
+
+np = pytest.importorskip("numpy")
+cv2 = pytest.importorskip("cv2")
+if not hasattr(np, "zeros") or not hasattr(cv2, "putText"):
+    pytest.skip("numpy/OpenCV not installed", allow_module_level=True)
+
+import utils  # noqa: E402
+
+
+def _frame(lines, noise_seed=None):
+    img = np.full((300, 600, 3), 28, dtype=np.uint8)
+    for idx, line in enumerate(lines):
+        cv2.putText(img, line, (12, 36 + 40 * idx), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (220, 220, 220), 2)
+    if noise_seed is not None:
+        rng = np.random.default_rng(noise_seed)
+        noise = rng.integers(-3, 4, size=img.shape)
+        img = np.clip(img.astype(np.int16) + noise, 0, 255).astype(np.uint8)
+    return img
+
+
+@pytest.fixture
+def fake_ocr(monkeypatch):
+    calls = {"count": 0, "text": "2025.10.14 13.09 Transaction of Birch Sap x5000"}
+
+    def _extract(_img, **_kwargs):
+        calls["count"] += 1
+        return calls["text"]
+
+    monkeypatch.setattr(utils, "extract_text", _extract)
+    monkeypatch.setattr(utils, "preprocess", lambda img, **_kwargs: img)
+    monkeypatch.setattr(utils, "PHASH_CACHE_ENABLED", True)
+    monkeypatch.setattr(utils, "PHASH_VERIFY_INTERVAL", 0)
+    utils.clear_cache()
+    yield calls
+    utils.clear_cache()
+
+
+def test_dhash_tolerates_noise_but_not_new_rows():
+    rows = ["Transaction of Birch Sap x5000", "Placed order of Spirit's Leaf"]
+    base = utils.compute_dhash(_frame(rows))
+    noisy = utils.compute_dhash(_frame(rows, noise_seed=1))
+    changed = utils.compute_dhash(_frame(["Withdrew order of Black Stone x10"] + rows))
+
+    assert (base ^ noisy).bit_count() <= utils.PHASH_MAX_DISTANCE
+    assert (base ^ changed).bit_count() > utils.PHASH_MAX_DISTANCE
+
+
+def test_near_duplicate_frame_hits_phash_tier(fake_ocr):
+    rows = ["Transaction of Birch Sap x5000", "Placed order of Spirit's Leaf"]
+    text, cached, _ = utils.ocr_image_cached(_frame(rows), use_roi=False)
+    assert not cached and fake_ocr["count"] == 1
+
+    text2, cached2, stats = utils.ocr_image_cached(_frame(rows, noise_seed=2), use_roi=False)
+    assert cached2 and stats["cache_tier"] == "phash"
+    assert text2 == text
+    assert fake_ocr["count"] == 1
+
+    cache_stats = utils.get_cache_stats()
+    assert cache_stats["phash_hits"] == 1
+    assert cache_stats["phash_misses"] == 1
+
+
+def test_verification_counts_false_hits(fake_ocr, monkeypatch):
+    monkeypatch.setattr(utils, "PHASH_VERIFY_INTERVAL", 1)
+    rows = ["Transaction of Birch Sap x5000"]
+    utils.ocr_image_cached(_frame(rows), use_roi=False)
+
+    fake_ocr["text"] = "2025.10.14 13.10 Transaction of Birch Sap x4999"
+    text, cached, _ = utils.ocr_image_cached(_frame(rows, noise_seed=3), use_roi=False)
+    assert not cached
+    assert text == fake_ocr["text"]
+
+    cache_stats = utils.get_cache_stats()
+    assert cache_stats["phash_verifications"] == 1
+    assert cache_stats["phash_false_hits"] == 1
+    assert cache_stats["phash_false_hit_rate"] == 100.0
+
+
+def test_digit_change_misses_by_default(monkeypatch):
+    calls = {"count": 0}
+
+    def _extract(_img, **_kwargs):
+        calls["count"] += 1
+        return f"Orders Completed {calls['count']}"
+
+    monkeypatch.setattr(utils, "extract_text", _extract)
+    monkeypatch.setattr(utils, "preprocess", lambda img, **_kwargs: img)
+    utils.clear_cache()
+    rows = ["Transaction of Birch Sap x5000", "Placed order of Spirit's Leaf"]
+    before, after = _frame(["Orders Completed 3"] + rows), _frame(["Orders Completed 4"] + rows)
+
+    # Der dHash sieht die Ziffer kaum → Tier ist standardmäßig aus
+    assert (utils.compute_dhash(before) ^ utils.compute_dhash(after)).bit_count() <= utils.PHASH_MAX_DISTANCE
+    assert utils.PHASH_CACHE_ENABLED is False
+
+    utils.ocr_image_cached(before, use_roi=False)
+    text, cached, _ = utils.ocr_image_cached(after, use_roi=False)
+    assert not cached and text == "Orders Completed 2"
+    assert utils.get_cache_stats()["phash_hits"] == 0
+    utils.clear_cache()
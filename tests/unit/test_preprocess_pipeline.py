@@ -0,0 +1,81 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+try:
+    from ._stubs import install_dependency_stubs  # type: ignore
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from _stubs import install_dependency_stubs  # type: ignore
+
+install_dependency_stubs()
+
+np = pytest.importorskip("numpy")
+cv2 = pytest.importorskip("cv2")
+if not hasattr(np, "zeros") or not hasattr(cv2, "createCLAHE"):
+    pytest.skip("numpy/OpenCV not installed", allow_module_level=True)
+
+from preprocess_pipeline import PreprocessPipeline  # noqa: E402
+
+
+def _legacy_preprocess(img, adaptive=True, denoise=False, fast_mode=False):
+    # Reference: utils.preprocess before the pipeline refactor
+    gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY) if img.ndim == 3 else img.copy()
+    if fast_mode:
+        return cv2.convertScaleAbs(gray, alpha=1.3, beta=15)
+    if denoise:
+        gray = cv2.fastNlMeansDenoising(gray, h=7, templateWindowSize=7, searchWindowSize=21)
+    if adaptive:
+        gray = cv2.createCLAHE(clipLimit=1.5, tileGridSize=(8, 8)).apply(gray)
+    kernel = np.array([[0, -0.5, 0], [-0.5, 3, -0.5], [0, -0.5, 0]])
+    return cv2.convertScaleAbs(cv2.filter2D(gray, -1, kernel), alpha=1.2, beta=10)
+
+
+def _frame(seed=0, shape=(120, 320, 3)):
+    rng = np.random.default_rng(seed)
+    img = rng.integers(0, 256, size=shape, dtype=np.uint8)
+    cv2.putText(img, "Transaction of Birch Sap x5000", (5, 60), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 1)
+    return img
+
+
+@pytest.mark.parametrize("adaptive,fast_mode", [(True, False), (False, False), (True, True)])
+def test_pipeline_matches_legacy_preprocess(adaptive, fast_mode):
+    pipeline = PreprocessPipeline()
+    for seed in range(3):
+        img = _frame(seed)
+        expected = _legacy_preprocess(img, adaptive=adaptive, fast_mode=fast_mode)
+        assert np.array_equal(pipeline.run(img, adaptive=adaptive, fast_mode=fast_mode), expected)
+    gray = cv2.cvtColor(_frame(7), cv2.COLOR_BGR2GRAY)
+    assert np.array_equal(pipeline.run(gray, adaptive=adaptive, fast_mode=fast_mode),
+                          _legacy_preprocess(gray, adaptive=adaptive, fast_mode=fast_mode))
+
+
+def test_output_buffer_reused_per_shape():
+    pipeline = PreprocessPipeline()
+    first = pipeline.run(_frame(1))
+    second = pipeline.run(_frame(2))
+    assert second is first
+
+    owned = pipeline.run(_frame(3), reuse_output=False)
+    assert owned is not first
+
+    other = pipeline.run(_frame(4, shape=(40, 320, 3)))
+    assert other.shape == (40, 320)
+    assert pipeline.run(_frame(5)) is first
+
+
+def test_step_timings_recorded():
+    pipeline = PreprocessPipeline()
+    pipeline.run(_frame())
+    assert {"gray_ms", "clahe_ms", "sharpen_ms", "contrast_ms", "total_ms"} <= set(pipeline.last_timing)
+    pipeline.run(_frame(), fast_mode=True)
+    assert "clahe_ms" not in pipeline.last_timing
+    stats = pipeline.get_stats()
+    assert stats["frames"] == 2
+    assert stats["avg_total_ms"] >= 0.0
@@ -0,0 +1,93 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+try:
+    from ._stubs import install_dependency_stubs  # type: ignore
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from _stubs import install_dependency_stubs  # type: ignore
+
+install_dependency_stubs()
+
+np = pytest.importorskip("numpy")
+cv2 = pytest.importorskip("cv2")
+if not hasattr(np, "zeros") or not hasattr(cv2, "putText"):
+    pytest.skip("numpy/OpenCV not installed", allow_module_level=True)
+
+import ocr_engines  # noqa: E402
+from line_band_ocr import LineBandCache  # noqa: E402
+
+
+class _FakeReader:
+    """recognize() liest den Text aus der Box-Höhe zurück und antwortet bewusst in umgekehrter Reihenfolge."""
+
+    def __init__(self):
+        self.calls = []
+
+    def recognize(self, canvas, horizontal_list=None, free_list=None, **kwargs):
+        self.calls.append((canvas.shape, list(horizontal_list), kwargs))
+        return [([[b[0], b[2]], [b[1], b[2]], [b[1], b[3]], [b[0], b[3]]], f"h{b[3] - b[2]}w{b[1] - b[0]}", 0.8)
+                for b in reversed(horizontal_list)]
+
+
+def _crop(width, height, text="123"):
+    img = np.full((height, width), 20, dtype=np.uint8)
+    cv2.putText(img, text, (2, height - 4), cv2.FONT_HERSHEY_SIMPLEX, 0.5, 230, 1)
+    return img
+
+
+def test_single_recognizer_call_keeps_crop_order():
+    reader = _FakeReader()
+    ocr_engines.reset_batch_stats()
+    crops = [_crop(120, 20), _crop(300, 24), np.zeros((0, 10), dtype=np.uint8),
+             cv2.cvtColor(_crop(80, 18), cv2.COLOR_GRAY2BGR)]
+    results = ocr_engines.recognize_batch(crops, reader=reader, batch_size=8, contrast_ths=0.35)
+
+    assert len(reader.calls) == 1
+    shape, boxes, kwargs = reader.calls[0]
+    assert shape[1] == 300  # gemeinsame Breite
+    assert kwargs["batch_size"] == 8 and kwargs["contrast_ths"] == 0.35 and not kwargs["paragraph"]
+    assert [r.texts for r in results] == [["h20w120"], ["h24w300"], [], ["h18w80"]]
+    # Boxen relativ zum jeweiligen Crop
+    assert tuple(results[1].boxes[0]) == (0, 0, 300, 24)
+    assert results[0].engine == "easyocr"
+
+    stats = ocr_engines.get_batch_stats()["easyocr"]
+    assert stats["calls"] == 1 and stats["crops"] == 3 and stats["batches"] == 1
+    assert stats["crops_per_s"] > 0
+
+
+def test_unknown_engine_and_missing_reader():
+    with pytest.raises(ValueError):
+        ocr_engines.recognize_batch([_crop(50, 20)], engine="nope")
+    assert ocr_engines.recognize_batch([], reader=_FakeReader()) == []
+
+
+def test_line_band_misses_go_through_one_batch():
+    frame = np.full((120, 400), 25, dtype=np.uint8)
+    for idx, line in enumerate(["2025.10.18 15.42 Transaction", "2025.10.18 15.40 Placed order", "Sold x5"]):
+        cv2.putText(frame, line, (10, 25 + 35 * idx), cv2.FONT_HERSHEY_SIMPLEX, 0.6, 220, 1)
+
+    batches = []
+
+    def _batch(crops):
+        batches.append(len(crops))
+        return [([f"row{i}"], [0.9]) for i in range(len(crops))]
+
+    def _single(_crop):
+        raise AssertionError("per-band recognizer must not be used with batch_fn")
+
+    cache = LineBandCache()
+    texts, confs = cache.recognize(frame, _single, batch_fn=_batch)
+    assert batches == [3] and texts == ["row0", "row1", "row2"] and confs == [0.9] * 3
+
+    texts_again, _ = cache.recognize(frame, _single, batch_fn=_batch)
+    assert batches == [3] and texts_again == texts
+    assert cache.get_stats()["band_hits"] == 3
@@ -0,0 +1,87 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+try:
+    from ._stubs import install_dependency_stubs  # type: ignore
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from _stubs import install_dependency_stubs  # type: ignore
+
+install_dependency_stubs()
+
+np = pytest.importorskip("numpy")
+cv2 = pytest.importorskip("cv2")
+if not hasattr(np, "zeros") or not hasattr(cv2, "resize"):
+    pytest.skip("numpy/OpenCV not installed", allow_module_level=True)
+
+from roi_detector import RoiGeometryCache, detect_text_roi  # noqa: E402
+
+
+def _market_frame(text_top=40, lines=8, left=60):
+    img = np.full((700, 1000, 3), 22, dtype=np.uint8)
+    for idx in range(lines):
+        y = text_top + 32 * idx
+        cv2.putText(img, f"2025.10.18 15.4{idx} Transaction of Birch Sap x5,000 worth 1,234,000 Silver",
+                    (left, y), cv2.FONT_HERSHEY_SIMPLEX, 0.55, (220, 220, 220), 1)
+    # inventory icon row at the bottom: tall textured squares
+    rng = np.random.default_rng(1)
+    for col in range(10):
+        x = 40 + col * 90
+        img[600:680, x:x + 70] = rng.integers(0, 255, size=(80, 70, 3), dtype=np.uint8)
+    return img
+
+
+def test_detects_text_block_and_skips_icon_row():
+    roi = detect_text_roi(_market_frame(), downscale=2, margin=6)
+    assert roi is not None
+    x, y, w, h = roi
+    assert 15 <= y <= 35            # first text line (baseline 40, cap height ~12)
+    assert 250 <= y + h <= 300      # last text line baseline 264 → icons at 600 excluded
+    assert 40 <= x <= 62            # timestamp column starts at x=60
+    assert h < 700 * 0.75           # far smaller than the old fixed crop
+
+
+def test_blank_frame_returns_none():
+    assert detect_text_roi(np.full((300, 400, 3), 22, dtype=np.uint8)) is None
+
+
+def test_geometry_cache_hits_and_revalidates():
+    cache = RoiGeometryCache(revalidate_every=3, min_iou=0.85, downscale=2)
+    frame = _market_frame()
+    first = cache.get(frame)
+    assert cache.get(frame) == first
+    assert cache.get(frame) == first
+    stats = cache.get_stats()
+    assert stats["detections"] == 1 and stats["hits"] == 2
+
+    # layout moved (different tab): the next validation notices and re-detects
+    moved = _market_frame(text_top=300, lines=4)
+    cache.get(moved)
+    refreshed = cache.get(moved)
+    assert refreshed[1] > first[1] + 200
+    assert cache.get_stats()["invalidations"] == 1
+
+
+def test_cache_separates_image_kinds_and_revalidates_when_marked_stale():
+    cache = RoiGeometryCache(revalidate_every=30, min_iou=0.85, downscale=2)
+    raw = _market_frame(lines=10)
+    gray = cv2.cvtColor(raw, cv2.COLOR_BGR2GRAY)
+    roi_raw = cache.get(raw)
+    cache.get(gray)
+    cache.get(gray, kind="raw")
+    assert cache.get_stats()["detections"] == 3           # eigener Eintrag je Bild-Art
+
+    # Neue Zeile unter der gecachten Unterkante: IoU bleibt über min_iou, Counter nicht fällig
+    grown = _market_frame(lines=11)
+    assert cache.get(grown) == roi_raw                     # ohne Hinweis weiter gecacht
+    cache.mark_stale()
+    refreshed = cache.get(grown)
+    assert refreshed[1] + refreshed[3] > roi_raw[1] + roi_raw[3] + 20
+    assert cache.get_stats()["invalidations"] == 1
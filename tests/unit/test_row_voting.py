@@ -0,0 +1,105 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+try:
+    from ._stubs import install_dependency_stubs  # type: ignore
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from _stubs import install_dependency_stubs  # type: ignore
+
+install_dependency_stubs()
+
+from row_voting import RowVoter, vote_string  # noqa: E402
+
+
+TS = "2025.10.18 15.42"
+ROW = "Transaction of Birch Sap x1,000 worth 1,234,000 Silver"
+ROW2 = "Placed order of Maple Sap x5,000 for 12,000,000 Silver"
+
+
+def test_vote_string_majority_per_character():
+    assert vote_string(["x1,000", "xl,O00", "x1,000"]) == "x1,000"
+    assert vote_string(["Silver", "Silve_", "5ilver"]) == "Silver"
+    # Abweichende Länge zählt nicht mit, Gleichstand → jüngste Lesung
+    assert vote_string(["x1,000", "x1, 000", "x1,000"]) == "x1,000"
+    assert vote_string(["1C-13", "10-13"]) == "10-13"
+
+
+def test_rows_committed_once_stable_with_consensus_text():
+    voter = RowVoter(history=5, min_readings=2, match_threshold=0.8, max_age=2)
+    assert voter.update([(0, TS, ROW)], context="buy_overview") == []           # erste Lesung
+    assert voter.update([(0, TS, ROW)], context="buy_overview") == [(0, TS, ROW)]
+
+    # OCR-Ausrutscher in einem Frame → Konsens bleibt
+    slip = ROW.replace("x1,000", "xl,O00").replace("Silver", "Silve_")
+    assert voter.update([(0, "2025.1C.18 15.42", slip)], context="buy_overview") == [(0, TS, ROW)]
+
+    # Neue Zeile darüber: zurückgehalten, bis stabil; alte Zeile läuft weiter
+    out = voter.update([(0, TS, ROW2), (60, TS, ROW)], context="buy_overview")
+    assert out == [(60, TS, ROW)]
+    out = voter.update([(0, TS, ROW2), (60, TS, ROW)], context="buy_overview")
+    assert out == [(0, TS, ROW2), (60, TS, ROW)]
+
+    stats = voter.get_stats()
+    assert stats["committed_rows"] == 2 and stats["corrected_readings"] == 1
+    assert stats["withheld_readings"] == 2
+
+
+def test_duplicate_rows_orphans_and_window_change():
+    voter = RowVoter(history=5, min_readings=2, match_threshold=0.8, max_age=1)
+    # Zwei identische Zeilen im selben Scan → zwei Spuren
+    voter.update([(0, TS, ROW), (60, TS, ROW)], context="buy_overview")
+    assert len(voter.update([(0, TS, ROW), (60, TS, ROW)], context="buy_overview")) == 2
+
+    # Einmal gesehen und wieder verschwunden → trotzdem übergeben (genau einmal)
+    assert voter.update([(0, TS, ROW2)], context="buy_overview") == []
+    out = voter.update([], context="buy_overview")
+    assert out == [(0, TS, ROW2)]
+    assert voter.get_stats()["orphan_commits"] == 1
+    assert voter.update([], context="buy_overview") == []
+    assert voter.get_stats()["active_rows"] == 0
+
+    # Fensterwechsel → Spuren neu, erste Lesung wieder zurückgehalten
+    voter.update([(0, TS, ROW)], context="buy_overview")
+    assert voter.update([(0, TS, ROW)], context="sell_overview") == []
+
+
+def test_orphan_is_emitted_after_rows_of_the_current_scan():
+    voter = RowVoter(history=5, min_readings=2, match_threshold=0.8, max_age=2)
+    row3 = "Listed Ash Plank x200 for 520,000 Silver"
+    voter.update([(0, TS, row3), (60, TS, ROW)], context="buy_overview")
+
+    # row3 verschwindet, ROW rückt nach oben: alte pos 0 der Waise darf nicht vor ROW landen
+    out = voter.update([(30, TS, ROW)], context="buy_overview")
+    assert out == [(30, TS, ROW), (31, TS, row3)]
+    assert voter.get_stats()["orphan_commits"] == 1
+
+
+def test_tracker_processes_only_voted_rows(monkeypatch):
+    np = pytest.importorskip("numpy")
+    if not hasattr(np, "zeros"):
+        pytest.skip("numpy not installed")
+    import tracker
+
+    seen = []
+
+    def fake_details(ts_text, snippet):
+        seen.append(snippet)
+        return {'timestamp': None}
+
+    monkeypatch.setattr(tracker, "extract_details_from_entry", fake_details)
+    mt = tracker.MarketTracker(debug=False)
+    mt.row_voter = RowVoter(min_readings=2)
+    text = f"Orders 5000 Orders Completed 2564 Collect {TS} {ROW} has been completed."
+    mt.process_ocr_text(text)
+    assert seen == []
+    mt.process_ocr_text(text)
+    mt.process_ocr_text(text.replace("x1,000", "xl,O00"))
+    assert len(seen) == 2 and all("x1,000" in snippet for snippet in seen)
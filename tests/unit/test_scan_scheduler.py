@@ -0,0 +1,99 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+try:
+    from ._stubs import install_dependency_stubs  # type: ignore
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from _stubs import install_dependency_stubs  # type: ignore
+
+install_dependency_stubs()
+
+from scan_scheduler import ScanScheduler  # noqa: E402
+
+
+def test_fast_ocr_idle_frames_use_max_interval():
+    sched = ScanScheduler(max_interval=0.5, target_latency=1.0)
+    for _ in range(5):
+        sched.record_scan(0.05, ocr_ran=True, window_type="sell_overview")
+    # 1.0s target - 50ms OCR → latency allows far more than max_interval
+    assert sched.next_interval(now=0.0) == pytest.approx(0.5)
+    assert sched.last_decision["reason"] == "latency"
+
+
+def test_slow_ocr_is_limited_by_cpu_budget():
+    sched = ScanScheduler(max_interval=5.0, cpu_budget=0.5, change_rate_alpha=0.5)
+    for _ in range(5):
+        sched.record_scan(1.2, ocr_ran=True, window_type="buy_overview")
+    interval = sched.next_interval(now=0.0)
+    # cost 1.2s at 50% budget → wait at least as long as the scan took
+    assert interval == pytest.approx(1.2)
+    assert sched.last_decision["reason"] == "cpu_budget"
+
+    # Once the gate skips most frames, the expected cost (and interval) drop
+    for _ in range(6):
+        sched.record_scan(0.002, ocr_ran=False)
+    assert sched.next_interval(now=0.0) < interval
+
+
+def test_detail_to_overview_transition_bursts():
+    sched = ScanScheduler(max_interval=0.5, burst_target_latency=0.25, transition_burst_seconds=3.0)
+    sched.record_scan(0.1, ocr_ran=True, window_type="sell_item", now=0.0)
+    sched.record_scan(0.1, ocr_ran=True, window_type="sell_overview", now=1.0)
+
+    assert sched.next_interval(now=1.5) == pytest.approx(0.15)
+    assert sched.last_decision["reason"].startswith("burst_")
+    # burst window ends after transition_burst_seconds
+    assert sched.next_interval(now=4.5) == pytest.approx(0.5)
+
+
+def test_closed_market_backs_off_exponentially():
+    sched = ScanScheduler(max_interval=0.5, closed_backoff_max=4.0)
+    intervals = []
+    for _ in range(5):
+        sched.record_idle("no_focus")
+        intervals.append(sched.next_interval(now=0.0))
+    assert intervals == [0.5, 1.0, 2.0, 4.0, 4.0]
+    assert sched.last_decision["reason"] == "closed_backoff"
+
+    # A tracker burst request overrides the backoff; market window resets it
+    assert sched.next_interval(burst_hint=True, now=0.0) < 0.5
+    sched.record_scan(0.05, ocr_ran=True, window_type="buy_overview", now=10.0)
+    assert sched.next_interval(now=10.0) == pytest.approx(0.5)
+
+    metrics = sched.get_metrics()
+    assert metrics["reasons"]["closed_backoff"] == 5
+    assert metrics["scans_per_minute"] > 0
+
+
+def test_focus_return_ends_backoff_even_when_gate_skips_ocr():
+    sched = ScanScheduler(max_interval=0.5, closed_backoff_max=4.0)
+    for _ in range(4):
+        sched.record_idle("no_focus")
+    assert sched.next_interval(now=0.0) == pytest.approx(4.0)
+
+    # Fokus zurück, Frame unverändert → Gate überspringt OCR (kein window_type)
+    sched.record_scan(0.002, ocr_ran=False, now=5.0)
+    assert sched.next_interval(now=5.0) == pytest.approx(0.5)
+    assert sched.last_decision["reason"] == "latency"
+
+    # Nicht-Markt-Fenster per OCR erkannt → Backoff weiterhin
+    sched.record_scan(0.05, ocr_ran=True, window_type="unknown", now=6.0)
+    sched.record_scan(0.002, ocr_ran=False, now=6.5)
+    assert sched.next_interval(now=6.5) == pytest.approx(0.5)
+    assert sched.last_decision["reason"] == "closed_backoff"
+
+
+def test_long_idle_streak_stays_at_backoff_max():
+    sched = ScanScheduler(max_interval=0.3, closed_backoff_max=4.0)
+    for _ in range(1100):                               # ~2 min ohne Fokus bei 10 Polls/s
+        sched.record_idle("no_focus")
+    assert sched.next_interval(now=0.0) == pytest.approx(4.0)
+    assert sched.last_decision["reason"] == "closed_backoff"
@@ -0,0 +1,118 @@
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+try:
+    from ._stubs import install_dependency_stubs  # type: ignore
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from _stubs import install_dependency_stubs  # type: ignore
+
+install_dependency_stubs()
+
+np = pytest.importorskip("numpy")
+cv2 = pytest.importorskip("cv2")
+if not hasattr(np, "zeros") or not hasattr(cv2, "cvtColor"):
+    pytest.skip("numpy/OpenCV not installed", allow_module_level=True)
+
+from tesseract_backend import PersistentTesseract  # noqa: E402
+
+
+class _Line:
+    def __init__(self, text, box, conf):
+        self._text, self._box, self._conf = text, box, conf
+
+    def GetUTF8Text(self, _level):
+        return self._text
+
+    def BoundingBox(self, _level):
+        return self._box
+
+    def Confidence(self, _level):
+        return self._conf
+
+
+class _FakeApi:
+    instances = []
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.variables = []
+        self.images = []
+        self.cleared = 0
+        _FakeApi.instances.append(self)
+
+    def SetVariable(self, name, value):
+        self.variables.append((name, value))
+        return True
+
+    def SetImageBytes(self, data, width, height, bpp, bpl):
+        self.images.append((len(data), width, height, bpp, bpl))
+
+    def GetUTF8Text(self):
+        return "2025.10.18 15.42 Sold\n"
+
+    def Recognize(self):
+        return True
+
+    def GetIterator(self):
+        return [_Line("2025.10.18 15.42 Transaction", (5, 4, 220, 20), 91.0), _Line("  ", (0, 0, 1, 1), 10.0)]
+
+    def Clear(self):
+        self.cleared += 1
+
+    def End(self):
+        pass
+
+
+def _fake_module():
+    return types.SimpleNamespace(
+        PyTessBaseAPI=_FakeApi,
+        RIL=types.SimpleNamespace(TEXTLINE=2),
+        iterate_level=lambda iterator, _level: iter(iterator),
+    )
+
+
+def test_single_handle_whitelist_set_once_and_numpy_buffers():
+    _FakeApi.instances.clear()
+    backend = PersistentTesseract(tessdata="/tessdata", module=_fake_module())
+    gray = np.zeros((30, 100), dtype=np.uint8)
+    bgr = np.zeros((30, 100, 3), dtype=np.uint8)
+
+    for img in (gray, bgr, gray):
+        assert backend.image_to_string(img, whitelist="0123456789") == "2025.10.18 15.42 Sold\n"
+    backend.image_to_string(gray, whitelist=None)
+
+    assert len(_FakeApi.instances) == 1
+    api = _FakeApi.instances[0]
+    assert api.kwargs == {"lang": "eng", "psm": 6, "oem": 3, "path": "/tessdata"}
+    assert api.variables == [("tessedit_char_whitelist", "0123456789"), ("tessedit_char_whitelist", "")]
+    assert api.images[0] == (3000, 100, 30, 1, 100) and api.images[1] == (9000, 100, 30, 3, 300)
+    assert api.cleared == 4
+    assert backend.get_stats()["calls"] == 4
+
+
+def test_recognize_returns_lines_with_geometry():
+    backend = PersistentTesseract(tessdata=None, module=_fake_module())
+    result = backend.recognize(np.zeros((30, 240), dtype=np.uint8))
+    assert result.texts == ["2025.10.18 15.42 Transaction"]
+    assert tuple(result.boxes[0]) == (5, 4, 220, 20)
+    assert result.confidences[0] == pytest.approx(0.91)
+    assert result.engine == "tesseract"
+
+
+def test_ocr_with_tesseract_uses_persistent_backend(monkeypatch):
+    import ocr_engines
+
+    backend = PersistentTesseract(tessdata=None, module=_fake_module())
+    monkeypatch.setattr(ocr_engines, "get_tesseract_backend", lambda: backend)
+    lines = ocr_engines.ocr_with_tesseract(np.zeros((30, 240), dtype=np.uint8), whitelist="abc")
+    assert lines == [("2025.10.18 15.42 Transaction", pytest.approx(0.91))]
+    assert ocr_engines.ocr_with_tesseract(np.zeros((30, 240), dtype=np.uint8), structured=True).has_geometry
@@ -0,0 +1,103 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+try:
+    from ._stubs import install_dependency_stubs  # type: ignore
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from _stubs import install_dependency_stubs  # type: ignore
+
+install_dependency_stubs()
+
+np = pytest.importorskip("numpy")
+cv2 = pytest.importorskip("cv2")
+if not hasattr(np, "zeros") or not hasattr(cv2, "resize"):
+    pytest.skip("numpy/OpenCV not installed", allow_module_level=True)
+
+from ocr_result import OcrResult  # noqa: E402
+from token_reocr import TokenReOcr, crop_token, is_numeric_token  # noqa: E402
+
+
+def _quad(x0, y0, x1, y1):
+    return [[x0, y0], [x1, y0], [x1, y1], [x0, y1]]
+
+
+def _result():
+    return OcrResult.from_detections([
+        (_quad(10, 10, 120, 30), "2025.10.18 15.42", 0.93),
+        (_quad(130, 10, 250, 30), "Transaction of 8irch 5ap", 0.41),
+        (_quad(260, 10, 360, 30), "1,2B4,0O0", 0.22),
+    ], offset=(100, 50))
+
+
+FRAME = np.full((60, 400), 30, dtype=np.uint8)
+
+
+def test_numeric_detection_and_crop_geometry():
+    assert is_numeric_token("1,2B4,0O0") and is_numeric_token("5,000")
+    assert not is_numeric_token("Silver") and not is_numeric_token(",.")
+    crop = crop_token(FRAME, (110, 60, 150, 75), offset=(100, 50), padding=2, upscale=2.0)
+    assert crop.shape == ((25 - 10 + 4) * 2, (50 - 10 + 4) * 2)
+    assert crop_token(FRAME, (900, 900, 950, 950)) is None
+
+
+def test_stages_only_see_still_uncertain_tokens():
+    calls = []
+
+    def glyph(crops, numeric):
+        calls.append(("glyph", list(numeric)))
+        return [("1,234,000", 0.97) if n else None for n in numeric]
+
+    def easyocr(crops, numeric):
+        calls.append(("easyocr", list(numeric)))
+        return [("Transaction of Birch Sap", 0.81)] * len(crops)
+
+    reocr = TokenReOcr(stages=[("glyph", glyph), ("easyocr", easyocr)], budget_ms=1000)
+    refined = reocr.refine(FRAME, _result(), offset=(100, 50))
+
+    # Schlechteste zuerst, sicherer Timestamp wird nie angefasst
+    assert calls == [("glyph", [True, False]), ("easyocr", [False])]
+    assert refined.texts == ["2025.10.18 15.42", "Transaction of Birch Sap", "1,234,000"]
+    assert [line.engine for line in refined] == ["easyocr", "easyocr", "glyph"]
+    assert refined.confidences[2] == pytest.approx(0.97)
+    assert np.array_equal(refined.boxes, _result().boxes)
+
+    stats = reocr.get_stats()
+    assert stats["flagged_tokens"] == 2 and stats["refined_tokens"] == 2
+    assert stats["stage_improved"] == {"glyph": 1, "easyocr": 1}
+
+
+def test_budget_and_min_gain_keep_original():
+    original = _result()
+    worse = TokenReOcr(stages=[("easyocr", lambda crops, _n: [("garbage", 0.25)] * len(crops))])
+    assert worse.refine(FRAME, original, offset=(100, 50)) is original
+
+    no_budget = TokenReOcr(stages=[("easyocr", lambda *_: pytest.fail("budget exhausted"))], budget_ms=0)
+    assert no_budget.refine(FRAME, original, offset=(100, 50)) is original
+    assert no_budget.get_stats()["budget_exhausted"] == 1
+
+    # paragraph=True: keine Konfidenz → nichts markiert
+    text_only = OcrResult.from_detections([(_quad(0, 0, 50, 10), "Sold")])
+    assert worse.flag(text_only) == []
+
+
+def test_extract_text_refines_low_confidence_spans(monkeypatch):
+    import utils
+
+    monkeypatch.setattr(utils, "get_reader", lambda: object())
+    monkeypatch.setattr(utils, "_easyocr_read", lambda img, offset=(0, 0), **_kw: _result())
+    monkeypatch.setattr(utils, "TOKEN_REOCR_ENABLED", True)
+    monkeypatch.setattr(utils, "_token_reocr", TokenReOcr(
+        stages=[("easyocr", lambda crops, numeric: [("1,234,000", 0.9) if n else None for n in numeric])],
+    ))
+    result = utils.extract_text(np.full((200, 500), 30, dtype=np.uint8), use_roi=False,
+                                method="easyocr", structured=True)
+    assert result.texts[2] == "1,234,000"
+    assert result.texts[1] == "Transaction of 8irch 5ap"
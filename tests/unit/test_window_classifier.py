@@ -0,0 +1,92 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+try:
+    from ._stubs import install_dependency_stubs  # type: ignore
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from _stubs import install_dependency_stubs  # type: ignore
+
+install_dependency_stubs()
+
+np = pytest.importorskip("numpy")
+cv2 = pytest.importorskip("cv2")
+if not hasattr(np, "zeros") or not hasattr(cv2, "matchTemplate"):
+    pytest.skip("numpy/OpenCV not installed", allow_module_level=True)
+
+from window_classifier import WindowClassifier  # noqa: E402
+import tracker  # noqa: E402
+
+HEADERS = {
+    "sell_overview": "Sales Completed",
+    "buy_overview": "Orders Completed",
+    "sell_item": "Register Quantity",
+    "buy_item": "Desired Amount",
+}
+LANDMARK_BOX = (0.0, 0.0, 0.5, 0.2)
+
+
+def _window(header, noise_seed=0):
+    rng = np.random.default_rng(noise_seed)
+    img = rng.integers(20, 40, size=(300, 600, 3), dtype=np.uint8)
+    cv2.putText(img, header, (10, 40), cv2.FONT_HERSHEY_SIMPLEX, 0.9, (230, 230, 230), 2)
+    cv2.putText(img, "2025.10.18 15.47 Transaction of Birch Sap", (10, 200),
+                cv2.FONT_HERSHEY_SIMPLEX, 0.6, (200, 200, 200), 1)
+    return img
+
+
+def _classifier():
+    classifier = WindowClassifier(template_dir=None, scale=0.5, threshold=0.8, search_margin=0.05)
+    for wtype, header in HEADERS.items():
+        frame = _window(header)
+        crop = frame[0:60, 0:300]
+        classifier.add_template(wtype, crop, LANDMARK_BOX)
+    return classifier
+
+
+def test_inactive_without_templates(tmp_path):
+    classifier = WindowClassifier(template_dir=str(tmp_path))
+    assert not classifier.available
+    assert classifier.classify(_window("Sales Completed")) == (None, 0.0)
+
+
+@pytest.mark.parametrize("wtype", sorted(HEADERS))
+def test_landmarks_identify_window_type(wtype):
+    classifier = _classifier()
+    detected, score = classifier.classify(_window(HEADERS[wtype], noise_seed=3))
+    assert detected == wtype
+    assert score >= 0.8
+
+
+def test_closed_market_is_unknown():
+    classifier = _classifier()
+    blank = np.random.default_rng(5).integers(20, 40, size=(300, 600, 3), dtype=np.uint8)
+    assert classifier.classify(blank)[0] == "unknown"
+    assert classifier.get_stats()["templates"] == 4
+
+
+def test_tracker_skips_ocr_on_detail_window(monkeypatch):
+    calls = []
+    monkeypatch.setattr(tracker, "ocr_image_cached", lambda *a, **k: calls.append(a) or ("", False, {}))
+
+    mt = tracker.MarketTracker(debug=False)
+    mt.window_classifier = _classifier()
+    mt.current_window = "sell_overview"
+
+    assert mt._process_image(_window(HEADERS["sell_item"])) is None
+    assert not calls
+    assert mt.current_window == "sell_item"
+    assert mt._burst_until is not None
+    assert mt._request_immediate_rescan >= 2
+
+    # back on the overview → return burst armed before OCR runs
+    mt._request_immediate_rescan = 0
+    mt._apply_classified_window("sell_overview")
+    assert mt._request_immediate_rescan == 5
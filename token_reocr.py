@@ -0,0 +1,172 @@
+"""
+Token Re-OCR - Nur unsichere Tokens neu erkennen statt den ganzen Frame
+
+Fällt die EasyOCR-Konfidenz ab, rät der Tracker bisher in
+``_recover_sell_price``/``_merge_hint_with_expected``/``_infer_quantity_from_price``
+um kaputte Ziffern herum oder scannt den kompletten Frame erneut. Hier werden
+die einzelnen Spans (Text + Box + Konfidenz aus dem OcrResult) mit zu niedriger
+Konfidenz markiert und NUR deren Crops nachträglich erkannt:
+
+1. Spans unter ``min_confidence`` sammeln (schlechteste zuerst, max. ``max_tokens``)
+2. Crop aus der Box (+ Rand) schneiden und hochskalieren
+3. Stufen nacheinander, jede als EIN Batch über alle noch unsicheren Tokens:
+   Glyph-Templates (reine Zahlen-Spans) → EasyOCR-Recognizer in höherer
+   Auflösung → andere Engine (PaddleOCR, falls verfügbar)
+4. Ersetzen, wenn die neue Konfidenz um ``min_gain`` besser ist
+5. Zeitbudget: neue Stufe nur, solange ``budget_ms`` nicht verbraucht ist
+
+Braucht Konfidenz pro Span - EasyOCR mit paragraph=True liefert keine, dort
+bleibt das Ergebnis unverändert.
+"""
+
+import re
+import threading
+import time
+from typing import Callable, List, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+from config import (
+    TOKEN_REOCR_MIN_CONFIDENCE,
+    TOKEN_REOCR_UPSCALE,
+    TOKEN_REOCR_MAX_TOKENS,
+    TOKEN_REOCR_TIME_BUDGET_MS,
+    TOKEN_REOCR_MIN_GAIN,
+    TOKEN_REOCR_PADDING,
+)
+from ocr_result import OcrResult, ENGINES
+
+# stage(crops, numeric_flags) -> [(text, confidence) | None, ...] in Crop-Reihenfolge
+StageFn = Callable[[List[object], List[bool]], List[Optional[Tuple[str, float]]]]
+
+# Preis/Menge/Orders: Ziffern, Trenner und die typischen OCR-Verwechsler
+_NUMERIC_TOKEN_PATTERN = re.compile(r"^[\s0-9OoIlSZB,\.]*[0-9][\s0-9OoIlSZB,\.]*$")
+
+
+def is_numeric_token(text: str) -> bool:
+    return bool(_NUMERIC_TOKEN_PATTERN.match(text or ""))
+
+
+def crop_token(img, box, offset=(0, 0), padding: int = TOKEN_REOCR_PADDING, upscale: float = TOKEN_REOCR_UPSCALE):
+    """Cut ``box`` (x0, y0, x1, y1 in result coordinates) out of ``img`` and upscale it; ``None`` if empty."""
+    dx, dy = offset
+    h, w = img.shape[:2]
+    x0, y0 = max(0, int(box[0]) - dx - padding), max(0, int(box[1]) - dy - padding)
+    x1, y1 = min(w, int(box[2]) - dx + padding), min(h, int(box[3]) - dy + padding)
+    if x1 <= x0 or y1 <= y0:
+        return None
+    crop = img[y0:y1, x0:x1]
+    if upscale and upscale != 1.0:
+        crop = cv2.resize(crop, None, fx=upscale, fy=upscale, interpolation=cv2.INTER_CUBIC)
+    return crop
+
+
+class TokenReOcr:
+    """Re-recognize low-confidence spans of an OcrResult through staged recognizers within a time budget."""
+
+    def __init__(self, stages: Sequence[Tuple[str, StageFn]] = (),
+                 min_confidence: float = TOKEN_REOCR_MIN_CONFIDENCE,
+                 max_tokens: int = TOKEN_REOCR_MAX_TOKENS,
+                 budget_ms: float = TOKEN_REOCR_TIME_BUDGET_MS,
+                 min_gain: float = TOKEN_REOCR_MIN_GAIN,
+                 padding: int = TOKEN_REOCR_PADDING,
+                 upscale: float = TOKEN_REOCR_UPSCALE) -> None:
+        self.stages = list(stages)
+        self.min_confidence = float(min_confidence)
+        self.max_tokens = max(1, int(max_tokens))
+        self.budget_ms = float(budget_ms)
+        self.min_gain = float(min_gain)
+        self.padding = max(0, int(padding))
+        self.upscale = float(upscale)
+        self._lock = threading.Lock()
+        self.frames = 0
+        self.flagged = 0
+        self.refined = 0
+        self.budget_exhausted = 0
+        self.total_ms = 0.0
+        self.stage_improved: dict[str, int] = {}
+        self.last_refined = 0
+
+    def flag(self, result: OcrResult) -> List[int]:
+        """Indices of spans below ``min_confidence`` (lowest first, capped at ``max_tokens``)."""
+        if not len(result) or not result.has_geometry:
+            return []
+        conf = result.confidences
+        low = np.flatnonzero(~np.isnan(conf) & (conf < self.min_confidence))
+        low = low[np.argsort(conf[low], kind="stable")]
+        return [int(i) for i in low[:self.max_tokens]]
+
+    def refine(self, img, result: OcrResult, offset=(0, 0)) -> OcrResult:
+        """Return ``result`` with low-confidence spans replaced by better re-recognitions (new object)."""
+        flagged = self.flag(result)
+        self.last_refined = 0
+        if not flagged or not self.stages:
+            return result
+        start = time.perf_counter()
+
+        crops, numeric, targets = [], [], []
+        for idx in flagged:
+            crop = crop_token(img, result.boxes[idx], offset, self.padding, self.upscale)
+            if crop is not None:
+                crops.append(crop)
+                numeric.append(is_numeric_token(result.texts[idx]))
+                targets.append(idx)
+
+        texts = list(result.texts)
+        confidences = result.confidences.copy()
+        engines = [ENGINES[i] for i in result.engine_ids]
+        improved: dict[str, int] = {}
+        exhausted = False
+        pending = list(range(len(targets)))
+        for name, stage in self.stages:
+            if not pending:
+                break
+            if (time.perf_counter() - start) * 1000 >= self.budget_ms:
+                exhausted = True
+                break
+            try:
+                outputs = stage([crops[p] for p in pending], [numeric[p] for p in pending])
+            except Exception as exc:
+                print(f"⚠️  Token re-OCR stage '{name}' failed: {exc}")
+                continue
+            still_low = []
+            for p, output in zip(pending, outputs):
+                idx = targets[p]
+                if output is not None:
+                    text, conf = output
+                    if text and text.strip() and conf >= confidences[idx] + self.min_gain:
+                        texts[idx] = text
+                        confidences[idx] = conf
+                        engines[idx] = name
+                        improved[name] = improved.get(name, 0) + 1
+                if confidences[idx] < self.min_confidence:
+                    still_low.append(p)
+            pending = still_low
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        refined = sum(improved.values())
+        with self._lock:
+            self.frames += 1
+            self.flagged += len(targets)
+            self.refined += refined
+            self.budget_exhausted += int(exhausted)
+            self.total_ms += elapsed_ms
+            for name, count in improved.items():
+                self.stage_improved[name] = self.stage_improved.get(name, 0) + count
+        self.last_refined = refined
+        if not refined:
+            return result
+        return OcrResult(texts, result.boxes.copy(), confidences, engines)
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {
+                'frames': self.frames,
+                'flagged_tokens': self.flagged,
+                'refined_tokens': self.refined,
+                'refine_rate': (self.refined / self.flagged * 100) if self.flagged else 0.0,
+                'budget_exhausted': self.budget_exhausted,
+                'avg_ms': (self.total_ms / self.frames) if self.frames else 0.0,
+                'stage_improved': dict(self.stage_improved),
+            }
@@ -19,16 +19,23 @@ from config import (
     FOCUS_REQUIRED,
     FOCUS_WINDOW_TITLES,
     USE_ASYNC_PIPELINE,
-    ASYNC_QUEUE_MAXSIZE,
     ASYNC_WORKER_COUNT,
+    OCR_PROCESS_POOL_ENABLED,
     MIN_ITEM_QUANTITY,
     MAX_ITEM_QUANTITY,
+    FRAME_RECORDING_COMPRESSION,
+    CHANGE_GATE_ENABLED,
+    CAPTURE_SUBREGIONS_ENABLED,
+    CAPTURE_SUBREGIONS,
+    WINDOW_CLASSIFIER_ENABLED,
+    WINDOW_CLASSIFIER_SKIP_UNKNOWN,
+    ROW_VOTING_ENABLED,
+    CPU_GOVERNOR_ENABLED,
+    LOG_ROI_LAYOUT_CHANGE_RATIO,
     get_debug_mode,
     set_debug_mode,
 )
 from utils import (
-    capture_region,
-    preprocess,
     log_text,
     detect_window_type,
     detect_tab_from_text,
@@ -38,6 +45,10 @@ from utils import (
     check_price_plausibility,
     correct_item_name,
     is_bdo_window_in_foreground,
+    detect_log_roi,
+    mark_log_roi_stale,
+    invalidate_detection_boxes,
+    set_ocr_process_pool,
     MARKET_SELL_NET_FACTOR,
 )
 from database import (
@@ -60,6 +71,17 @@ from parsing import (
 )
 from bdo_api_client import get_item_price_range_by_name
 from market_json_manager import get_base_price_from_cache
+from capture_backend import CaptureBackend
+from frame_recorder import FrameRecorder
+from change_gate import ChangeGate, ACCEPT_FIRST, ACCEPT_CHANGED
+from scan_scheduler import ScanScheduler
+from frame_slot import LatestFrameSlot
+from ocr_process_pool import OcrProcessPool
+from capture_regions import MultiRegionScanner
+from preprocess_pipeline import PreprocessPipeline
+from window_classifier import WindowClassifier
+from row_voting import RowVoter
+from cpu_governor import CpuGovernor
 
 # -----------------------
 # Performance: Precompiled Regex Patterns
@@ -83,7 +105,7 @@ _HISTORICAL_VALUE_DUP_TOLERANCE_SECONDS = 90  # 1,5 Minuten Puffer für Scroll-D
 # Entscheidungslogik: Fälle erkennen & speichern
 # -----------------------
 class MarketTracker:
-    def __init__(self, region=DEFAULT_REGION, poll_interval=POLL_INTERVAL, debug=None):
+    def __init__(self, region=DEFAULT_REGION, poll_interval=POLL_INTERVAL, debug=None, frame_source=None):
         if debug is None:
             debug = get_debug_mode(True)
         self.debug = bool(debug)
@@ -103,6 +125,8 @@ class MarketTracker:
         self._burst_until = None
         self._burst_fast_scans = 0
         self._request_immediate_rescan = 0
+        # Adaptive cadence: poll_interval/poll_interval_burst are now the scheduler's bounds
+        self.scheduler = ScanScheduler(max_interval=self.poll_interval, min_interval=self.poll_interval_burst)
         self.running = False
         self.lock = threading.Lock()
         self._debug_image_lock = threading.Lock()
@@ -192,15 +216,64 @@ class MarketTracker:
         self._occurrence_runtime_cache = {}
         # Async pipeline controller placeholder
         self._async_controller = None
+        # Gesetzt, solange kein auto_track läuft (close wartet darauf)
+        self._auto_track_idle = threading.Event()
+        self._auto_track_idle.set()
+        # Persistent capture session (one mss grabber per thread + frame ring)
+        self.capture_backend = CaptureBackend()
+        # Optional replay source (callable(region) -> frame) replacing live capture
+        self.frame_source = frame_source
+        self.frame_recorder = None
+        # Pre-OCR change gate: static market window → near-zero-cost no-op scans
+        self.change_gate = ChangeGate() if CHANGE_GATE_ENABLED else None
+        # Optional multi-region capture: named sub-regions with their own scan rate
+        self.region_scanner = MultiRegionScanner.from_config(CAPTURE_SUBREGIONS) if CAPTURE_SUBREGIONS_ENABLED else None
+        self._region_gates = {}
+        # Preprocessing built once per tracker (CLAHE/kernel/LUTs + reused buffers)
+        self.preprocessor = PreprocessPipeline()
+        # Pixel-template window classifier: skips OCR on detail windows (no-op without templates)
+        self.window_classifier = WindowClassifier() if WINDOW_CLASSIFIER_ENABLED else None
+        # Temporal voting: log rows read across scans, only stable consensus rows are processed
+        self.row_voter = RowVoter() if ROW_VOTING_ENABLED else None
+        # CPU mode: thread/priority/affinity caps + duty-cycled scans within a CPU budget
+        self.cpu_governor = CpuGovernor() if CPU_GOVERNOR_ENABLED else None
 
         if self.debug:
             log_debug(f"[INIT] Baseline initialized: {self._baseline_initialized}, Poll interval: {self.poll_interval}s")
 
+    def start_recording(self, path, compression=FRAME_RECORDING_COMPRESSION):
+        """Append every captured frame (with capture timestamp) to a frame recording."""
+        self.stop_recording()
+        self.frame_recorder = FrameRecorder(path, compression=compression)
+        if self.region_scanner is not None:
+            log_debug("[RECORD] Multi-region capture active - only full-window frames are recorded")
+        if self.debug:
+            log_debug(f"[RECORD] Recording frames to {path} (compression={compression})")
+
+    def stop_recording(self):
+        recorder, self.frame_recorder = self.frame_recorder, None
+        if recorder is not None:
+            recorder.close()
+            if self.debug:
+                log_debug(f"[RECORD] Stopped: {recorder.frames_written} frames, {recorder.bytes_written / 1e6:.1f} MB")
+
+    def _capture_from_source(self):
+        frame = self.frame_source(self.region)
+        if frame is None and getattr(self.frame_source, 'exhausted', False):
+            if self.running and self.debug:
+                log_debug("[REPLAY] Frame source exhausted - stopping")
+            self.running = False
+        return frame
+
     def _capture_frame(self):
         """Capture a frame with focus checks and error bookkeeping."""
+        if self.frame_source is not None:
+            return self._capture_from_source()
+
         if FOCUS_REQUIRED:
             is_focused, current_title = is_bdo_window_in_foreground(FOCUS_WINDOW_TITLES)
             if not is_focused:
+                self.scheduler.record_idle('no_focus')
                 if self._last_focus_state is not False:
                     log_debug(f"[FOCUS] Skip scan - foreground window '{current_title or 'unknown'}'")
                 self._last_focus_state = False
@@ -212,8 +285,44 @@ class MarketTracker:
             self._last_focus_state = True
             self._last_foreground_title = current_title or ""
 
+        if self.region_scanner is not None:
+            return self._capture_subregions()
+
+        try:
+            frame = self.capture_backend.grab(self.region)
+            if self.frame_recorder is not None:
+                self.frame_recorder.append(frame, time.time())
+            if self.debug:
+                timing = self.capture_backend.last_timing
+                log_debug(
+                    f"[PERF-CAPTURE] Grab: {timing.get('grab_ms', 0.0):.1f}ms, "
+                    f"Convert: {timing.get('convert_ms', 0.0):.1f}ms"
+                )
+            return frame
+        except Exception as exc:
+            print("Fehler beim Screenshot:", exc)
+            self.error_count += 1
+            self.last_error_time = datetime.datetime.now()
+            self.last_error_message = f"Screenshot error: {exc}"
+            log_debug(f"[ERROR] Screenshot failed: {exc}")
+            time.sleep(0.05)
+            return None
+
+    def _capture_subregions(self):
+        """Grab only the sub-regions that are due; returns {name: frame} or None."""
+        burst = bool(self.scheduler.last_decision.get('burst'))
+        if self._request_immediate_rescan > 0:
+            due = list(self.region_scanner.regions)
+        else:
+            due = self.region_scanner.due(burst=burst)
+        if not due:
+            return None
         try:
-            return capture_region(self.region)
+            frames = {}
+            for region in due:
+                # Innere Kanten auf Zeilenlücken schneiden (keine halben Log-Zeilen)
+                box, edges = region.capture_box(self.region)
+                frames[region.name] = region.crop_to_rows(self.capture_backend.grab(box), edges)
         except Exception as exc:
             print("Fehler beim Screenshot:", exc)
             self.error_count += 1
@@ -222,23 +331,133 @@ class MarketTracker:
             log_debug(f"[ERROR] Screenshot failed: {exc}")
             time.sleep(0.05)
             return None
+        self.region_scanner.mark_captured(frames)
+        if self.debug:
+            log_debug(f"[PERF-CAPTURE] Regions: {', '.join(frames)} (burst={burst})")
+        return frames
+
+    def _process_region_frames(self, frames, context='sync', allow_debug=True):
+        """OCR the captured sub-regions and feed the merged text of all regions to the parser."""
+        perf_prefix = f"[PERF-{context.upper()}]"
+        total_start = time.perf_counter()
+        try:
+            recognized = []
+            for name, frame in frames.items():
+                region = self.region_scanner.get(name)
+                if self.change_gate is not None:
+                    gate = self._region_gates.get(name)
+                    if gate is None:
+                        gate = self._region_gates[name] = ChangeGate()
+                    run_ocr, _reason = gate.evaluate(frame)
+                    if not run_ocr:
+                        continue
+                proc = self.preprocessor.run(frame, adaptive=region.adaptive, denoise=False, fast_mode=False)
+                if allow_debug and self.debug:
+                    self._write_debug_images(frame, proc, context)
+                text, _was_cached, _stats = ocr_image_cached(
+                    frame,
+                    method='auto',
+                    use_roi=False,  # Region ist bereits der relevante Ausschnitt
+                    preprocessed=proc,
+                    fast_mode=region.fast_mode,
+                )
+                self.region_scanner.update_text(name, text)
+                recognized.append(name)
+
+            if not recognized:
+                gate_time = time.perf_counter() - total_start
+                self.scheduler.record_scan(gate_time, ocr_ran=False)
+                if self.debug:
+                    log_debug(f"{perf_prefix} Gate skip (regions {', '.join(frames)}): {gate_time * 1000:.1f}ms")
+                return None
+
+            text = self.region_scanner.merged_text()
+            log_text(text)
+            self.process_ocr_text(text)
+            total_time = time.perf_counter() - total_start
+            self.scheduler.record_scan(total_time, ocr_ran=True, window_type=self.current_window)
+            if self.debug:
+                log_debug(f"{perf_prefix} Regions OCR: {', '.join(recognized)}, Total scan: {total_time * 1000:.1f}ms")
+
+            if self.error_count > 0:
+                self.error_count = max(0, self.error_count - 1)
+            return text
+        except Exception as exc:
+            for gate in self._region_gates.values():
+                gate.invalidate()
+            if self.debug:
+                log_debug(f"[ERROR-{context.upper()}] {exc}")
+            self.error_count += 1
+            self.last_error_time = datetime.datetime.now()
+            self.last_error_message = f"Processing error: {exc}"
+            return None
 
     def _process_image(self, img, context='sync', allow_debug=True):
         """Run preprocessing, OCR, and downstream processing for a captured image."""
         if img is None:
             return None
+        if isinstance(img, dict):
+            return self._process_region_frames(img, context, allow_debug)
 
         perf_prefix = f"[PERF-{context.upper()}]"
         total_start = time.perf_counter()
 
         try:
+            if self.window_classifier is not None:
+                classify_start = time.perf_counter()
+                wtype, score = self.window_classifier.classify(img)
+                if wtype is not None:
+                    self._apply_classified_window(wtype)
+                    skip = wtype in ("sell_item", "buy_item") or (
+                        wtype == "unknown" and WINDOW_CLASSIFIER_SKIP_UNKNOWN
+                    )
+                    if skip:
+                        classify_time = time.perf_counter() - classify_start
+                        self.scheduler.record_scan(classify_time, ocr_ran=False, window_type=wtype)
+                        if self.debug:
+                            log_debug(
+                                f"{perf_prefix} Window skip ({wtype}, score={score:.2f}): "
+                                f"{classify_time * 1000:.1f}ms"
+                            )
+                        return None
+
+            if self.change_gate is not None:
+                gate_start = time.perf_counter()
+                roi = detect_log_roi(img, kind='raw')
+                gate_img = img
+                if roi:
+                    x, y, w, h = roi
+                    gate_img = img[y:y+h, x:x+w]
+                run_ocr, reason = self.change_gate.evaluate(gate_img)
+                if reason == ACCEPT_FIRST:
+                    # Neue Gate-Referenz (Start, Fehler, Regionswechsel) → EasyOCR-Boxen neu detektieren
+                    invalidate_detection_boxes()
+                if reason == ACCEPT_FIRST or (
+                        reason == ACCEPT_CHANGED
+                        and self.change_gate.last_changed_ratio >= LOG_ROI_LAYOUT_CHANGE_RATIO):
+                    # Layout-Wechsel (Zeilen verschoben, Tab gewechselt) → ROI nicht erst nach N Scans prüfen
+                    mark_log_roi_stale()
+                if not run_ocr:
+                    gate_time = (time.perf_counter() - gate_start) * 1000
+                    self.scheduler.record_scan(gate_time / 1000, ocr_ran=False)
+                    if self.debug:
+                        log_debug(
+                            f"{perf_prefix} Gate skip ({reason}, changed={self.change_gate.last_changed_ratio:.4f}): "
+                            f"{gate_time:.1f}ms"
+                        )
+                    return None
+
             preprocess_start = time.perf_counter()
             # BALANCED PREPROCESSING: Use adaptive CLAHE but skip denoise
             # Fast mode was too aggressive and hurt OCR quality
-            proc = preprocess(img, adaptive=True, denoise=False, fast_mode=False)
+            proc = self.preprocessor.run(img, adaptive=True, denoise=False, fast_mode=False)
             preprocess_time = (time.perf_counter() - preprocess_start) * 1000
             if self.debug:
-                log_debug(f"{perf_prefix} Preprocess: {preprocess_time:.1f}ms (balanced mode)")
+                steps = ", ".join(
+                    f"{key[:-3]}={value:.1f}" for key, value in self.preprocessor.last_timing.items()
+                    if key != 'total_ms'
+                )
+                log_debug(f"{perf_prefix} Preprocess: {preprocess_time:.1f}ms (balanced mode; {steps})")
 
             if allow_debug and self.debug:
                 self._write_debug_images(img, proc, context)
@@ -252,6 +471,7 @@ class MarketTracker:
                 use_roi=True,
                 preprocessed=proc,
                 fast_mode=True,  # Still use fast mode for speed
+                window_type=self.current_window,  # UI-Label-Maske des aktuellen Fensters
             )
             ocr_time = (time.perf_counter() - ocr_start) * 1000
             if self.debug:
@@ -269,6 +489,7 @@ class MarketTracker:
             self.process_ocr_text(text)
             process_time = (time.perf_counter() - process_start) * 1000
             total_time = (time.perf_counter() - total_start) * 1000
+            self.scheduler.record_scan(total_time / 1000, ocr_ran=True, window_type=self.current_window)
 
             if self.debug:
                 log_debug(f"{perf_prefix} Process: {process_time:.1f}ms, Total scan: {total_time:.1f}ms")
@@ -278,6 +499,9 @@ class MarketTracker:
 
             return text
         except Exception as exc:
+            if self.change_gate is not None:
+                # Retry OCR on the next frame even if it is unchanged
+                self.change_gate.invalidate()
             if self.debug:
                 log_debug(f"[ERROR-{context.upper()}] {exc}")
             self.error_count += 1
@@ -292,23 +516,39 @@ class MarketTracker:
 
         with self._debug_image_lock:
             try:
-                Image.fromarray(cv2.cvtColor(original_bgr, cv2.COLOR_BGR2RGB)).save(latest_orig)
+                if original_bgr.ndim == 2:
+                    Image.fromarray(original_bgr).save(latest_orig)
+                else:
+                    Image.fromarray(cv2.cvtColor(original_bgr, cv2.COLOR_BGR2RGB)).save(latest_orig)
                 Image.fromarray(processed_img).save(latest_proc)
             except Exception as save_err:
                 log_debug(f"[DEBUG] Failed to write debug images: {save_err}")
 
     def _get_next_sleep_interval(self):
+        """Next scan delay from the adaptive ScanScheduler; burst state acts as a hint."""
         now = datetime.datetime.now()
-        if self._burst_until and now < self._burst_until:
-            sleep_iv = 0.08 if self._burst_fast_scans > 0 else self.poll_interval_burst
-        else:
-            sleep_iv = self.poll_interval
-            if self._burst_until and now >= self._burst_until:
-                self._burst_until = None
-                if self.debug:
-                    log_debug("burst scan window expired")
-        if sleep_iv <= 0.08 and self._burst_fast_scans > 0:
+        burst = bool(self._burst_until and now < self._burst_until)
+        if self._burst_until and now >= self._burst_until:
+            self._burst_until = None
+            if self.debug:
+                log_debug("burst scan window expired")
+        if burst and self._burst_fast_scans > 0:
             self._burst_fast_scans -= 1
+        sleep_iv = self.scheduler.next_interval(burst_hint=burst)
+        if self.debug:
+            decision = self.scheduler.last_decision
+            log_debug(
+                f"[SCHED] next={sleep_iv * 1000:.0f}ms reason={decision.get('reason')} "
+                f"ocr_p50={decision.get('ocr_p50_ms', 0.0):.0f}ms change_rate={decision.get('change_rate', 0.0):.2f} "
+                f"window={decision.get('window')}"
+            )
+        if self.cpu_governor is not None:
+            sleep_iv = self.cpu_governor.throttle(sleep_iv)
+            if self.debug and self.cpu_governor.last_delay > 0:
+                log_debug(
+                    f"[GOVERNOR] cpu={self.cpu_governor.utilization * 100:.0f}% "
+                    f"budget={self.cpu_governor.budget * 100:.0f}% +{self.cpu_governor.last_delay * 1000:.0f}ms"
+                )
         return sleep_iv
 
     def _get_base_price(self, item_name: str) -> int | None:
@@ -1228,6 +1468,48 @@ class MarketTracker:
                 print("DB Error beim Speichern:", e)
                 return False
 
+    def _arm_item_window_burst(self, wtype, now):
+        # Wenn Detail-Fenster aktiv ist, aktiviere einen kurzen Burst-Scan, um das Zurückspringen
+        # ins Overview-Fenster mit hoher Wahrscheinlichkeit zu erwischen.
+        self._burst_until = now + datetime.timedelta(seconds=4.0)
+        # schedule multiple immediate fast scans
+        self._burst_fast_scans = max(self._burst_fast_scans, 5)
+        # also request immediate re-scans from single_scan (no wait)
+        self._request_immediate_rescan = max(self._request_immediate_rescan, 2)
+        if self.debug:
+            log_debug(f"burst scan enabled until {self._burst_until} (+{self._burst_fast_scans} fast scans) due to item window '{wtype}'")
+
+    def _arm_overview_return_burst(self, prev_window, wtype, now):
+        # AGGRESSIVE: More scans, longer burst window
+        self._burst_fast_scans = max(self._burst_fast_scans, 15)  # Was 8, now 15 (1.2s of fast scans)
+        self._burst_until = max(self._burst_until or now, now + datetime.timedelta(seconds=3.0))  # Was 4.5s, now 3s
+        # Immediate re-scans (no sleep between scans)
+        self._request_immediate_rescan = max(self._request_immediate_rescan, 5)  # Was 3, now 5
+        if self.debug:
+            log_debug(f"[BURST-AGGRESSIVE] Returned from {prev_window} to {wtype} -> {self._burst_fast_scans} fast scans + {self._request_immediate_rescan} immediate rescans (TARGET: <1s capture)")
+
+    def _apply_classified_window(self, wtype):
+        """Update window state/burst logic from the pixel classifier (before any OCR)."""
+        if wtype not in ("sell_overview", "buy_overview", "sell_item", "buy_item"):
+            # Kein sicheres Ergebnis → Zustand der OCR-Erkennung überlassen
+            return
+        now = datetime.datetime.now()
+        prev_window = self.current_window
+        self.current_window = wtype
+        self.window_history.append((now, wtype))
+        if len(self.window_history) > 5:
+            self.window_history = self.window_history[-5:]
+        if prev_window != wtype:
+            invalidate_detection_boxes()
+            if self.debug:
+                log_debug(f"[WINDOW] Transition (pixel): {prev_window} → {wtype}")
+        if wtype in ("buy_item", "sell_item"):
+            self._arm_item_window_burst(wtype, now)
+        elif wtype in ("sell_overview", "buy_overview"):
+            self.last_overview = wtype
+            if prev_window in ("buy_item", "sell_item"):
+                self._arm_overview_return_burst(prev_window, wtype, now)
+
     def process_ocr_text(self, full_text):
         """
         Hauptfunktion:
@@ -1268,13 +1550,7 @@ class MarketTracker:
             # Wenn Detail-Fenster aktiv ist, aktiviere einen kurzen Burst-Scan, um das Zurückspringen
             # ins Overview-Fenster mit hoher Wahrscheinlichkeit zu erwischen.
             if wtype in ("buy_item", "sell_item"):
-                self._burst_until = now + datetime.timedelta(seconds=4.0)
-                # schedule multiple immediate fast scans
-                self._burst_fast_scans = max(self._burst_fast_scans, 5)
-                # also request immediate re-scans from single_scan (no wait)
-                self._request_immediate_rescan = max(self._request_immediate_rescan, 2)
-                if self.debug:
-                    log_debug(f"burst scan enabled until {self._burst_until} (+{self._burst_fast_scans} fast scans) due to item window '{wtype}'")
+                self._arm_item_window_burst(wtype, now)
             return
 
         # detect current tab from the whole OCR snapshot (nur zur Diagnose); Entscheidung über Seite strikt aus Window-Type
@@ -1299,13 +1575,15 @@ class MarketTracker:
         # Old approach: wait 1-3 seconds with slow scans = missed transactions
         # New approach: IMMEDIATE burst of 10-15 fast scans at 80ms intervals = capture within 1-2s
         if prev_window in ("buy_item", "sell_item") and wtype in ("sell_overview", "buy_overview"):
-            # AGGRESSIVE: More scans, longer burst window
-            self._burst_fast_scans = max(self._burst_fast_scans, 15)  # Was 8, now 15 (1.2s of fast scans)
-            self._burst_until = max(self._burst_until or now, now + datetime.timedelta(seconds=3.0))  # Was 4.5s, now 3s
-            # Immediate re-scans (no sleep between scans)
-            self._request_immediate_rescan = max(self._request_immediate_rescan, 5)  # Was 3, now 5
-            if self.debug:
-                log_debug(f"[BURST-AGGRESSIVE] Returned from {prev_window} to {wtype} -> {self._burst_fast_scans} fast scans + {self._request_immediate_rescan} immediate rescans (TARGET: <1s capture)")
+            self._arm_overview_return_burst(prev_window, wtype, now)
+
+        if self.row_voter is not None:
+            # Zeilen über mehrere Scans abstimmen: Mehrheitstext, neue Zeilen erst wenn stabil
+            entries = self.row_voter.update(entries, context=wtype)
+            if not entries:
+                if self.debug:
+                    log_debug("row voting: no stable rows yet; skipping")
+                return
 
         # build structured entries
         structured = []
@@ -3605,45 +3883,53 @@ class MarketTracker:
             self._request_immediate_rescan -= 1
 
     def auto_track(self):
+        if self.cpu_governor is not None and not self.cpu_governor.applied:
+            self.cpu_governor.apply()
         if USE_ASYNC_PIPELINE:
             if self.running:
                 print("Auto-Tracking läuft bereits.")
                 return
             self.running = True
+            self._auto_track_idle.clear()
             print("▶ Auto-Tracking gestartet (async pipeline) ...")
             controller = AsyncPipelineController(
                 tracker=self,
-                queue_size=ASYNC_QUEUE_MAXSIZE,
                 worker_count=ASYNC_WORKER_COUNT,
             )
             self._async_controller = controller
             try:
+                # run() kehrt erst zurück, wenn Capture- und Worker-Threads beendet sind
                 controller.run()
             except Exception as exc:
                 print("Fehler beim Auto-Scan:", exc)
             finally:
                 self._async_controller = None
                 self.running = False
+                self._auto_track_idle.set()
                 print("⏹ Auto-Tracking gestoppt.")
             return
 
         self.running = True
+        self._auto_track_idle.clear()
         print("▶ Auto-Tracking gestartet ...")
-        while self.running:
-            try:
-                self.single_scan()
-            except Exception as e:
-                print("Fehler beim Auto-Scan:", e)
-            sleep_iv = self._get_next_sleep_interval()
-
-            # Interruptible sleep: Sleep in small chunks and check self.running
-            # This allows quick response to stop() even with longer sleep intervals
-            elapsed = 0.0
-            sleep_chunk = 0.1  # Check every 100ms
-            while elapsed < sleep_iv and self.running:
-                chunk = min(sleep_chunk, sleep_iv - elapsed)
-                time.sleep(chunk)
-                elapsed += chunk
+        try:
+            while self.running:
+                try:
+                    self.single_scan()
+                except Exception as e:
+                    print("Fehler beim Auto-Scan:", e)
+                sleep_iv = self._get_next_sleep_interval()
+
+                # Interruptible sleep: Sleep in small chunks and check self.running
+                # This allows quick response to stop() even with longer sleep intervals
+                elapsed = 0.0
+                sleep_chunk = 0.1  # Check every 100ms
+                while elapsed < sleep_iv and self.running:
+                    chunk = min(sleep_chunk, sleep_iv - elapsed)
+                    time.sleep(chunk)
+                    elapsed += chunk
+        finally:
+            self._auto_track_idle.set()
         print("⏹ Auto-Tracking gestoppt.")
 
     def stop(self):
@@ -3651,6 +3937,16 @@ class MarketTracker:
         if self._async_controller:
             self._async_controller.request_stop()
 
+    def close(self, timeout: float = 5.0):
+        """Stop tracking, wait for the capture/OCR threads and release the persistent capture session."""
+        self.stop()
+        self.stop_recording()
+        # Grabber/Ring erst schließen, wenn kein Thread mehr mitten in grab() steckt
+        if not self._auto_track_idle.wait(timeout):
+            print(f"⚠️  Auto-Tracking did not stop within {timeout:.0f}s - capture session left open")
+            return
+        self.capture_backend.close()
+
     # Optional: Ausgabe der Fenster-Historie (Debug)
     def print_window_history(self):
         print("Letzte Fenster:")
@@ -3661,26 +3957,61 @@ class MarketTracker:
 class AsyncPipelineController:
     """Manage the asynchronous capture → OCR pipeline."""
 
-    def __init__(self, tracker: MarketTracker, queue_size: int = 3, worker_count: int = 1) -> None:
+    # Worker wartet in Scheibchen auf Frames, damit Stop schnell greift
+    TAKE_TIMEOUT = 0.1
+
+    def __init__(self, tracker: MarketTracker, worker_count: int = 1) -> None:
         self.tracker = tracker
-        self.queue_size = max(1, int(queue_size))
         self.worker_count = max(1, int(worker_count))
-        self.queue: asyncio.Queue | None = None
+        # Frames liegen im Capture-Ring → ab publish bis nach der OCR vor Überschreiben schützen
+        self.slot = LatestFrameSlot(lease=self._lease_frame, release=self._release_frame)
         self.executor = ThreadPoolExecutor(max_workers=self.worker_count + 1)
         self.loop: asyncio.AbstractEventLoop | None = None
         self._capture_task: asyncio.Task | None = None
         self._worker_tasks: list[asyncio.Task] = []
         self._stop_requested = False
-        self._sentinel_inserted = False
+        self.ocr_pool: OcrProcessPool | None = None
+
+    def _lease_frame(self, image) -> None:
+        for frame in (image.values() if isinstance(image, dict) else (image,)):
+            self.tracker.capture_backend.lease(frame)
+
+    def _release_frame(self, image) -> None:
+        for frame in (image.values() if isinstance(image, dict) else (image,)):
+            self.tracker.capture_backend.release(frame)
 
     def run(self) -> None:
+        self._start_ocr_pool()
         try:
             asyncio.run(self._run())
         finally:
+            self.slot.close()
             self.executor.shutdown(wait=True)
+            self._stop_ocr_pool()
+
+    def _start_ocr_pool(self) -> None:
+        if not OCR_PROCESS_POOL_ENABLED:
+            return
+        try:
+            self.ocr_pool = OcrProcessPool()
+        except Exception as exc:
+            # Kein Pool (z.B. Shared Memory nicht verfügbar) → OCR wie bisher im Worker-Thread
+            log_debug(f"[ASYNC] OCR process pool unavailable: {exc}")
+            self.ocr_pool = None
+            return
+        set_ocr_process_pool(self.ocr_pool)
+        log_debug(f"[ASYNC] OCR process pool started ({self.ocr_pool.worker_count} workers)")
+
+    def _stop_ocr_pool(self) -> None:
+        if self.ocr_pool is None:
+            return
+        set_ocr_process_pool(None)
+        self.ocr_pool.close()
+        self.ocr_pool = None
 
     def request_stop(self) -> None:
         self._stop_requested = True
+        self.slot.close()
         if self.loop:
             self.loop.call_soon_threadsafe(self._initiate_stop)
 
@@ -3688,9 +4019,16 @@ class AsyncPipelineController:
         if self._capture_task and not self._capture_task.done():
             self._capture_task.cancel()
 
+    def get_stats(self) -> dict:
+        """Frame slot counters (superseded frames, frame age at OCR start) + OCR pool stats."""
+        stats = self.slot.get_stats()
+        pool = self.ocr_pool
+        if pool is not None:
+            stats['ocr_pool'] = pool.get_stats()
+        return stats
+
     async def _run(self) -> None:
         self.loop = asyncio.get_running_loop()
-        self.queue = asyncio.Queue(maxsize=self.queue_size)
 
         self._capture_task = asyncio.create_task(self._capture_loop(), name="mt-capture")
         self._worker_tasks = [
@@ -3704,12 +4042,8 @@ class AsyncPipelineController:
             pass
         finally:
             self._stop_requested = True
-            if self.queue and not self._sentinel_inserted:
-                for _ in range(self.worker_count):
-                    await self.queue.put(None)
-                self._sentinel_inserted = True
-            if self.queue:
-                await self.queue.join()
+            # Wartende Worker aufwecken; ein laufender OCR-Scan darf noch fertig werden
+            self.slot.close()
             await asyncio.gather(*self._worker_tasks, return_exceptions=True)
 
     async def _capture_loop(self) -> None:
@@ -3720,35 +4054,14 @@ class AsyncPipelineController:
                 if frame is None:
                     if self._stop_requested or not self.tracker.running:
                         break
-                    await asyncio.sleep(0.05)
+                    # Kein Fokus / kein Frame → Closed-Backoff des Schedulers
+                    await self._interruptible_sleep(self.tracker._get_next_sleep_interval())
                     continue
 
-                payload = {
-                    'image': frame,
-                    'captured_at': time.perf_counter(),
-                }
-
-                if self.queue is None:
-                    break
-
-                # CRITICAL FIX: Drop old frames if queue is full
-                # We ONLY care about the LATEST state, old frames are USELESS
-                # This prevents 10+ second latency when OCR is slow
-                try:
-                    # Try to put with no wait - if queue full, drop oldest and retry
-                    if self.queue.full():
-                        try:
-                            # Drop oldest frame (FIFO - get without blocking)
-                            old_frame = self.queue.get_nowait()
-                            self.queue.task_done()  # Mark old frame as done
-                            if self.tracker.debug:
-                                log_debug("[ASYNC] Dropped stale frame (queue full)")
-                        except asyncio.QueueEmpty:
-                            pass  # Race condition - queue emptied between check and get
-                    
-                    await self.queue.put(payload)
-                except asyncio.CancelledError:
-                    raise
+                # Latest-value slot: overwrite instead of queueing.
+                # Old frames are USELESS - a frame the workers never picked up is
+                # superseded here, so OCR always starts on the newest state.
+                self.slot.publish(frame, captured_at=time.perf_counter())
 
                 if self._stop_requested or not self.tracker.running:
                     break
@@ -3764,36 +4077,39 @@ class AsyncPipelineController:
 
     async def _worker_loop(self, worker_id: int) -> None:
         loop = asyncio.get_running_loop()
-        if self.queue is None:
-            return
 
         while True:
-            item = await self.queue.get()
-            if item is None:
-                self.queue.task_done()
-                break
+            ticket = await loop.run_in_executor(self.executor, self.slot.take, self.TAKE_TIMEOUT)
+            if ticket is None:
+                if self.slot.closed or self._stop_requested:
+                    break
+                continue
 
             if not self.tracker.running and self._stop_requested:
-                self.queue.task_done()
-                continue
+                self._release_frame(ticket.image)
+                break
 
+            # Lease wurde im Slot (publish) genommen und mit take übergeben
             try:
+                if self.tracker.debug:
+                    log_debug(
+                        f"[PERF-ASYNC] Frame #{ticket.seq} age at OCR start: {ticket.age_ms:.1f}ms "
+                        f"(superseded total: {self.slot.superseded})"
+                    )
                 await loop.run_in_executor(
                     self.executor,
                     self.tracker._process_image,
-                    item['image'],
+                    ticket.image,
                     'async',
                     self.tracker.debug,
                 )
                 if self.tracker.debug:
-                    captured_at = item.get('captured_at')
-                    if captured_at is not None:
-                        latency_ms = (time.perf_counter() - captured_at) * 1000
-                        log_debug(f"[PERF-ASYNC] Queue latency: {latency_ms:.1f}ms")
+                    latency_ms = (time.perf_counter() - ticket.captured_at) * 1000
+                    log_debug(f"[PERF-ASYNC] Capture→done latency: {latency_ms:.1f}ms")
             except Exception as exc:
                 log_debug(f"[ASYNC] Worker {worker_id} error: {exc}")
             finally:
-                self.queue.task_done()
+                self._release_frame(ticket.image)
 
     async def _interruptible_sleep(self, duration: float) -> None:
         if duration <= 0:
@@ -0,0 +1,167 @@
+"""
+Window Classifier - Fenster-Typ per Pixel-Templates VOR der OCR
+
+``detect_window_type`` braucht einen kompletten OCR-Durchlauf. Detail-Fenster
+(sell_item/buy_item) und ein geschlossener Markt werden danach in
+``process_ocr_text`` aber nur verworfen - die OCR war umsonst.
+
+Hier wird der Fenster-Typ aus festen UI-Landmarken erkannt (Header-Texte,
+Buttons), per ``cv2.matchTemplate`` (TM_CCOEFF_NORMED) auf einem verkleinerten
+Graustufen-Frame. Jede Landmarke hat einen relativen Suchbereich, damit nur
+ein kleiner Ausschnitt durchsucht wird (wenige ms pro Frame).
+
+Templates liegen in WINDOW_TEMPLATE_DIR, beschrieben durch ``templates.json``:
+
+    [{"window": "sell_item", "file": "sell_item_set_price.png", "box": [0.0, 0.0, 0.5, 0.3]}]
+
+Erfasst werden sie mit ``scripts/utils/capture_window_templates.py``. Ohne
+Templates ist der Classifier inaktiv (``classify`` → None) und die OCR
+entscheidet wie bisher.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+import cv2
+import numpy as np
+
+from config import (
+    WINDOW_TEMPLATE_DIR,
+    WINDOW_CLASSIFIER_SCALE,
+    WINDOW_CLASSIFIER_THRESHOLD,
+    WINDOW_CLASSIFIER_SEARCH_MARGIN,
+)
+
+WINDOW_TYPES = ("sell_overview", "buy_overview", "sell_item", "buy_item")
+MANIFEST_NAME = "templates.json"
+
+
+class WindowClassifier:
+    """Classify the market window type from UI landmark templates."""
+
+    def __init__(self, template_dir: Optional[str] = WINDOW_TEMPLATE_DIR,
+                 scale: float = WINDOW_CLASSIFIER_SCALE,
+                 threshold: float = WINDOW_CLASSIFIER_THRESHOLD,
+                 search_margin: float = WINDOW_CLASSIFIER_SEARCH_MARGIN) -> None:
+        self.scale = min(1.0, max(0.05, float(scale)))
+        self.threshold = float(threshold)
+        self.search_margin = max(0.0, float(search_margin))
+        self.template_dir = template_dir
+        # [(window_type, name, scaled_template, (x0, y0, x1, y1) relative search box)]
+        self._templates: list = []
+        self._lock = threading.Lock()
+        self._timings: deque = deque(maxlen=120)
+        self.counts: dict[str, int] = {}
+        self.last_scores: dict[str, float] = {}
+        self._loaded = False
+
+    # -----------------------
+    # Templates
+    # -----------------------
+    def _ensure_loaded(self) -> None:
+        # Lazy: Templates erst beim ersten Frame laden (Tracker-Init ohne Datei-I/O)
+        if not self._loaded:
+            self._loaded = True
+            if self.template_dir:
+                self.load(self.template_dir)
+
+    def load(self, template_dir: str) -> int:
+        """Load templates listed in ``templates.json``; returns the number loaded."""
+        manifest = os.path.join(template_dir, MANIFEST_NAME)
+        if not os.path.exists(manifest):
+            return 0
+        with open(manifest, "r", encoding="utf-8") as fh:
+            entries = json.load(fh)
+        loaded = 0
+        for entry in entries:
+            path = os.path.join(template_dir, entry["file"])
+            template = cv2.imread(path, cv2.IMREAD_GRAYSCALE)
+            if template is None:
+                continue
+            self.add_template(entry["window"], template, entry.get("box"), name=entry["file"])
+            loaded += 1
+        return loaded
+
+    def add_template(self, window_type: str, template, box=None, name: Optional[str] = None) -> None:
+        """Register a full-resolution grayscale landmark with its relative search box."""
+        if window_type not in WINDOW_TYPES:
+            raise ValueError(f"unknown window type: {window_type}")
+        if template.ndim == 3:
+            template = cv2.cvtColor(template, cv2.COLOR_BGR2GRAY)
+        scaled = self._downscale(template)
+        box = tuple(float(v) for v in (box or (0.0, 0.0, 1.0, 1.0)))
+        with self._lock:
+            self._loaded = True
+            self._templates.append((window_type, name or window_type, scaled, box))
+
+    @property
+    def available(self) -> bool:
+        self._ensure_loaded()
+        return bool(self._templates)
+
+    def _downscale(self, gray):
+        if self.scale >= 1.0:
+            return gray
+        h, w = gray.shape[:2]
+        size = (max(1, int(round(w * self.scale))), max(1, int(round(h * self.scale))))
+        return cv2.resize(gray, size, interpolation=cv2.INTER_AREA)
+
+    # -----------------------
+    # Classification
+    # -----------------------
+    def _search_area(self, small, box):
+        h, w = small.shape[:2]
+        x0, y0, x1, y1 = box
+        m = self.search_margin
+        ax0, ay0 = int(max(0.0, x0 - m) * w), int(max(0.0, y0 - m) * h)
+        ax1, ay1 = int(np.ceil(min(1.0, x1 + m) * w)), int(np.ceil(min(1.0, y1 + m) * h))
+        return small[ay0:ay1, ax0:ax1]
+
+    def classify(self, img) -> tuple[Optional[str], float]:
+        """Return (window_type | 'unknown', score), or (None, 0.0) without templates."""
+        if not self.available:
+            return None, 0.0
+        start = time.perf_counter()
+        gray = img
+        if img.ndim == 3:
+            gray = cv2.cvtColor(img, cv2.COLOR_BGRA2GRAY if img.shape[2] == 4 else cv2.COLOR_BGR2GRAY)
+        small = self._downscale(gray)
+
+        # Score je Fenster-Typ = schwächste Landmarke (alle müssen passen)
+        scores: dict[str, float] = {}
+        with self._lock:
+            templates = list(self._templates)
+        for window_type, _name, template, box in templates:
+            area = self._search_area(small, box)
+            th, tw = template.shape[:2]
+            if area.shape[0] < th or area.shape[1] < tw:
+                score = 0.0
+            else:
+                result = cv2.matchTemplate(area, template, cv2.TM_CCOEFF_NORMED)
+                score = float(result.max())
+                if not np.isfinite(score):
+                    score = 0.0
+            scores[window_type] = min(scores.get(window_type, 1.0), score)
+
+        best_type, best_score = max(scores.items(), key=lambda kv: kv[1])
+        if best_score < self.threshold:
+            best_type = "unknown"
+
+        self._timings.append((time.perf_counter() - start) * 1000)
+        self.last_scores = scores
+        self.counts[best_type] = self.counts.get(best_type, 0) + 1
+        return best_type, best_score
+
+    def get_stats(self) -> dict:
+        timings = list(self._timings)
+        return {
+            'templates': len(self._templates),
+            'counts': dict(self.counts),
+            'avg_ms': (sum(timings) / len(timings)) if timings else 0.0,
+            'max_ms': max(timings) if timings else 0.0,
+            'last_scores': dict(self.last_scores),
+        }